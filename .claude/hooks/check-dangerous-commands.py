@@ -5,7 +5,10 @@ import json
 import re
 import sys
 
-data = json.load(sys.stdin)
-cmd = data.get("tool_input", {}).get("command", "").lower()
-dangerous = any(re.search(p, cmd) for p in [r"rm\s+-rf\s+/", r"sudo"])
+DANGEROUS = re.compile(r"rm\s+-rf\s+/|sudo", re.IGNORECASE)
+
+cmd = json.load(sys.stdin).get("tool_input", {}).get("command", "")
+# Cheap substring prefilter: most commands contain neither token.
+lowered = cmd.lower()
+dangerous = ("sudo" in lowered or "rm" in lowered) and DANGEROUS.search(cmd) is not None
 sys.exit(2 if dangerous else 0)
@@ -2,15 +2,63 @@
 """Ensure Python commands are run via 'uv run'."""
 
 import json
-import re
+import shlex
 import sys
 
-data = json.load(sys.stdin)
-cmd = data.get("tool_input", {}).get("command", "").strip()
-has_python = re.search(r"(?<![a-z])(?:python3?|pytest)\s", cmd)
-starts_with_uv = cmd.startswith("uv run")
+PYTHON_COMMANDS = frozenset({"python", "python3", "pytest"})
+# Shells whose "-c" argument is itself a command line to check.
+SHELLS = frozenset({"sh", "bash", "zsh"})
+# Words after which the next word is still in command position.
+COMMAND_PREFIXES = frozenset({"env", "exec", "nohup", "time"})
+# Characters that end one command and start the next: ";", "&&", "||", "|",
+# "&", subshell and "$(" parentheses, backticks and newlines.
+COMMAND_SEPARATORS = "();&|`\n"
 
-if has_python and not starts_with_uv:
+
+def runs_python(command: str) -> bool:
+    """Return True if any command in *command* invokes python or pytest.
+
+    Only words in command position are checked -- the first word and the
+    first word after a separator, skipping ``VAR=value`` assignments -- so
+    arguments such as ``grep pytest`` or ``uv run pytest`` pass.  Full paths
+    match on their executable name, and the ``-c`` argument of a shell is
+    checked as a command line of its own.
+    """
+    lexer = shlex.shlex(command, posix=True, punctuation_chars=COMMAND_SEPARATORS)
+    lexer.whitespace = " \t\r"
+    lexer.whitespace_split = True
+    try:
+        tokens = list(lexer)
+    except ValueError:
+        # Unbalanced quotes: fall back to plain whitespace splitting.
+        tokens = command.split()
+
+    at_command = True
+    for idx, token in enumerate(tokens):
+        if token and all(char in COMMAND_SEPARATORS for char in token):
+            at_command = True
+            continue
+        if not at_command:
+            continue
+        if "=" in token and token.partition("=")[0].isidentifier():
+            continue
+        name = token.rsplit("/", 1)[-1]
+        if name in PYTHON_COMMANDS:
+            return True
+        shell_command = (
+            tokens[idx + 2]
+            if name in SHELLS and idx + 2 < len(tokens) and tokens[idx + 1] == "-c"
+            else None
+        )
+        if shell_command is not None and runs_python(shell_command):
+            return True
+        at_command = name in COMMAND_PREFIXES
+    return False
+
+
+cmd = json.load(sys.stdin).get("tool_input", {}).get("command", "").strip()
+
+if runs_python(cmd):
     print(
         json.dumps(
             {
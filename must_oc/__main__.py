@@ -2,16 +2,47 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import sys
+from collections.abc import Callable, Collection
+from pathlib import Path
+from typing import cast
 
-from must_oc.oc.describe import run_describe
-from must_oc.oc.get import run_get
-from must_oc.oc.logs import run_logs
-from must_oc.oc.update_types import run_update_types
+# Subcommand handlers as (module, function) pairs.  Modules are imported only
+# after argparse has dispatched, so a single subcommand never pays the import
+# cost of the others.
+_HANDLER_GET: tuple[str, str] = ("must_oc.oc.get", "run_get")
+_HANDLER_DESCRIBE: tuple[str, str] = ("must_oc.oc.describe", "run_describe")
+_HANDLER_LOGS: tuple[str, str] = ("must_oc.oc.logs", "run_logs")
+_HANDLER_UPDATE_TYPES: tuple[str, str] = ("must_oc.oc.update_types", "run_update_types")
 
+_SUBCOMMAND_NAMES: frozenset[str] = frozenset(
+    {"get", "describe", "logs", "update-types"}
+)
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build the top-level argument parser with subcommands."""
+
+def _registers(commands: Collection[str] | None, name: str) -> bool:
+    """Return True if subcommand *name* should get its full argument set."""
+    return commands is None or name in commands
+
+
+def _requested_commands(argv: list[str]) -> set[str]:
+    """Return every known subcommand name that appears in *argv*.
+
+    The real subcommand is always among them; extra matches (e.g. a ``-d``
+    value that happens to equal a subcommand name) only cost a few more
+    ``add_argument`` calls.
+    """
+    return {token for token in argv if token in _SUBCOMMAND_NAMES}
+
+
+def build_parser(commands: Collection[str] | None = None) -> argparse.ArgumentParser:
+    """Build the top-level argument parser with subcommands.
+
+    When *commands* is given, only those subcommands get their arguments
+    registered; the rest are added as bare placeholders so that top-level
+    help still lists them.  ``None`` registers every subcommand fully.
+    """
     parser = argparse.ArgumentParser(
         prog="must-oc",
         description="oc-like CLI for must-gather directories",
@@ -38,51 +69,65 @@ def build_parser() -> argparse.ArgumentParser:
         help="[SEC I-002] Enable full tracebacks on errors",
     )
 
+    # Defaults for attributes main() reads, so they exist without reflection.
+    parser.set_defaults(handler=None)
+
     subparsers = parser.add_subparsers(dest="command", help="Available subcommands")
 
     # --- get subcommand ---
     get_parser = subparsers.add_parser(name="get", help="Get resources")
-    get_parser.add_argument(
-        "resource_type", help="Resource type (e.g. pod, deployment)"
-    )
-    get_parser.add_argument(
-        "name", nargs="?", default=None, help="Specific resource name"
-    )
-    get_parser.add_argument("-n", "--namespace", default=None, help="Namespace")
-    get_parser.add_argument(
-        "-A", "--all-namespaces", action="store_true", help="All namespaces"
-    )
-    get_parser.add_argument(
-        "-l", "--selector", dest="label_selector", default=None, help="Label selector"
-    )
-    get_parser.set_defaults(func=run_get)
+    if _registers(commands, "get"):
+        get_parser.add_argument(
+            "resource_type", help="Resource type (e.g. pod, deployment)"
+        )
+        get_parser.add_argument(
+            "name", nargs="?", default=None, help="Specific resource name"
+        )
+        get_parser.add_argument("-n", "--namespace", default=None, help="Namespace")
+        get_parser.add_argument(
+            "-A", "--all-namespaces", action="store_true", help="All namespaces"
+        )
+        get_parser.add_argument(
+            "-l",
+            "--selector",
+            dest="label_selector",
+            default=None,
+            help="Label selector",
+        )
+        get_parser.set_defaults(handler=_HANDLER_GET)
 
     # --- describe subcommand ---
     describe_parser = subparsers.add_parser(name="describe", help="Describe a resource")
-    describe_parser.add_argument(
-        "resource_type", help="Resource type (e.g. pod, deployment)"
-    )
-    describe_parser.add_argument("name", help="Resource name")
-    describe_parser.add_argument("-n", "--namespace", default=None, help="Namespace")
-    describe_parser.set_defaults(func=run_describe, all_namespaces=False)
+    if _registers(commands, "describe"):
+        describe_parser.add_argument(
+            "resource_type", help="Resource type (e.g. pod, deployment)"
+        )
+        describe_parser.add_argument("name", help="Resource name")
+        describe_parser.add_argument(
+            "-n", "--namespace", default=None, help="Namespace"
+        )
+        describe_parser.set_defaults(handler=_HANDLER_DESCRIBE, all_namespaces=False)
 
     # --- logs subcommand ---
     logs_parser = subparsers.add_parser(name="logs", help="Get pod logs")
-    logs_parser.add_argument("pod_name", help="Pod name")
-    logs_parser.add_argument(
-        "-n", "--namespace", required=True, help="Namespace (required)"
-    )
-    logs_parser.add_argument("-c", "--container", default=None, help="Container name")
-    logs_parser.add_argument(
-        "--previous", action="store_true", help="Show previous container logs"
-    )
-    logs_parser.set_defaults(func=run_logs)
+    if _registers(commands, "logs"):
+        logs_parser.add_argument("pod_name", help="Pod name")
+        logs_parser.add_argument(
+            "-n", "--namespace", required=True, help="Namespace (required)"
+        )
+        logs_parser.add_argument(
+            "-c", "--container", default=None, help="Container name"
+        )
+        logs_parser.add_argument(
+            "--previous", action="store_true", help="Show previous container logs"
+        )
+        logs_parser.set_defaults(handler=_HANDLER_LOGS)
 
     # --- update-types subcommand ---
     update_types_parser = subparsers.add_parser(
         name="update-types", help="Scan must-gather and update config"
     )
-    update_types_parser.set_defaults(func=run_update_types)
+    update_types_parser.set_defaults(handler=_HANDLER_UPDATE_TYPES)
 
     return parser
 
@@ -92,44 +137,52 @@ def _validate_args(args: argparse.Namespace) -> None:
 
     Raises SystemExit with an error message when validation fails.
     """
-    command = getattr(args, "command", None)
+    command = args.command
 
-    if command == "get":
-        if not args.all_namespaces and args.namespace is None:
-            print("Error: must specify -n <namespace> or -A", file=sys.stderr)
-            sys.exit(1)
+    if command == "get" and not args.all_namespaces and args.namespace is None:
+        print("Error: must specify -n <namespace> or -A", file=sys.stderr)
+        sys.exit(1)
 
-    if command == "describe":
-        if args.namespace is None:
-            print("Error: must specify -n <namespace> for describe", file=sys.stderr)
-            sys.exit(1)
+    if command == "describe" and args.namespace is None:
+        print("Error: must specify -n <namespace> for describe", file=sys.stderr)
+        sys.exit(1)
 
 
 def _normalise_must_gather_dir(args: argparse.Namespace) -> None:
-    """Ensure args.must_gather_dir is always a list.
+    """Ensure args.must_gather_dir is always a list of Paths.
 
     When -d is not provided, default to the current directory.
     """
     if args.must_gather_dir is None:
         args.must_gather_dir = ["."]
+    args.must_gather_dir = [Path(dir_path) for dir_path in args.must_gather_dir]
+
+
+def _load_handler(handler: tuple[str, str]) -> Callable[[argparse.Namespace], None]:
+    """Import the subcommand module and return its ``run_*`` entry point."""
+    module_name, func_name = handler
+    module = importlib.import_module(module_name)
+    return cast(Callable[[argparse.Namespace], None], getattr(module, func_name))
 
 
 def main() -> None:
     """CLI entry point for must-oc."""
-    parser = build_parser()
+    parser = build_parser(commands=_requested_commands(argv=sys.argv[1:]))
     args = parser.parse_args()
 
-    if not hasattr(args, "func"):
+    if args.handler is None:
         parser.print_help()
         sys.exit(1)
 
     _normalise_must_gather_dir(args=args)
     _validate_args(args=args)
 
+    func = _load_handler(handler=args.handler)
+
     try:
-        args.func(args)
+        func(args)
     except Exception as err:
-        if getattr(args, "debug", False):
+        if args.debug:
             raise
         print(f"Error: {err}", file=sys.stderr)
         sys.exit(1)
@@ -3,10 +3,10 @@ from __future__ import annotations
 
 import argparse
 import sys
-from pathlib import Path
 
-from utilities.format import format_describe
-from utilities.paths import discover_roots, find_resource_files
+from utilities.format import write_describe
+from utilities.paths import discover_roots
+from utilities.resource_files import find_resource_files
 from utilities.types import resolve_resource_type
 from utilities.yaml_parser import load_resource
 
@@ -31,9 +31,7 @@ def run_describe(args: argparse.Namespace) -> None:
 
     # Step 2: Discover must-gather roots.
     try:
-        roots = discover_roots(
-            directories=[Path(dir_path) for dir_path in args.must_gather_dir]
-        )
+        roots = discover_roots(directories=args.must_gather_dir)
     except FileNotFoundError as err:
         print(str(err), file=sys.stderr)
         sys.exit(1)
@@ -61,7 +59,6 @@ def run_describe(args: argparse.Namespace) -> None:
     file_path = files[0]
     resource = load_resource(path=file_path)
 
-    # Step 6: Format and print with redaction applied via format_describe.
-    # [SEC V-003] format_describe calls redact_sensitive_fields internally.
-    output = format_describe(resource=resource, show_secrets=args.show_secrets)
-    print(output)
+    # Step 6: Format and print with redaction applied via write_describe.
+    # [SEC V-003] Redaction happens during the formatting walk.
+    write_describe(resource=resource, show_secrets=args.show_secrets, out=sys.stdout)
@@ -3,12 +3,14 @@ from __future__ import annotations
 
 import argparse
 import sys
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from utilities.format import format_age, format_table
-from utilities.labels import matches_selector, parse_selector
-from utilities.paths import discover_roots, find_resource_files
+from utilities.labels import build_matcher, parse_selector
+from utilities.paths import discover_roots
+from utilities.resource_files import find_resource_files
 from utilities.types import resolve_resource_type
 from utilities.yaml_parser import extract_metadata, load_resource, load_resource_list
 
@@ -25,57 +27,56 @@ def _load_resources_from_file(file_path: Path, plural: str) -> list[dict[str, An
     return [load_resource(path=file_path)]
 
 
-def _dedup_key(resource: dict[str, Any]) -> tuple[str, str, str]:
-    """Return a deduplication key of (namespace, kind, name) for a resource."""
-    meta = extract_metadata(resource=resource)
-    return (meta["namespace"], meta["kind"], meta["name"])
+def _extract_pod_columns(resource: dict[str, Any]) -> tuple[str, str, str]:
+    """Extract the READY, STATUS and RESTARTS column values from a Pod resource.
 
-
-def _extract_pod_ready(resource: dict[str, Any]) -> str:
-    """Extract READY column value (ready_count/total_count) from a Pod resource."""
-    status = resource.get("status", {}) or {}
-    container_statuses = status.get("containerStatuses", []) or []
-    total_count = len(container_statuses)
-    ready_count = sum(1 for ctr in container_statuses if ctr.get("ready", False))
-    return f"{ready_count}/{total_count}"
-
-
-def _extract_pod_status(resource: dict[str, Any]) -> str:
-    """Extract STATUS column value from a Pod resource."""
-    status = resource.get("status", {}) or {}
-    return str(status.get("phase", "Unknown"))
-
-
-def _extract_pod_restarts(resource: dict[str, Any]) -> str:
-    """Extract RESTARTS column value (sum of restartCounts) from a Pod resource."""
+    READY is ready_count/total_count, STATUS is the pod phase and RESTARTS is
+    the sum of restartCounts, all gathered in a single pass over
+    containerStatuses.
+    """
     status = resource.get("status", {}) or {}
     container_statuses = status.get("containerStatuses", []) or []
-    total_restarts = sum(int(ctr.get("restartCount", 0)) for ctr in container_statuses)
-    return str(total_restarts)
-
-
-def _build_pod_row(resource: dict[str, Any], all_namespaces: bool) -> list[str]:
-    """Build a table row for a Pod resource."""
-    meta = extract_metadata(resource=resource)
+    ready_count = 0
+    total_restarts = 0
+    for ctr in container_statuses:
+        if ctr.get("ready", False):
+            ready_count += 1
+        total_restarts += int(ctr.get("restartCount", 0))
+    ready = f"{ready_count}/{len(container_statuses)}"
+    return ready, str(status.get("phase", "Unknown")), str(total_restarts)
+
+
+def _build_pod_row(
+    resource: dict[str, Any],
+    meta: dict[str, Any],
+    all_namespaces: bool,
+    now: datetime,
+) -> list[str]:
+    """Build a table row for a Pod resource from the resource and its metadata.
+
+    The AGE column is measured against *now*.
+    """
     row: list[str] = []
     if all_namespaces:
         row.append(meta["namespace"])
     row.append(meta["name"])
-    row.append(_extract_pod_ready(resource))
-    row.append(_extract_pod_status(resource))
-    row.append(_extract_pod_restarts(resource))
-    row.append(format_age(meta["creationTimestamp"]))
+    row.extend(_extract_pod_columns(resource))
+    row.append(format_age(meta["creationTimestamp"], now=now))
     return row
 
 
-def _build_generic_row(resource: dict[str, Any], all_namespaces: bool) -> list[str]:
-    """Build a table row for a non-Pod resource."""
-    meta = extract_metadata(resource=resource)
+def _build_generic_row(
+    meta: dict[str, Any], all_namespaces: bool, now: datetime
+) -> list[str]:
+    """Build a table row for a non-Pod resource from its metadata.
+
+    The AGE column is measured against *now*.
+    """
     row: list[str] = []
     if all_namespaces:
         row.append(meta["namespace"])
     row.append(meta["name"])
-    row.append(format_age(meta["creationTimestamp"]))
+    row.append(format_age(meta["creationTimestamp"], now=now))
     return row
 
 
@@ -94,9 +95,7 @@ def run_get(args: argparse.Namespace) -> None:
 
     # Step 2: Discover must-gather roots.
     try:
-        roots = discover_roots(
-            directories=[Path(dir_path) for dir_path in args.must_gather_dir]
-        )
+        roots = discover_roots(directories=args.must_gather_dir)
     except FileNotFoundError as err:
         print(str(err), file=sys.stderr)
         sys.exit(1)
@@ -117,28 +116,23 @@ def run_get(args: argparse.Namespace) -> None:
         loaded = _load_resources_from_file(file_path=file_path, plural=plural)
         resources.extend(loaded)
 
-    # Step 5: Apply label selector filtering.
-    if args.label_selector:
-        selector = parse_selector(selector_str=args.label_selector)
-        filtered: list[dict[str, Any]] = []
-        for resource in resources:
-            meta = extract_metadata(resource=resource)
-            if matches_selector(meta["labels"], selector):
-                filtered.append(resource)
-        resources = filtered
-
-    # Step 6: Deduplicate resources by (namespace, kind, name).
-    seen_keys: set[tuple[str, str, str]] = set()
-    deduped: list[dict[str, Any]] = []
+    # Step 5 & 6: Apply label selector filtering and deduplicate by
+    # (namespace, kind, name) in a single pass, extracting metadata once.
+    matcher = (
+        build_matcher(selector=parse_selector(selector_str=args.label_selector))
+        if args.label_selector
+        else None
+    )
+    deduped: dict[tuple[str, str, str], tuple[dict[str, Any], dict[str, Any]]] = {}
     for resource in resources:
-        key = _dedup_key(resource=resource)
-        if key not in seen_keys:
-            seen_keys.add(key)
-            deduped.append(resource)
-    resources = deduped
+        meta = extract_metadata(resource=resource)
+        if matcher is not None and not matcher(meta["labels"]):
+            continue
+        dedup_key = (meta["namespace"], meta["kind"], meta["name"])
+        deduped.setdefault(dedup_key, (resource, meta))
 
     # Step 7 & 8: Build table and print.
-    if not resources:
+    if not deduped:
         if args.namespace:
             print(f"No resources found in namespace {args.namespace}.")
         else:
@@ -146,17 +140,25 @@ def run_get(args: argparse.Namespace) -> None:
         return
 
     is_pod = plural == "pods"
+    # Read the clock once so every row's AGE is measured from the same instant.
+    now = datetime.now(UTC)
 
     if is_pod:
         headers = ["NAME", "READY", "STATUS", "RESTARTS", "AGE"]
         if args.all_namespaces:
             headers = ["NAMESPACE"] + headers
-        rows = [_build_pod_row(res, args.all_namespaces) for res in resources]
+        rows = [
+            _build_pod_row(res, meta, args.all_namespaces, now)
+            for res, meta in deduped.values()
+        ]
     else:
         headers = ["NAME", "AGE"]
         if args.all_namespaces:
             headers = ["NAMESPACE"] + headers
-        rows = [_build_generic_row(res, args.all_namespaces) for res in resources]
+        rows = [
+            _build_generic_row(meta, args.all_namespaces, now)
+            for _res, meta in deduped.values()
+        ]
 
     output = format_table(headers=headers, rows=rows)
     print(output)
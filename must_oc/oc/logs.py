@@ -2,52 +2,104 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from pathlib import Path
+from typing import BinaryIO
 
-from utilities.paths import discover_roots, find_log_files, validate_path
+from utilities.paths import discover_roots, find_pod_log_files, is_within_roots
 
 # [SEC V-005] Maximum log file size to read (100MB).
 # Larger files are truncated with a warning message.
 MAX_LOG_SIZE: int = 100 * 1024 * 1024
 
+# Block size used when copying log files to stdout.
+STREAM_CHUNK_SIZE: int = 1024 * 1024
+
+
+def _sendfile_to_stdout(fhandle: BinaryIO, count: int) -> int:
+    """Copy up to *count* bytes from *fhandle* to stdout with ``os.sendfile``.
+
+    Data moves from the page cache to the stdout pipe or file inside the
+    kernel.  Returns the number of bytes sent, which is 0 when stdout is a
+    terminal, has no file descriptor (e.g. captured output), or the platform
+    does not support ``sendfile``.  The caller streams whatever remains.
+    """
+    if not hasattr(os, "sendfile"):
+        return 0
+    try:
+        out_fd = sys.stdout.buffer.fileno()
+    except (OSError, ValueError):
+        return 0
+    if os.isatty(out_fd):
+        return 0
+
+    sent_total = 0
+    try:
+        while sent_total < count:
+            sent = os.sendfile(out_fd, fhandle.fileno(), sent_total, count - sent_total)
+            if sent == 0:
+                break
+            sent_total += sent
+    except OSError:
+        pass
+    return sent_total
+
 
 def stream_log(log_path: Path, max_bytes: int = MAX_LOG_SIZE) -> None:
-    """[SEC V-005] Stream a log file line-by-line to stdout.
+    """[SEC V-005] Stream a log file to stdout in fixed-size binary chunks.
 
-    Reads the file in text mode, printing each line to stdout without
-    loading the entire file into memory.  Tracks bytes read and stops
-    at *max_bytes* with a truncation notice.
+    Copies raw bytes from the file to ``sys.stdout.buffer`` without decoding
+    or loading the entire file into memory, zero-copy via ``os.sendfile``
+    when stdout allows it.  A file larger than *max_bytes* is cut at the end
+    of the last complete line that fits within the limit, found before any
+    output is written, and followed by a truncation notice.
 
     Args:
         log_path: Path to the log file.
         max_bytes: Maximum number of bytes to read before truncating.
     """
-    bytes_read = 0
-    with open(log_path, encoding="utf-8", errors="replace") as fhandle:
-        for line in fhandle:
-            line_bytes = len(line.encode("utf-8"))
-            if bytes_read + line_bytes > max_bytes:
-                print(
-                    f"\n[Truncated: log exceeds {max_bytes} bytes. "
-                    f"Use --tail or view the file directly.]"
-                )
-                return
-            sys.stdout.write(line)
-            bytes_read += line_bytes
+    # Flush pending output so it is not reordered after the raw bytes.
+    sys.stdout.flush()
+    out_buffer = sys.stdout.buffer
+    out_buffer.flush()
+    with open(log_path, "rb") as fhandle:
+        file_size = os.fstat(fhandle.fileno()).st_size
+        truncated = file_size > max_bytes
+        limit = (
+            _last_line_end(fhandle=fhandle, end=max_bytes) if truncated else file_size
+        )
+        bytes_read = _sendfile_to_stdout(fhandle=fhandle, count=limit)
+        fhandle.seek(bytes_read)
+        while bytes_read < limit:
+            chunk = fhandle.read(min(STREAM_CHUNK_SIZE, limit - bytes_read))
+            if not chunk:
+                break
+            out_buffer.write(chunk)
+            bytes_read += len(chunk)
+    out_buffer.flush()
+    if truncated:
+        print(
+            f"\n[Truncated: log exceeds {max_bytes} bytes. "
+            f"Use --tail or view the file directly.]"
+        )
 
 
-def _find_pod_dir(roots: list[Path], namespace: str, pod_name: str) -> Path | None:
-    """Locate the pod directory under ``namespaces/<NS>/pods/<POD>`` in any root.
+def _last_line_end(fhandle: BinaryIO, end: int) -> int:
+    """Return the offset just past the last newline in the first *end* bytes.
 
-    Returns the first matching directory path, or ``None`` if the pod
-    directory does not exist in any root.
+    Scans backwards from *end* one block at a time, so only the tail of the
+    allowed range is read.  Returns 0 when those bytes hold no newline.
     """
-    for root in roots:
-        pod_dir = root / "namespaces" / namespace / "pods" / pod_name
-        if pod_dir.is_dir():
-            return pod_dir
-    return None
+    block_end = end
+    while block_end > 0:
+        block_start = max(block_end - STREAM_CHUNK_SIZE, 0)
+        fhandle.seek(block_start)
+        newline_pos = fhandle.read(block_end - block_start).rfind(b"\n")
+        if newline_pos >= 0:
+            return block_start + newline_pos + 1
+        block_end = block_start
+    return 0
 
 
 def _list_containers(pod_dir: Path) -> list[str]:
@@ -55,15 +107,17 @@ def _list_containers(pod_dir: Path) -> list[str]:
 
     Container directories contain a doubled subdirectory with a ``logs/``
     folder inside.  Only directories matching this pattern are returned.
+    Uses ``os.scandir`` so the directory check comes from the cached
+    ``d_type`` and each candidate costs a single ``stat`` for ``logs/``.
     """
     containers: list[str] = []
-    for entry in sorted(pod_dir.iterdir()):
-        if not entry.is_dir():
-            continue
-        inner = entry / entry.name / "logs"
-        if inner.is_dir():
-            containers.append(entry.name)
-    return containers
+    with os.scandir(pod_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            if os.path.isdir(os.path.join(entry.path, entry.name, "logs")):
+                containers.append(entry.name)
+    return sorted(containers)
 
 
 def run_logs(args: argparse.Namespace) -> None:
@@ -76,7 +130,7 @@ def run_logs(args: argparse.Namespace) -> None:
         - pod_name (str): Pod name.
         - namespace (str): Kubernetes namespace.
         - container (str | None): Container name, or None for auto-detect.
-        - must_gather_dir (list[str]): Must-gather directory paths.
+        - must_gather_dir (list[str | Path]): Must-gather directory paths.
         - previous (bool): If True, read ``previous.log`` instead of ``current.log``.
         - show_secrets (bool): Unused for logs, present for CLI compatibility.
     """
@@ -85,19 +139,16 @@ def run_logs(args: argparse.Namespace) -> None:
     container: str | None = args.container
     log_filename = "previous.log" if args.previous else "current.log"
 
-    roots = discover_roots(
-        directories=[Path(dir_path) for dir_path in args.must_gather_dir]
-    )
+    roots = discover_roots(directories=args.must_gather_dir)
 
     if container is not None:
-        # Specific container requested -- use find_log_files directly.
-        log_files = find_log_files(
+        # Specific container requested -- look up its log directly.
+        log_files, pod_dirs = find_pod_log_files(
             roots=roots, namespace=namespace, pod_name=pod_name, container=container
         )
         if not log_files:
             # Determine whether the pod or the container is missing.
-            pod_dir = _find_pod_dir(roots=roots, namespace=namespace, pod_name=pod_name)
-            if pod_dir is None:
+            if not pod_dirs:
                 print(
                     f'Error: pod "{pod_name}" not found in namespace "{namespace}"',
                     file=sys.stderr,
@@ -113,13 +164,7 @@ def run_logs(args: argparse.Namespace) -> None:
         log_path = log_files[0].parent / log_filename
 
         # [SEC V-002] Validate the resolved log path.
-        for root in roots:
-            try:
-                validate_path(path=log_path, root=root)
-                break
-            except ValueError:
-                continue
-        else:
+        if not is_within_roots(path=log_path, roots=roots):
             print(
                 f"Error: log path escapes must-gather root: {log_path}", file=sys.stderr
             )
@@ -136,21 +181,20 @@ def run_logs(args: argparse.Namespace) -> None:
         return
 
     # No container specified -- auto-detect.
-    log_files = find_log_files(
+    log_files, pod_dirs = find_pod_log_files(
         roots=roots, namespace=namespace, pod_name=pod_name, container=None
     )
 
     if not log_files:
         # Check if pod exists at all.
-        pod_dir = _find_pod_dir(roots=roots, namespace=namespace, pod_name=pod_name)
-        if pod_dir is None:
+        if not pod_dirs:
             print(
                 f'Error: pod "{pod_name}" not found in namespace "{namespace}"',
                 file=sys.stderr,
             )
             sys.exit(1)
         # Pod exists but no logs found -- might have containers but no log files.
-        available = _list_containers(pod_dir=pod_dir)
+        available = _list_containers(pod_dir=pod_dirs[0])
         if not available:
             print(f'Error: no log files found for pod "{pod_name}"', file=sys.stderr)
             sys.exit(1)
@@ -169,9 +213,7 @@ def run_logs(args: argparse.Namespace) -> None:
         # List available containers from the found log paths.
         # Path pattern: .../pods/<pod>/<container>/<container>/logs/current.log
         # Container name is at parts[-4] (the first of the doubled container dirs).
-        available = sorted(
-            {log_file.parent.parent.parent.name for log_file in log_files}
-        )
+        available = sorted({log_file.parts[-4] for log_file in log_files})
         container_list = ", ".join(available)
         print(
             f'Error: pod "{pod_name}" has multiple containers. Use -c to specify one of: [{container_list}]',
@@ -183,13 +225,7 @@ def run_logs(args: argparse.Namespace) -> None:
     log_path = log_files[0].parent / log_filename
 
     # [SEC V-002] Validate the resolved log path.
-    for root in roots:
-        try:
-            validate_path(path=log_path, root=root)
-            break
-        except ValueError:
-            continue
-    else:
+    if not is_within_roots(path=log_path, roots=roots):
         print(f"Error: log path escapes must-gather root: {log_path}", file=sys.stderr)
         sys.exit(1)
 
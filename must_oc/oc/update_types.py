@@ -2,14 +2,77 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
+import os
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import Any, TextIO
 
 from utilities.paths import discover_roots
 from utilities.types import config_dir
+from utilities.yaml_parser import safe_dump_to, safe_load
+
+# Marks a plural name that is absent from the existing resource map.
+_MISSING = object()
+
+
+def _sorted_subdir_entries(path: str) -> list[os.DirEntry[str]]:
+    """Return the subdirectory entries of *path*, sorted by name.
+
+    ``DirEntry.is_dir()`` answers from the ``d_type`` of the listing, so no
+    extra ``stat`` is needed per entry.
+    """
+    with os.scandir(path) as entries:
+        return sorted(
+            (entry for entry in entries if entry.is_dir()),
+            key=lambda entry: entry.name,
+        )
+
+
+def _namespace_bases(roots: list[Path]) -> Iterator[tuple[str, bool]]:
+    """Yield ``(ns_base, skip_all)`` for every candidate namespaces directory.
+
+    For each root, ``namespaces/`` (pattern 1, where the ``all`` directory
+    uses a different layout and is skipped) comes before
+    ``namespaces/all/namespaces/`` (pattern 2).  The paths are not checked
+    for existence; :func:`_walk_ns_tree` skips missing ones.
+    """
+    for root in roots:
+        ns_base = os.path.join(root, "namespaces")
+        yield ns_base, True
+        yield os.path.join(ns_base, "all", "namespaces"), False
+
+
+def _walk_ns_tree(ns_bases: Iterable[tuple[str, bool]]) -> Iterator[tuple[str, str]]:
+    """Yield ``(plural_name, api_group)`` for each ``<NS>/<api_group>/<type_dir>/``.
+
+    *ns_bases* yields ``(ns_base, skip_all)`` pairs as produced by
+    :func:`_namespace_bases`.  Namespaces and API groups are visited in name
+    order so that a plural name found under two API groups resolves the same
+    way on every run.
+    """
+    for ns_base, skip_all in ns_bases:
+        # Listing a missing base fails in the same syscall a separate
+        # is_dir() check would have made.
+        try:
+            ns_entries = _sorted_subdir_entries(path=ns_base)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for ns_entry in ns_entries:
+            if skip_all and ns_entry.name == "all":
+                continue
+            for api_group_entry in _sorted_subdir_entries(path=ns_entry.path):
+                # The same few API group and type names repeat in every
+                # namespace; intern them so the results share one object each.
+                api_group = sys.intern(api_group_entry.name)
+                # Every type_dir here yields the same api_group, so their
+                # order cannot change the result and is left unsorted.
+                with os.scandir(api_group_entry.path) as type_entries:
+                    for type_entry in type_entries:
+                        if type_entry.is_dir():
+                            yield sys.intern(type_entry.name), api_group
 
 
 def scan_resource_types(roots: list[Path]) -> dict[str, str]:
@@ -22,48 +85,25 @@ def scan_resource_types(roots: list[Path]) -> dict[str, str]:
     2. ``<root>/namespaces/all/namespaces/<NS>/<api_group>/<type_dir>/``
 
     Returns a mapping of ``{plural_name: api_group}`` for all discovered
-    resource types.
+    resource types.  The first api_group seen for a plural name wins.
     """
     discovered: dict[str, str] = {}
+    for plural_name, api_group in _walk_ns_tree(ns_bases=_namespace_bases(roots=roots)):
+        discovered.setdefault(plural_name, api_group)
+    return discovered
 
-    for root in roots:
-        ns_base = root / "namespaces"
-        if not ns_base.is_dir():
-            continue
 
-        # Pattern 1: namespaces/<NS>/<api_group>/<type_dir>/
-        for ns_dir in sorted(ns_base.iterdir()):
-            if not ns_dir.is_dir() or ns_dir.name == "all":
-                continue
-            for api_group_dir in sorted(ns_dir.iterdir()):
-                if not api_group_dir.is_dir():
-                    continue
-                api_group = api_group_dir.name
-                for type_dir in sorted(api_group_dir.iterdir()):
-                    if not type_dir.is_dir():
-                        continue
-                    plural_name = type_dir.name
-                    if plural_name not in discovered:
-                        discovered[plural_name] = api_group
-
-        # Pattern 2: namespaces/all/namespaces/<NS>/<api_group>/<type_dir>/
-        all_ns_base = ns_base / "all" / "namespaces"
-        if all_ns_base.is_dir():
-            for ns_dir in sorted(all_ns_base.iterdir()):
-                if not ns_dir.is_dir():
-                    continue
-                for api_group_dir in sorted(ns_dir.iterdir()):
-                    if not api_group_dir.is_dir():
-                        continue
-                    api_group = api_group_dir.name
-                    for type_dir in sorted(api_group_dir.iterdir()):
-                        if not type_dir.is_dir():
-                            continue
-                        plural_name = type_dir.name
-                        if plural_name not in discovered:
-                            discovered[plural_name] = api_group
+def _raise_unless_missing(error: OSError, base: str) -> None:
+    """``os.walk`` error hook: ignore a missing *base*, re-raise anything else.
 
-    return discovered
+    This keeps the failure mode of listing the directories by hand, where
+    only an absent base was skipped.
+    """
+    if error.filename == base and isinstance(
+        error, (FileNotFoundError, NotADirectoryError)
+    ):
+        return
+    raise error
 
 
 def scan_cluster_scoped(roots: list[Path]) -> set[str]:
@@ -75,16 +115,18 @@ def scan_cluster_scoped(roots: list[Path]) -> set[str]:
     discovered: set[str] = set()
 
     for root in roots:
-        csr_base = root / "cluster-scoped-resources"
-        if not csr_base.is_dir():
-            continue
-        for api_group_dir in sorted(csr_base.iterdir()):
-            if not api_group_dir.is_dir():
-                continue
-            for type_dir in sorted(api_group_dir.iterdir()):
-                if not type_dir.is_dir():
-                    continue
-                discovered.add(type_dir.name)
+        csr_base = os.path.join(root, "cluster-scoped-resources")
+        # A missing base yields nothing; any other listing error is raised.
+        # Below the base, each directory is an api_group: take its
+        # subdirectories as type names and prune them so the walk never
+        # descends to the YAML files.
+        onerror = functools.partial(_raise_unless_missing, base=csr_base)
+        for dirpath, dirnames, _filenames in os.walk(
+            csr_base, onerror=onerror, followlinks=True
+        ):
+            if dirpath != csr_base:
+                discovered.update(dirnames)
+                dirnames.clear()
 
     return discovered
 
@@ -92,6 +134,7 @@ def scan_cluster_scoped(roots: list[Path]) -> set[str]:
 def merge_resource_map(
     existing: dict[str, Any],
     discovered: dict[str, str],
+    inplace: bool = False,
 ) -> tuple[dict[str, Any], int]:
     """Additively merge discovered resource types into an existing resource map.
 
@@ -99,34 +142,46 @@ def merge_resource_map(
     - If not already in *existing*: add it with the discovered api_group
       and an empty aliases list.
     - If already in *existing*: skip entirely.  If the discovered api_group
-      differs from the existing one, emit a warning to stderr.
+      differs from the existing one, warn on stderr (all warnings are
+      written together once the merge is done).
 
     Never removes or overwrites existing entries (including manually-added
     aliases).
 
+    With *inplace*, *existing* itself is extended and returned instead of a
+    shallow copy.
+
     Returns a tuple of ``(updated_map, count_of_new_entries)``.
     """
-    updated = dict(existing)
+    updated = existing if inplace else dict(existing)
     count_new = 0
-
-    for plural_name, api_group in sorted(discovered.items()):
-        if plural_name in updated:
-            # Check for api_group mismatch.
-            existing_group = updated[plural_name].get("api_group", "")
-            if existing_group != api_group:
-                print(
-                    f"Warning: '{plural_name}' API group mismatch. "
-                    f"Existing: {existing_group}, Discovered: {api_group}. "
-                    f"Keeping existing.",
-                    file=sys.stderr,
-                )
+    mismatches: list[tuple[str, Any, str]] = []
+
+    # Output order comes from the sorted YAML dump and the sorted warnings,
+    # so the discovered types are merged in whatever order they come.
+    for plural_name, api_group in discovered.items():
+        entry = updated.get(plural_name, _MISSING)
+        if entry is _MISSING:
+            updated[plural_name] = {"api_group": api_group, "aliases": []}
+            count_new += 1
             continue
 
-        updated[plural_name] = {
-            "api_group": api_group,
-            "aliases": [],
-        }
-        count_new += 1
+        # Already present: check for api_group mismatch.
+        existing_group = entry.get("api_group", "")
+        if existing_group != api_group:
+            mismatches.append((plural_name, existing_group, api_group))
+
+    # Emit all mismatch warnings, in name order, with a single write.
+    if mismatches:
+        mismatches.sort(key=lambda mismatch: mismatch[0])
+        sys.stderr.write(
+            "".join(
+                f"Warning: '{plural_name}' API group mismatch. "
+                f"Existing: {existing_group}, Discovered: {api_group}. "
+                f"Keeping existing.\n"
+                for plural_name, existing_group, api_group in mismatches
+            )
+        )
 
     return updated, count_new
 
@@ -134,23 +189,43 @@ def merge_resource_map(
 def merge_cluster_scoped(
     existing: list[str],
     discovered: set[str],
+    inplace: bool = False,
 ) -> tuple[list[str], int]:
     """Additively merge discovered cluster-scoped types into an existing list.
 
     Appends new types not already present.  Does not duplicate existing
-    entries.  Returns a tuple of ``(updated_list, count_of_new_entries)``.
+    entries.  With *inplace*, *existing* itself is appended to and returned
+    instead of a copy.  Returns a tuple of
+    ``(updated_list, count_of_new_entries)``.
     """
-    existing_set = set(existing)
-    updated = list(existing)
-    count_new = 0
+    new_items = sorted(discovered.difference(existing))
+    updated = existing if inplace else list(existing)
+    updated.extend(new_items)
 
-    for plural_name in sorted(discovered):
-        if plural_name not in existing_set:
-            updated.append(plural_name)
-            existing_set.add(plural_name)
-            count_new += 1
+    return updated, len(new_items)
 
-    return updated, count_new
+
+@contextlib.contextmanager
+def _atomic_config_writer(path: Path) -> Iterator[TextIO]:
+    """[SEC V-007] Yield a text stream whose contents atomically replace *path*.
+
+    The stream writes to ``<path>.tmp``, created with mode 0o644 (fchmod'd so
+    the umask cannot narrow it).  On a clean exit the data is fsync'd and the
+    temporary file is moved over *path* with ``os.replace``.  If writing
+    fails, the temporary file is removed and *path* is left untouched.
+    """
+    tmp_path = path.with_suffix(".tmp")
+    tmp_fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        with os.fdopen(tmp_fd, "w", encoding="utf-8") as fhandle:
+            os.fchmod(fhandle.fileno(), 0o644)
+            yield fhandle
+            fhandle.flush()
+            os.fsync(fhandle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def write_config_safe(path: Path, content: str) -> None:
@@ -160,10 +235,20 @@ def write_config_safe(path: Path, content: str) -> None:
     renames to the target path.  This prevents partial writes from
     corrupting config files.
     """
-    tmp_path = path.with_suffix(".tmp")
-    tmp_path.write_text(data=content, encoding="utf-8")
-    tmp_path.chmod(mode=0o644)
-    tmp_path.rename(target=path)
+    with _atomic_config_writer(path=path) as fhandle:
+        fhandle.write(content)
+
+
+def write_yaml_config_safe(path: Path, header: str, data: Any) -> None:
+    """[SEC V-007] Atomically write *header* plus *data* as YAML to *path*.
+
+    Same temporary-file, 0o644 and rename sequence as write_config_safe(),
+    but the YAML is dumped straight into the temporary file instead of
+    being built as a string first.
+    """
+    with _atomic_config_writer(path=path) as fhandle:
+        fhandle.write(header)
+        safe_dump_to(data, stream=fhandle, default_flow_style=False, sort_keys=True)
 
 
 def _load_existing_resource_map(config_path: Path) -> dict[str, Any]:
@@ -174,8 +259,9 @@ def _load_existing_resource_map(config_path: Path) -> dict[str, Any]:
     if not config_path.is_file():
         return {}
 
-    with open(config_path, encoding="utf-8") as fhandle:
-        raw = yaml.safe_load(fhandle)
+    # Binary mode: the loader decodes UTF-8 itself, skipping the text layer.
+    with open(config_path, "rb") as fhandle:
+        raw = safe_load(fhandle)
 
     if raw is None:
         return {}
@@ -192,13 +278,16 @@ def _load_existing_cluster_scoped(config_path: Path) -> list[str]:
     if not config_path.is_file():
         return []
 
-    with open(config_path, encoding="utf-8") as fhandle:
-        raw = yaml.safe_load(fhandle)
+    with open(config_path, "rb") as fhandle:
+        raw = safe_load(fhandle)
 
     if raw is None:
         return []
     if not isinstance(raw, list):
         return []
+    # A well-formed file is already all strings; only coerce when needed.
+    if all(type(item) is str for item in raw):
+        return raw
     return [str(item) for item in raw]
 
 
@@ -210,15 +299,13 @@ def run_update_types(args: argparse.Namespace) -> None:
     2. Scan for resource types and cluster-scoped types.
     3. Load existing config files.
     4. Merge discovered types into existing configs (additive only).
-    5. Write updated configs back to disk.
+    5. Write back each config that gained new entries.
     6. Print a summary of changes.
 
     Expected attributes on *args*:
-        - must_gather_dir (list[str]): Must-gather directory paths.
+        - must_gather_dir (list[str | Path]): Must-gather directory paths.
     """
-    roots = discover_roots(
-        directories=[Path(dir_path) for dir_path in args.must_gather_dir]
-    )
+    roots = discover_roots(directories=args.must_gather_dir)
 
     # Scan filesystem for resource types.
     discovered_types = scan_resource_types(roots=roots)
@@ -232,27 +319,26 @@ def run_update_types(args: argparse.Namespace) -> None:
     existing_map = _load_existing_resource_map(config_path=resource_map_path)
     existing_cluster = _load_existing_cluster_scoped(config_path=cluster_scoped_path)
 
-    # Merge.
+    # Merge.  The loaded configs are not used afterwards, so extend them
+    # in place rather than copying.
     updated_map, map_new_count = merge_resource_map(
-        existing=existing_map, discovered=discovered_types
+        existing=existing_map, discovered=discovered_types, inplace=True
     )
     updated_cluster, cluster_new_count = merge_cluster_scoped(
-        existing=existing_cluster, discovered=discovered_cluster
+        existing=existing_cluster, discovered=discovered_cluster, inplace=True
     )
 
-    # Write updated configs.
+    # Write updated configs.  A file with nothing new is left untouched.
     resource_map_header = (
         "# resource_map.yaml\n"
         "# Maps resource plural names to API groups and user-facing aliases.\n"
         "# Updated by: must-oc update-types -d <must-gather-dir>\n"
         "# Manual edits are safe -- update-types only adds, never removes.\n\n"
     )
-    resource_map_content = resource_map_header + yaml.dump(
-        updated_map,
-        default_flow_style=False,
-        sort_keys=True,
-    )
-    write_config_safe(path=resource_map_path, content=resource_map_content)
+    if map_new_count:
+        write_yaml_config_safe(
+            path=resource_map_path, header=resource_map_header, data=updated_map
+        )
 
     cluster_scoped_header = (
         "# cluster_scoped.yaml\n"
@@ -260,11 +346,12 @@ def run_update_types(args: argparse.Namespace) -> None:
         "# Updated by: must-oc update-types -d <must-gather-dir>\n"
         "# Manual edits are safe -- update-types only adds, never removes.\n\n"
     )
-    cluster_scoped_content = cluster_scoped_header + yaml.dump(
-        updated_cluster,
-        default_flow_style=False,
-    )
-    write_config_safe(path=cluster_scoped_path, content=cluster_scoped_content)
+    if cluster_new_count:
+        write_yaml_config_safe(
+            path=cluster_scoped_path,
+            header=cluster_scoped_header,
+            data=updated_cluster,
+        )
 
     # Print summary.
     total_new = map_new_count + cluster_new_count
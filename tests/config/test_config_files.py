@@ -5,7 +5,6 @@ from pathlib import Path
 
 import yaml
 
-
 CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
 
 
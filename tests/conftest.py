@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import os
+import shutil
 from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
-from tests.constants import IMAGE_HASH
 from tests.utils import (
     build_deployment_yaml,
     build_pod_yaml,
@@ -17,6 +17,18 @@ from tests.utils import (
 )
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Use ``$PYTEST_TMP_BASE`` as the temp root unless ``--basetemp`` was given.
+
+    Pointing it at a tmpfs directory (e.g. ``/dev/shm/pytest-must-oc``)
+    keeps fixture trees off the disk.  pytest clears the directory at the
+    start of each run, so it must be dedicated to the test suite.
+    """
+    tmp_base = os.environ.get("PYTEST_TMP_BASE")
+    if tmp_base and config.option.basetemp is None:
+        config.option.basetemp = tmp_base
+
+
 @pytest.fixture
 def fake_pod_yaml() -> Callable[..., str]:
     """Return a factory that produces minimal but realistic Pod YAML strings."""
@@ -59,38 +71,46 @@ def fake_secret_yaml() -> Callable[..., str]:
     return _build
 
 
-@pytest.fixture
-def fake_must_gather(tmp_path: Path) -> Path:
-    """Build a single fake must-gather directory tree.
+@pytest.fixture(scope="session")
+def fake_must_gather_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the shared fake must-gather tree once per test session.
 
-    Returns the path to ``<tmp_path>/must-gather.local.test-ocp/``.
+    Usable from class- or module-scoped fixtures.  Tests must not modify it;
+    see :func:`fake_must_gather`.
     """
-    return populate_must_gather(tmp_path)
+    return populate_must_gather(tmp_path_factory.mktemp("mg_template"))
 
 
 @pytest.fixture
-def fake_must_gather_multi(tmp_path: Path) -> tuple[Path, Path]:
-    """Build two fake must-gather directories for multi-directory merge testing.
-
-    Returns a tuple of ``(ocp_root, odf_root)`` paths.
+def fake_must_gather(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    fake_must_gather_template: Path,
+) -> Path:
+    """Return a single fake must-gather directory tree.
+
+    Read-only tests share the session-wide tree.  Tests marked
+    ``mutates_gather`` get a private copy at
+    ``<tmp_path>/must-gather.local.test-ocp/`` that they may modify.
     """
-    return populate_must_gather_multi(tmp_path)
-
+    if request.node.get_closest_marker("mutates_gather") is None:
+        return fake_must_gather_template
+    return Path(
+        shutil.copytree(
+            fake_must_gather_template,
+            tmp_path / fake_must_gather_template.name,
+            symlinks=True,
+        )
+    )
 
-@pytest.fixture
-def fake_must_gather_with_symlink(tmp_path: Path) -> Path:
-    """Build a fake must-gather that includes a malicious symlink.
 
-    [SEC V-002] The symlink ``malicious.yaml`` points to ``/etc/hostname``
-    to test path traversal rejection.
+@pytest.fixture(scope="session")
+def fake_must_gather_multi(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[Path, Path]:
+    """Build two fake must-gather directories for multi-directory merge testing.
 
-    Returns the path to ``<tmp_path>/must-gather.local.test-ocp/``.
+    Built once per test session and shared, so tests must not modify it.
+    Returns a tuple of ``(ocp_root, odf_root)`` paths.
     """
-    root = populate_must_gather(tmp_path)
-    image_dir = root / IMAGE_HASH
-    malicious_link = (
-        image_dir / "namespaces" / "test-ns" / "core" / "pods" / "malicious.yaml"
-    )
-    malicious_link.parent.mkdir(parents=True, exist_ok=True)
-    os.symlink("/etc/hostname", malicious_link)
-    return root
+    return populate_must_gather_multi(tmp_path_factory.mktemp("mg_multi"))
@@ -0,0 +1,42 @@
+# tests/hooks/test_check_dangerous_commands.py
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tests.utils import run_hook
+
+
+def _exit_code(command: str) -> int:
+    """Return the hook's exit code for *command* as Bash tool input."""
+    payload = json.dumps({"tool_name": "Bash", "tool_input": {"command": command}})
+    return run_hook("check-dangerous-commands.py", payload).returncode
+
+
+class TestCheckDangerousCommands:
+    """Tests for the check-dangerous-commands hook."""
+
+    @pytest.mark.parametrize(
+        "command",
+        ["rm -rf /", "rm  -rf /tmp/x", "sudo ls", "SUDO ls", "ls && sudo rm x"],
+        ids=["rm-root", "rm-spaces", "sudo", "upper-sudo", "chained-sudo"],
+    )
+    def test_blocks_dangerous_command(self, command: str) -> None:
+        assert _exit_code(command) == 2
+
+    @pytest.mark.parametrize(
+        "command",
+        ["ls -la", "rm -rf build", "rm file.txt", ""],
+        ids=["ls", "rm-relative", "rm-file", "empty"],
+    )
+    def test_allows_command(self, command: str) -> None:
+        assert _exit_code(command) == 0
+
+    @pytest.mark.parametrize(
+        "payload",
+        ['{"tool_input": {}}', "{}"],
+        ids=["no-command", "no-tool-input"],
+    )
+    def test_allows_input_without_command(self, payload: str) -> None:
+        assert run_hook("check-dangerous-commands.py", payload).returncode == 0
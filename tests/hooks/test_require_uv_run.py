@@ -0,0 +1,107 @@
+# tests/hooks/test_require_uv_run.py
+from __future__ import annotations
+
+import json
+import subprocess
+
+import pytest
+
+from tests.utils import run_hook
+
+
+def _run_hook(command: str) -> subprocess.CompletedProcess[str]:
+    """Feed *command* to the hook as Bash tool input and return the result."""
+    payload = json.dumps({"tool_name": "Bash", "tool_input": {"command": command}})
+    return run_hook("require-uv-run.py", payload)
+
+
+class TestRequireUvRun:
+    """Tests for the require-uv-run hook."""
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "python x.py",
+            "python3 -m pytest",
+            "pytest -q",
+            "/usr/bin/python3 x.py",
+            "cd tests && pytest",
+            "ls;python x.py",
+            'bash -c "python x.py"',
+            "bash -c 'pytest -q'",
+            "echo $(python3 -V)",
+            "ls `python -c 1`",
+            "(python x.py)",
+            "FOO=1 python x.py",
+            "time pytest -q",
+            "ls\npython x.py",
+            "uv run true && python x.py",
+        ],
+        ids=[
+            "python",
+            "python3",
+            "pytest",
+            "full-path",
+            "chained",
+            "semicolon",
+            "double-quoted",
+            "single-quoted",
+            "command-substitution",
+            "backticks",
+            "subshell",
+            "env-assignment",
+            "time-prefix",
+            "newline",
+            "after-uv-run",
+        ],
+    )
+    def test_blocks_bare_python(self, command: str) -> None:
+        result = _run_hook(command)
+        assert result.returncode == 2
+        assert "BLOCKED" in json.loads(result.stdout)["result"]
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "uv run python x.py",
+            "uv run pytest -q",
+            "ls -la",
+            "cat pytest.ini",
+            "cat python_notes.txt",
+            "git log -- tests/python-tools",
+            'git commit -m "bump pytest"',
+            'grep -rn "pytest" tests',
+            "which python3",
+            "ls /tmp/venv/bin/python",
+            "echo done; uv run pytest",
+            "",
+        ],
+        ids=[
+            "uv-python",
+            "uv-pytest",
+            "no-python",
+            "ini-file",
+            "file-name",
+            "dir-name",
+            "quoted-message",
+            "grep-pattern",
+            "which",
+            "path-argument",
+            "chained-uv-run",
+            "empty",
+        ],
+    )
+    def test_allows_command(self, command: str) -> None:
+        result = _run_hook(command)
+        assert result.returncode == 0
+        assert result.stdout == ""
+
+    @pytest.mark.parametrize(
+        "payload",
+        ['{"tool_input": {}}', "{}"],
+        ids=["no-command", "no-tool-input"],
+    )
+    def test_allows_input_without_command(self, payload: str) -> None:
+        result = run_hook("require-uv-run.py", payload)
+        assert result.returncode == 0
+        assert result.stdout == ""
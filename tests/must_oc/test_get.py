@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import io
 from pathlib import Path
 
 import pytest
@@ -30,17 +32,21 @@ def _make_args(
     )
 
 
+@pytest.fixture(scope="module")
+def pod_output(fake_must_gather_template: Path) -> str:
+    """Run ``get pod -n test-ns`` once and share its stdout across tests."""
+    args = _make_args("pod", [str(fake_must_gather_template)], namespace="test-ns")
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        run_get(args)
+    return out.getvalue()
+
+
 class TestGetPodNamespaced:
     """Tests for getting pods in a specific namespace."""
 
-    def test_get_pods_returns_correct_pods(
-        self, fake_must_gather: Path, capsys: pytest.CaptureFixture[str]
-    ) -> None:
+    def test_get_pods_returns_correct_pods(self, pod_output: str) -> None:
         """get pod -n test-ns returns table with test-pod-1 and test-pod-2."""
-        args = _make_args("pod", [str(fake_must_gather)], namespace="test-ns")
-        run_get(args)
-        captured = capsys.readouterr()
-        output = captured.out
+        output = pod_output
 
         assert "NAME" in output
         assert "READY" in output
@@ -54,28 +60,16 @@ class TestGetPodNamespaced:
         # Should NOT have NAMESPACE column without -A.
         assert "NAMESPACE" not in output
 
-    def test_get_pod_ready_column(
-        self, fake_must_gather: Path, capsys: pytest.CaptureFixture[str]
-    ) -> None:
+    def test_get_pod_ready_column(self, pod_output: str) -> None:
         """get pod -n test-ns shows correct READY counts."""
-        args = _make_args("pod", [str(fake_must_gather)], namespace="test-ns")
-        run_get(args)
-        captured = capsys.readouterr()
-        output = captured.out
-
         # test-pod-1 has 1 container (container-a), all ready.
-        assert "1/1" in output
+        assert "1/1" in pod_output
         # test-pod-2 has 2 containers (container-x, container-y), all ready.
-        assert "2/2" in output
+        assert "2/2" in pod_output
 
-    def test_get_pod_status_column(
-        self, fake_must_gather: Path, capsys: pytest.CaptureFixture[str]
-    ) -> None:
+    def test_get_pod_status_column(self, pod_output: str) -> None:
         """get pod -n test-ns shows Running status."""
-        args = _make_args("pod", [str(fake_must_gather)], namespace="test-ns")
-        run_get(args)
-        captured = capsys.readouterr()
-        assert "Running" in captured.out
+        assert "Running" in pod_output
 
 
 class TestGetPodAllNamespaces:
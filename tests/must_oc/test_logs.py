@@ -16,7 +16,6 @@ from tests.constants import (
     POD_2_NS,
 )
 
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -54,27 +53,18 @@ def _add_bare_pod_logs(
     The ``fake_must_gather`` fixture only writes logs under ``core/pods/``, so we
     need to add them under the bare ``pods/`` path for the logs tests.
     """
-    image_dir = root / IMAGE_HASH
+    pod_dir = os.path.join(root, IMAGE_HASH, "namespaces", namespace, "pods", pod_name)
+    log_content = log_content or {}
+    previous_content = previous_content or {}
     for ctr_name in containers:
-        log_dir = (
-            image_dir
-            / "namespaces"
-            / namespace
-            / "pods"
-            / pod_name
-            / ctr_name
-            / ctr_name
-            / "logs"
-        )
-        log_dir.mkdir(parents=True, exist_ok=True)
-        content = "log line 1\nlog line 2\n"
-        if log_content and ctr_name in log_content:
-            content = log_content[ctr_name]
-        (log_dir / "current.log").write_text(content, encoding="utf-8")
-        if previous_content and ctr_name in previous_content:
-            (log_dir / "previous.log").write_text(
-                previous_content[ctr_name], encoding="utf-8"
-            )
+        log_dir = os.path.join(pod_dir, ctr_name, ctr_name, "logs")
+        os.makedirs(log_dir, exist_ok=True)
+        content = log_content.get(ctr_name, "log line 1\nlog line 2\n")
+        with open(os.path.join(log_dir, "current.log"), "wb") as fhandle:
+            fhandle.write(content.encode("utf-8"))
+        if ctr_name in previous_content:
+            with open(os.path.join(log_dir, "previous.log"), "wb") as fhandle:
+                fhandle.write(previous_content[ctr_name].encode("utf-8"))
 
 
 # ---------------------------------------------------------------------------
@@ -82,6 +72,7 @@ def _add_bare_pod_logs(
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.mutates_gather
 class TestLogsSingleContainer:
     """Tests for ``logs`` with a single-container pod."""
 
@@ -110,6 +101,7 @@ class TestLogsSingleContainer:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.mutates_gather
 class TestLogsSpecificContainer:
     """Tests for ``logs`` with ``-c container``."""
 
@@ -139,6 +131,7 @@ class TestLogsSpecificContainer:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.mutates_gather
 class TestLogsMultipleContainers:
     """Tests for ``logs`` with pods that have multiple containers."""
 
@@ -159,14 +152,39 @@ class TestLogsMultipleContainers:
             },
         )
         args = _make_log_args(str(fake_must_gather), POD_2_NAME, POD_2_NS)
-        with pytest.raises(SystemExit, match="1"):
+        with pytest.raises(SystemExit) as exc_info:
             run_logs(args)
+        assert exc_info.value.code == 1
         captured = capsys.readouterr()
         assert "multiple containers" in captured.err
         assert "container-x" in captured.err
         assert "container-y" in captured.err
         assert "-c" in captured.err
 
+    def test_logs_multiple_containers_without_current_logs(
+        self,
+        fake_must_gather: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Containers with logs/ dirs but no current.log are still listed."""
+        pod_dir = (
+            fake_must_gather
+            / IMAGE_HASH
+            / "namespaces"
+            / POD_2_NS
+            / "pods"
+            / POD_2_NAME
+        )
+        for ctr_name in ("container-x", "container-y"):
+            (pod_dir / ctr_name / ctr_name / "logs").mkdir(parents=True)
+        (pod_dir / "not-a-container").mkdir()
+        args = _make_log_args(str(fake_must_gather), POD_2_NAME, POD_2_NS)
+        with pytest.raises(SystemExit) as exc_info:
+            run_logs(args)
+        assert exc_info.value.code == 1
+        captured = capsys.readouterr()
+        assert "[container-x, container-y]" in captured.err
+
 
 # ---------------------------------------------------------------------------
 # Test: pod not found
@@ -183,8 +201,9 @@ class TestLogsPodNotFound:
     ) -> None:
         """logs nonexistent -n NS prints 'pod not found'."""
         args = _make_log_args(str(fake_must_gather), "nonexistent-pod", POD_1_NS)
-        with pytest.raises(SystemExit, match="1"):
+        with pytest.raises(SystemExit) as exc_info:
             run_logs(args)
+        assert exc_info.value.code == 1
         captured = capsys.readouterr()
         assert 'pod "nonexistent-pod" not found' in captured.err
         assert f'namespace "{POD_1_NS}"' in captured.err
@@ -195,6 +214,7 @@ class TestLogsPodNotFound:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.mutates_gather
 class TestLogsContainerNotFound:
     """Tests for ``logs`` with a nonexistent container."""
 
@@ -214,8 +234,9 @@ class TestLogsContainerNotFound:
         args = _make_log_args(
             str(fake_must_gather), POD_1_NAME, POD_1_NS, container="nonexistent"
         )
-        with pytest.raises(SystemExit, match="1"):
+        with pytest.raises(SystemExit) as exc_info:
             run_logs(args)
+        assert exc_info.value.code == 1
         captured = capsys.readouterr()
         assert 'container "nonexistent" not found' in captured.err
         assert f'pod "{POD_1_NAME}"' in captured.err
@@ -226,6 +247,7 @@ class TestLogsContainerNotFound:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.mutates_gather
 class TestLogsPrevious:
     """Tests for ``logs`` with ``--previous``."""
 
@@ -266,24 +288,78 @@ class TestStreamLogTruncation:
     def test_stream_log_truncates_at_max_bytes(
         self,
         tmp_path: Path,
-        capsys: pytest.CaptureFixture[str],
+        capfdbinary: pytest.CaptureFixture[bytes],
     ) -> None:
         """[SEC V-005] stream_log truncates output at MAX_LOG_SIZE with notice."""
         log_file = tmp_path / "large.log"
         # Create a log file with content exceeding the limit.
         # Use a small max_bytes for testing.
         max_bytes = 50
-        line = "A" * 20 + "\n"  # 21 bytes per line
+        line = b"A" * 20 + b"\n"  # 21 bytes per line
         # Write enough lines to exceed max_bytes.
-        log_file.write_text(line * 10, encoding="utf-8")
+        log_file.write_bytes(line * 10)
 
         stream_log(log_file, max_bytes=max_bytes)
-        captured = capsys.readouterr()
+        captured = capfdbinary.readouterr()
+
+        # Should have printed some lines but then truncated.  The notice is the
+        # last thing written, so only that tail needs checking.
+        notice_start = captured.out.rfind(b"[Truncated:")
+        assert notice_start != -1
+        notice = captured.out[notice_start:]
+        assert f"{max_bytes} bytes".encode() in notice
+        assert b"--tail" in notice
+        assert notice.endswith(b"\n")
+        assert notice.count(b"\n") == 1
+
+    def test_stream_log_truncates_on_line_boundary(
+        self,
+        tmp_path: Path,
+        capfdbinary: pytest.CaptureFixture[bytes],
+    ) -> None:
+        """[SEC V-005] stream_log only emits complete lines that fit within max_bytes."""
+        log_file = tmp_path / "large.log"
+        line = b"A" * 20 + b"\n"  # 21 bytes per line
+        log_file.write_bytes(line * 10)
 
-        # Should have printed some lines but then truncated.
-        assert "[Truncated:" in captured.out
-        assert f"{max_bytes} bytes" in captured.out
-        assert "--tail" in captured.out
+        stream_log(log_file, max_bytes=50)
+        captured = capfdbinary.readouterr()
+
+        # Two full lines (42 bytes) fit; the third would exceed the limit.
+        assert captured.out.startswith(line * 2 + b"\n[Truncated:")
+
+    def test_stream_log_limit_on_chunk_boundary(
+        self,
+        tmp_path: Path,
+        capfdbinary: pytest.CaptureFixture[bytes],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """[SEC V-005] A limit that ends a read chunk still cuts at a line end."""
+        monkeypatch.setattr("must_oc.oc.logs.STREAM_CHUNK_SIZE", 16)
+        log_file = tmp_path / "large.log"
+        # The 16-byte limit falls inside the second line, which ends at 20.
+        log_file.write_bytes(b"first line\nsecond line\nthird\n")
+
+        stream_log(log_file, max_bytes=16)
+        captured = capfdbinary.readouterr()
+
+        assert captured.out.startswith(b"first line\n\n[Truncated:")
+
+    def test_stream_log_limit_past_chunk_boundary(
+        self,
+        tmp_path: Path,
+        capfdbinary: pytest.CaptureFixture[bytes],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """[SEC V-005] The last line end is found in an earlier chunk if needed."""
+        monkeypatch.setattr("must_oc.oc.logs.STREAM_CHUNK_SIZE", 4)
+        log_file = tmp_path / "large.log"
+        log_file.write_bytes(b"ab\n" + b"C" * 20 + b"\n")
+
+        stream_log(log_file, max_bytes=16)
+        captured = capfdbinary.readouterr()
+
+        assert captured.out.startswith(b"ab\n\n[Truncated:")
 
     def test_stream_log_small_file_no_truncation(
         self,
@@ -298,6 +374,19 @@ class TestStreamLogTruncation:
         assert "short line" in captured.out
         assert "[Truncated:" not in captured.out
 
+    def test_stream_log_to_file_descriptor(
+        self,
+        tmp_path: Path,
+        capfd: pytest.CaptureFixture[str],
+    ) -> None:
+        """stream_log writes the whole file when stdout is a real file descriptor."""
+        log_file = tmp_path / "fd.log"
+        log_file.write_text("first line\nsecond line\n", encoding="utf-8")
+        print("before")
+        stream_log(log_file, max_bytes=MAX_LOG_SIZE)
+        captured = capfd.readouterr()
+        assert captured.out == "before\nfirst line\nsecond line\n"
+
 
 # ---------------------------------------------------------------------------
 # Test: [SEC V-002] symlink path escape
@@ -309,24 +398,27 @@ class TestLogsPathEscape:
 
     def test_run_logs_rejects_symlink_escape(
         self,
-        fake_must_gather_with_symlink: Path,
+        tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """[SEC V-002] run_logs rejects log path that escapes must-gather root."""
-        root = fake_must_gather_with_symlink
+        # run_logs only walks the requested pod's directory, so a root holding
+        # just that pod is enough.
+        root = tmp_path / "must-gather.local.test-ocp"
         image_dir = root / IMAGE_HASH
 
         # Create a malicious log symlink pointing outside the root.
         pod_dir = image_dir / "namespaces" / POD_1_NS / "pods" / "evil-pod"
         log_dir = pod_dir / "evil-ctr" / "evil-ctr" / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
+        log_dir.mkdir(parents=True)
         malicious_log = log_dir / "current.log"
         # Point outside the must-gather root.
         os.symlink("/etc/hostname", malicious_log)
 
         args = _make_log_args(str(root), "evil-pod", POD_1_NS, container="evil-ctr")
-        with pytest.raises(SystemExit, match="1"):
+        with pytest.raises(SystemExit) as exc_info:
             run_logs(args)
+        assert exc_info.value.code == 1
         captured = capsys.readouterr()
         # The path validation should reject it either in find_log_files
         # (which calls validate_path) or in our own validation.
@@ -0,0 +1,201 @@
+# tests/must_oc/test_main.py
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from must_oc.__main__ import (
+    _HANDLER_DESCRIBE,
+    _HANDLER_GET,
+    _HANDLER_LOGS,
+    _HANDLER_UPDATE_TYPES,
+    _load_handler,
+    main,
+)
+from tests.constants import IMAGE_HASH, POD_1_NAME, POD_1_NS
+from tests.utils import emit_file
+
+
+def _run_main(monkeypatch: pytest.MonkeyPatch, argv: list[str]) -> int:
+    """Run main() with *argv* as the command line and return its exit code."""
+    monkeypatch.setattr("sys.argv", ["must-oc", *argv])
+    try:
+        main()
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else 1
+    return 0
+
+
+def _add_pod_1_log(root: Path) -> None:
+    """Write a current.log for test-pod-1 under the bare ``pods/`` layout."""
+    log_file = os.path.join(
+        root,
+        IMAGE_HASH,
+        "namespaces",
+        POD_1_NS,
+        "pods",
+        POD_1_NAME,
+        "container-a",
+        "container-a",
+        "logs",
+        "current.log",
+    )
+    emit_file(Path(log_file), "log line 1\n")
+
+
+class TestMainHelp:
+    """Tests for main() help and usage output."""
+
+    def test_no_arguments_prints_help(
+        self, monkeypatch: pytest.MonkeyPatch, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        """A bare must-oc prints the top-level help and exits 1."""
+        assert _run_main(monkeypatch, []) == 1
+        output = capfd.readouterr().out
+        assert "usage: must-oc" in output
+        assert "update-types" in output
+
+    def test_top_level_help_lists_subcommands(
+        self, monkeypatch: pytest.MonkeyPatch, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        assert _run_main(monkeypatch, ["-h"]) == 0
+        output = capfd.readouterr().out
+        for command in ("get", "describe", "logs", "update-types"):
+            assert command in output
+
+    @pytest.mark.parametrize(
+        ("command", "option"),
+        [
+            ("get", "--all-namespaces"),
+            ("describe", "--namespace"),
+            ("logs", "--container"),
+            ("update-types", "usage: must-oc update-types"),
+        ],
+        ids=["get", "describe", "logs", "update-types"],
+    )
+    def test_subcommand_help_shows_its_arguments(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capfd: pytest.CaptureFixture[str],
+        command: str,
+        option: str,
+    ) -> None:
+        """<sub> -h registers and shows that subcommand's full argument set."""
+        assert _run_main(monkeypatch, [command, "-h"]) == 0
+        assert option in capfd.readouterr().out
+
+
+class TestMainDispatch:
+    """Tests for main() running each subcommand."""
+
+    def test_get(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capfd: pytest.CaptureFixture[str],
+        fake_must_gather: Path,
+    ) -> None:
+        argv = ["-d", str(fake_must_gather), "get", "pod", "-n", POD_1_NS]
+        assert _run_main(monkeypatch, argv) == 0
+        assert POD_1_NAME in capfd.readouterr().out
+
+    def test_describe(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capfd: pytest.CaptureFixture[str],
+        fake_must_gather: Path,
+    ) -> None:
+        argv = ["-d", str(fake_must_gather), "describe", "pod", POD_1_NAME]
+        argv += ["-n", POD_1_NS]
+        assert _run_main(monkeypatch, argv) == 0
+        assert POD_1_NAME in capfd.readouterr().out
+
+    @pytest.mark.mutates_gather
+    def test_logs(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capfd: pytest.CaptureFixture[str],
+        fake_must_gather: Path,
+    ) -> None:
+        _add_pod_1_log(fake_must_gather)
+        argv = ["-d", str(fake_must_gather), "logs", POD_1_NAME, "-n", POD_1_NS]
+        assert _run_main(monkeypatch, argv) == 0
+        assert "log line 1" in capfd.readouterr().out
+
+    def test_update_types(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        fake_must_gather: Path,
+    ) -> None:
+        cfg_dir = tmp_path / "config"
+        cfg_dir.mkdir()
+        monkeypatch.setattr("must_oc.oc.update_types.config_dir", lambda: cfg_dir)
+        argv = ["-d", str(fake_must_gather), "update-types"]
+        assert _run_main(monkeypatch, argv) == 0
+        assert (cfg_dir / "resource_map.yaml").is_file()
+
+    @pytest.mark.mutates_gather
+    def test_must_gather_dir_named_like_a_subcommand(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capfd: pytest.CaptureFixture[str],
+        tmp_path: Path,
+        fake_must_gather: Path,
+    ) -> None:
+        """A -d value equal to a subcommand name does not confuse dispatch."""
+        _add_pod_1_log(fake_must_gather)
+        os.symlink(fake_must_gather, tmp_path / "get")
+        monkeypatch.chdir(tmp_path)
+        argv = ["-d", "get", "logs", POD_1_NAME, "-n", POD_1_NS]
+        assert _run_main(monkeypatch, argv) == 0
+        assert "log line 1" in capfd.readouterr().out
+
+    @pytest.mark.parametrize(
+        ("argv", "message"),
+        [
+            (["get", "pod"], "must specify -n <namespace> or -A"),
+            (["describe", "pod", POD_1_NAME], "-n <namespace> for describe"),
+        ],
+        ids=["get", "describe"],
+    )
+    def test_missing_namespace_exits_1(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capfd: pytest.CaptureFixture[str],
+        argv: list[str],
+        message: str,
+    ) -> None:
+        assert _run_main(monkeypatch, argv) == 1
+        assert message in capfd.readouterr().err
+
+    def test_handler_error_is_reported_without_traceback(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capfd: pytest.CaptureFixture[str],
+        tmp_path: Path,
+    ) -> None:
+        """[SEC I-002] Errors print a one-line message and exit 1."""
+        missing = tmp_path / "does-not-exist.test"
+        argv = ["-d", str(missing), "get", "pod", "-A"]
+        assert _run_main(monkeypatch, argv) == 1
+        err = capfd.readouterr().err
+        assert "does not exist" in err
+        assert "Traceback" not in err
+
+
+class TestLoadHandler:
+    """Tests for _load_handler() resolving each subcommand's entry point."""
+
+    @pytest.mark.parametrize(
+        "handler",
+        [_HANDLER_GET, _HANDLER_DESCRIBE, _HANDLER_LOGS, _HANDLER_UPDATE_TYPES],
+        ids=["get", "describe", "logs", "update-types"],
+    )
+    def test_resolves_handler(self, handler: tuple[str, str]) -> None:
+        module_name, func_name = handler
+        func = _load_handler(handler=handler)
+        assert callable(func)
+        assert func.__module__ == module_name
+        assert func.__name__ == func_name
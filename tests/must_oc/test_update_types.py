@@ -1,17 +1,23 @@
 # tests/must_oc/test_update_types.py
 from __future__ import annotations
 
+import argparse
+import os
 import stat
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
+import yaml
 
 from must_oc.oc.update_types import (
     merge_cluster_scoped,
     merge_resource_map,
+    run_update_types,
     scan_cluster_scoped,
     scan_resource_types,
     write_config_safe,
+    write_yaml_config_safe,
 )
 from tests.constants import IMAGE_HASH
 
@@ -42,6 +48,17 @@ class TestScanResourceTypes:
         result = scan_resource_types([tmp_path])
         assert result == {}
 
+    def test_ignores_files_and_keeps_first_api_group(self, tmp_path: Path) -> None:
+        """scan_resource_types skips plain files and keeps the first api_group seen."""
+        ns_dir = tmp_path / "namespaces" / "test-ns"
+        (ns_dir / "apps" / "widgets").mkdir(parents=True)
+        (ns_dir / "zeta.io" / "widgets").mkdir(parents=True)
+        (ns_dir / "apps" / "widgets.yaml").write_text("kind: List\n")
+        (ns_dir / "test-ns.yaml").write_text("kind: Namespace\n")
+
+        result = scan_resource_types([tmp_path])
+        assert result == {"widgets": "apps"}
+
     def test_multiple_roots_merged(
         self, fake_must_gather_multi: tuple[Path, Path]
     ) -> None:
@@ -67,6 +84,26 @@ class TestScanClusterScoped:
         result = scan_cluster_scoped([tmp_path])
         assert result == set()
 
+    def test_base_that_is_a_file_returns_empty(self, tmp_path: Path) -> None:
+        """A cluster-scoped-resources file is skipped like a missing directory."""
+        (tmp_path / "cluster-scoped-resources").write_text("")
+        assert scan_cluster_scoped([tmp_path]) == set()
+
+    def test_unreadable_api_group_raises(
+        self, monkeypatch: pytest.MonkeyPatch, fake_must_gather: Path
+    ) -> None:
+        """Errors below the base are raised rather than silently skipped."""
+        real_scandir = os.scandir
+
+        def scandir(path: str) -> Iterator[os.DirEntry[str]]:
+            if os.path.basename(path) == "core":
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr("os.scandir", scandir)
+        with pytest.raises(PermissionError):
+            scan_cluster_scoped([fake_must_gather / IMAGE_HASH])
+
 
 class TestMergeResourceMap:
     """Tests for merge_resource_map additive merging."""
@@ -127,6 +164,39 @@ class TestMergeResourceMap:
         assert "mismatch" in captured.err.lower()
         assert updated["pods"]["api_group"] == "core"
 
+    def test_api_group_mismatches_warn_in_name_order(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """merge_resource_map writes one warning line per mismatch, sorted by name."""
+        existing = {
+            "pods": {"api_group": "core", "aliases": []},
+            "jobs": {"api_group": "batch", "aliases": []},
+        }
+        discovered = {"pods": "other", "jobs": "other", "services": "core"}
+
+        _, count = merge_resource_map(existing, discovered)
+
+        assert count == 1
+        lines = capsys.readouterr().err.splitlines()
+        assert len(lines) == 2
+        assert lines[0].startswith("Warning: 'jobs'")
+        assert lines[1].startswith("Warning: 'pods'")
+
+    def test_copies_unless_inplace(self) -> None:
+        """merge_resource_map leaves *existing* alone unless inplace=True."""
+        existing: dict = {"pods": {"api_group": "core", "aliases": []}}
+
+        copied, _ = merge_resource_map(existing, {"services": "core"})
+        assert copied is not existing
+        assert "services" not in existing
+
+        updated, count = merge_resource_map(
+            existing, {"services": "core"}, inplace=True
+        )
+        assert updated is existing
+        assert count == 1
+        assert "services" in existing
+
 
 class TestMergeClusterScoped:
     """Tests for merge_cluster_scoped additive merging."""
@@ -159,6 +229,19 @@ class TestMergeClusterScoped:
         assert count == 1
         assert "nodes" in updated
 
+    def test_copies_unless_inplace(self) -> None:
+        """merge_cluster_scoped leaves *existing* alone unless inplace=True."""
+        existing = ["nodes"]
+
+        copied, _ = merge_cluster_scoped(existing, {"clusterroles"})
+        assert copied is not existing
+        assert existing == ["nodes"]
+
+        updated, count = merge_cluster_scoped(existing, {"clusterroles"}, inplace=True)
+        assert updated is existing
+        assert count == 1
+        assert existing == ["nodes", "clusterroles"]
+
 
 class TestWriteConfigSafe:
     """[SEC V-007] Tests for write_config_safe atomic writes and permissions."""
@@ -194,3 +277,91 @@ class TestWriteConfigSafe:
 
         write_config_safe(target, "new content\n")
         assert target.read_text(encoding="utf-8") == "new content\n"
+
+
+class TestWriteYamlConfigSafe:
+    """[SEC V-007] Tests for write_yaml_config_safe streaming writes."""
+
+    def test_writes_header_and_yaml(self, tmp_path: Path) -> None:
+        """write_yaml_config_safe writes the header followed by sorted YAML."""
+        target = tmp_path / "test.yaml"
+        write_yaml_config_safe(target, "# header\n\n", {"b": 1, "a": [2]})
+
+        assert target.read_text(encoding="utf-8") == "# header\n\na:\n- 2\nb: 1\n"
+        assert not target.with_suffix(".tmp").exists()
+
+    def test_sets_0644_permissions(self, tmp_path: Path) -> None:
+        """[SEC V-007] write_yaml_config_safe sets file permissions to 0o644."""
+        target = tmp_path / "test.yaml"
+        write_yaml_config_safe(target, "", ["nodes"])
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+    def test_failed_write_removes_tmp_and_keeps_target(self, tmp_path: Path) -> None:
+        """[SEC V-007] A dump error leaves the old file and no .tmp behind."""
+        target = tmp_path / "test.yaml"
+        target.write_text("old content\n", encoding="utf-8")
+
+        with pytest.raises(yaml.YAMLError):
+            write_yaml_config_safe(target, "# header\n", {"bad": object()})
+
+        assert target.read_text(encoding="utf-8") == "old content\n"
+        assert not target.with_suffix(".tmp").exists()
+
+
+class TestRunUpdateTypes:
+    """Tests for the run_update_types workflow."""
+
+    def test_rerun_leaves_config_files_untouched(
+        self,
+        fake_must_gather: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """A second run with nothing new does not rewrite the config files."""
+        cfg_dir = tmp_path / "config"
+        cfg_dir.mkdir()
+        monkeypatch.setattr("must_oc.oc.update_types.config_dir", lambda: cfg_dir)
+        args = argparse.Namespace(must_gather_dir=[fake_must_gather])
+
+        run_update_types(args)
+        resource_map = cfg_dir / "resource_map.yaml"
+        cluster_scoped = cfg_dir / "cluster_scoped.yaml"
+        assert "pods:" in resource_map.read_text(encoding="utf-8")
+        assert "- nodes" in cluster_scoped.read_text(encoding="utf-8")
+
+        # An atomic rewrite replaces the inode, so unchanged inodes mean no write.
+        inodes = (resource_map.stat().st_ino, cluster_scoped.stat().st_ino)
+        capsys.readouterr()
+
+        run_update_types(args)
+        assert "up to date" in capsys.readouterr().out
+        assert (resource_map.stat().st_ino, cluster_scoped.stat().st_ino) == inodes
+
+    @pytest.mark.mutates_gather
+    def test_rewrites_only_the_config_that_changed(
+        self,
+        fake_must_gather: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A new namespaced type rewrites resource_map.yaml but not cluster_scoped.yaml."""
+        cfg_dir = tmp_path / "config"
+        cfg_dir.mkdir()
+        monkeypatch.setattr("must_oc.oc.update_types.config_dir", lambda: cfg_dir)
+        args = argparse.Namespace(must_gather_dir=[fake_must_gather])
+        run_update_types(args)
+
+        resource_map = cfg_dir / "resource_map.yaml"
+        cluster_scoped = cfg_dir / "cluster_scoped.yaml"
+        map_inode = resource_map.stat().st_ino
+        cluster_inode = cluster_scoped.stat().st_ino
+
+        ns_dir = fake_must_gather / IMAGE_HASH / "namespaces" / "test-ns"
+        (ns_dir / "example.io" / "widgets").mkdir(parents=True)
+        run_update_types(args)
+
+        assert resource_map.stat().st_ino != map_inode
+        assert "widgets:" in resource_map.read_text(encoding="utf-8")
+        assert cluster_scoped.stat().st_ino == cluster_inode
@@ -0,0 +1,148 @@
+# tests/utilities/conftest.py
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from utilities.paths import discover_roots
+
+_POD_1_YAML = (
+    b"apiVersion: v1\nkind: Pod\nmetadata:\n  name: test-pod-1\n  namespace: test-ns\n"
+)
+
+# (path components relative to the image-hash dir, file contents) for
+# must_gather_tree.
+_TREE_SPEC: tuple[tuple[tuple[str, ...], bytes], ...] = (
+    # --- Pattern A1: bare pods/ (F-002) ---
+    (("namespaces", "test-ns", "pods", "test-pod-1", "test-pod-1.yaml"), _POD_1_YAML),
+    # Container log with doubled container directory
+    (
+        (
+            "namespaces",
+            "test-ns",
+            "pods",
+            "test-pod-1",
+            "container-a",
+            "container-a",
+            "logs",
+            "current.log",
+        ),
+        b"2026-01-15 pod started\n",
+    ),
+    # --- Pattern A2: core/pods/<name>.yaml ---
+    (("namespaces", "test-ns", "core", "pods", "test-pod-1.yaml"), _POD_1_YAML),
+    # --- Pattern A3: core/pods.yaml (list file) ---
+    (
+        ("namespaces", "test-ns", "core", "pods.yaml"),
+        (
+            b"apiVersion: v1\nkind: PodList\nmetadata: {}\nitems:\n"
+            b"  - apiVersion: v1\n    kind: Pod\n    metadata:\n      name: test-pod-1\n"
+        ),
+    ),
+    # --- configmaps ---
+    (
+        ("namespaces", "test-ns", "core", "configmaps", "test-cm.yaml"),
+        b"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: test-cm\n  namespace: test-ns\n",
+    ),
+    # --- deployments ---
+    (
+        ("namespaces", "test-ns", "apps", "deployments", "test-deploy.yaml"),
+        b"apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: test-deploy\n  namespace: test-ns\n",
+    ),
+    # --- test-ns-2 ---
+    (
+        ("namespaces", "test-ns-2", "core", "pods", "test-pod-3.yaml"),
+        b"apiVersion: v1\nkind: Pod\nmetadata:\n  name: test-pod-3\n  namespace: test-ns-2\n",
+    ),
+    # --- Pattern B: namespaces/all/namespaces/<NS>/... ---
+    (
+        (
+            "namespaces",
+            "all",
+            "namespaces",
+            "test-ns",
+            "core",
+            "pods",
+            "test-pod-1.yaml",
+        ),
+        _POD_1_YAML,
+    ),
+    # --- cluster-scoped-resources ---
+    (
+        ("cluster-scoped-resources", "core", "nodes", "test-node-1.yaml"),
+        b"apiVersion: v1\nkind: Node\nmetadata:\n  name: test-node-1\n",
+    ),
+)
+
+
+@pytest.fixture(scope="session")
+def must_gather_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a minimal fake must-gather directory tree, once per session.
+
+    The tree is shared by every test that uses it and must not be modified;
+    tests that need a different layout build their own under ``tmp_path``.
+    The returned path is already resolved, so tests can compare against it
+    directly.
+
+    Layout::
+
+        <tmp>/must-gather.test/
+          fake-hash-abc123/
+            namespaces/
+              test-ns/
+                pods/                          # bare pods/ dir (Pattern A1 - F-002)
+                  test-pod-1/
+                    test-pod-1.yaml
+                    container-a/
+                      container-a/
+                        logs/
+                          current.log
+                core/
+                  pods.yaml                   # PodList file
+                  pods/
+                    test-pod-1.yaml           # Pattern A2 (api_group prefix)
+                  configmaps/
+                    test-cm.yaml
+                apps/
+                  deployments/
+                    test-deploy.yaml
+              test-ns-2/
+                core/
+                  pods/
+                    test-pod-3.yaml
+            namespaces/all/namespaces/
+              test-ns/
+                core/
+                  pods/
+                    test-pod-1.yaml          # Pattern B (duplicate)
+            cluster-scoped-resources/
+              core/
+                nodes/
+                  test-node-1.yaml
+    """
+    gather_dir = tmp_path_factory.mktemp("paths").resolve() / "must-gather.test"
+    hash_dir = gather_dir / "fake-hash-abc123"
+
+    # Each directory is created once, then every file is a single write.
+    # Repeated bodies (test-pod-1 in Pattern A1, A2 and B) are hardlinks to
+    # the first copy; they are still regular files to the path lookups.
+    for rel_dir in {rel_parts[:-1] for rel_parts, _ in _TREE_SPEC}:
+        os.makedirs(os.path.join(hash_dir, *rel_dir), exist_ok=True)
+    first_copies: dict[bytes, Path] = {}
+    for rel_parts, body in _TREE_SPEC:
+        target = Path(os.path.join(hash_dir, *rel_parts))
+        if body in first_copies:
+            os.link(first_copies[body], target)
+        else:
+            target.write_bytes(body)
+            first_copies[body] = target
+
+    return gather_dir
+
+
+@pytest.fixture(scope="session")
+def gather_roots(must_gather_tree: Path) -> list[Path]:
+    """The roots discovered in must_gather_tree, shared like the tree itself."""
+    return discover_roots([must_gather_tree])
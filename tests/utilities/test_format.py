@@ -1,9 +1,14 @@
 # tests/utilities/test_format.py
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import io
+import re
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import pytest
+import yaml
+
 from utilities.format import (
     SENSITIVE_KEY_PATTERNS,
     SENSITIVE_RESOURCE_KINDS,
@@ -11,8 +16,35 @@ from utilities.format import (
     format_describe,
     format_table,
     redact_sensitive_fields,
+    write_describe,
 )
 
+# A run of two or more spaces separating two table columns.
+_COLUMN_GAP = re.compile(r" {2,}")
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def now_utc(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    """Freeze the clock format_age() reads and return the frozen UTC time.
+
+    Ages computed against the returned value come out exact, no matter how
+    long the test takes to run.
+    """
+    frozen = datetime.now(UTC)
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz: Any = None) -> datetime:  # type: ignore[override]
+            return frozen if tz is not None else frozen.replace(tzinfo=None)
+
+    monkeypatch.setattr("utilities.format.datetime", _FrozenDatetime)
+    return frozen
+
 
 class TestFormatTable:
     """Tests for format_table()."""
@@ -34,11 +66,10 @@ class TestFormatTable:
         assert "AGE" in lines[0]
 
         # Check alignment: all STATUS values should start at the same column.
-        status_col_header = lines[0].index("STATUS")
-        status_col_row1 = lines[1].index("Running")
-        status_col_row2 = lines[2].index("Pending")
-        assert status_col_header == status_col_row1
-        assert status_col_header == status_col_row2
+        status_col = lines[0].find("STATUS")
+        assert status_col > 0
+        assert lines[1].find("Running") == status_col
+        assert lines[2].find("Pending") == status_col
 
     def test_empty_rows_returns_header_only(self) -> None:
         """format_table with empty rows returns header line only."""
@@ -79,11 +110,15 @@ class TestFormatTable:
         lines = result.split("\n")
         # The gap between end of col-A and start of col-B must be >= 2.
         for line in lines:
-            parts = line.split("  ", 1)
-            assert len(parts) == 2, (
+            assert _COLUMN_GAP.search(line), (
                 f"Expected at least 2 spaces between columns in: {line!r}"
             )
 
+    def test_pads_short_rows_and_drops_extra_cells(self) -> None:
+        """Missing cells render empty, extra cells are ignored, braces are literal."""
+        result = format_table(["name", "age"], [["{x}"], ["b", "1d", "extra"]])
+        assert result.split("\n") == ["NAME  AGE", "{x}   ", "b     1d"]
+
     def test_empty_headers_returns_empty_string(self) -> None:
         """format_table with no headers returns an empty string."""
         result = format_table([], [])
@@ -105,37 +140,29 @@ class TestFormatAge:
         """format_age returns '<unknown>' for unparseable input."""
         assert format_age("not-a-timestamp") == "<unknown>"
 
-    def test_converts_timestamp_to_days(self) -> None:
-        """format_age shows days for timestamps older than 24 hours."""
-        five_days_ago = datetime.now(timezone.utc) - timedelta(days=5)
-        timestamp = five_days_ago.isoformat()
-        result = format_age(timestamp)
-        assert result == "5d"
-
-    def test_converts_timestamp_to_hours(self) -> None:
-        """format_age shows hours for timestamps between 1-24 hours old."""
-        three_hours_ago = datetime.now(timezone.utc) - timedelta(hours=3)
-        timestamp = three_hours_ago.isoformat()
-        result = format_age(timestamp)
-        assert result == "3h"
-
-    def test_converts_timestamp_to_minutes(self) -> None:
-        """format_age shows minutes for timestamps between 1-60 minutes old."""
-        ten_min_ago = datetime.now(timezone.utc) - timedelta(minutes=10)
-        timestamp = ten_min_ago.isoformat()
-        result = format_age(timestamp)
-        assert result == "10m"
-
-    def test_converts_timestamp_to_seconds(self) -> None:
-        """format_age shows seconds for timestamps less than 1 minute old."""
-        thirty_sec_ago = datetime.now(timezone.utc) - timedelta(seconds=30)
-        timestamp = thirty_sec_ago.isoformat()
-        result = format_age(timestamp)
-        assert result == "30s"
-
-    def test_handles_iso_format_with_trailing_z(self) -> None:
+    @pytest.mark.parametrize(
+        ("delta", "expected"),
+        [
+            (timedelta(days=5), "5d"),
+            (timedelta(hours=3), "3h"),
+            (timedelta(minutes=10), "10m"),
+            (timedelta(seconds=30), "30s"),
+        ],
+    )
+    def test_converts_timestamp_to_largest_unit(
+        self, now_utc: datetime, delta: timedelta, expected: str
+    ) -> None:
+        """format_age shows the largest unit (days, hours, minutes, seconds) that fits."""
+        assert format_age((now_utc - delta).isoformat()) == expected
+
+    def test_measures_against_given_now(self) -> None:
+        """format_age uses an explicit *now* instead of reading the clock."""
+        now = datetime(2026, 1, 20, 10, 30, tzinfo=UTC)
+        assert format_age("2026-01-15T10:30:00Z", now=now) == "5d"
+
+    def test_handles_iso_format_with_trailing_z(self, now_utc: datetime) -> None:
         """format_age handles ISO timestamps ending with Z."""
-        two_days_ago = datetime.now(timezone.utc) - timedelta(days=2)
+        two_days_ago = now_utc - timedelta(days=2)
         timestamp = two_days_ago.strftime("%Y-%m-%dT%H:%M:%SZ")
         result = format_age(timestamp)
         assert result == "2d"
@@ -227,6 +254,44 @@ class TestFormatDescribe:
         assert "kubernetes.io/pv-protection" in result
         assert "other-finalizer" in result
 
+    def test_redacts_nested_keys_without_mutating_input(self) -> None:
+        """[SEC V-003] format_describe redacts nested keys and leaves the input intact."""
+        resource: dict[str, Any] = {
+            "kind": "ConfigMap",
+            "metadata": {
+                "annotations": {
+                    "kubectl.kubernetes.io/last-applied-configuration": "inline",
+                },
+            },
+            "spec": {"containers": [{"name": "app", "env": {"apiToken": "abc123"}}]},
+        }
+        result = format_describe(resource, show_secrets=False)
+        assert "abc123" not in result
+        assert "inline" not in result
+        assert result.count("<REDACTED>") == 2
+        assert resource["spec"]["containers"][0]["env"]["apiToken"] == "abc123"
+
+    def test_self_referencing_alias_does_not_hang(self) -> None:
+        """[SEC V-003] A list aliased inside itself is redacted and rendered once."""
+        resource = yaml.safe_load(
+            "kind: ConfigMap\nmetadata:\n  name: loop\ndata:\n  items: [&a [*a]]\n"
+        )
+        result = format_describe(resource, show_secrets=False)
+        assert "items:" in result
+        assert "[...]" in result
+
+    def test_write_describe_matches_format_describe(self) -> None:
+        """write_describe writes the format_describe output followed by a newline."""
+        resource: dict[str, Any] = {
+            "kind": "Secret",
+            "metadata": {"name": "my-secret", "labels": {"app": "web"}},
+            "data": {"password": "cGFzc3dvcmQ="},
+            "finalizers": ["a", "b"],
+        }
+        out = io.StringIO()
+        write_describe(resource, show_secrets=False, out=out)
+        assert out.getvalue() == format_describe(resource, show_secrets=False) + "\n"
+
 
 class TestRedactSensitiveFields:
     """[SEC V-003] Tests for redact_sensitive_fields()."""
@@ -355,20 +420,47 @@ class TestRedactSensitiveFields:
         # This test validates that recursive walking works on nested structures.
         assert result["kind"] == "Deployment"
 
+    def test_redacts_dicts_inside_nested_lists(self) -> None:
+        """[SEC V-003] Dicts inside lists of lists are still walked."""
+        resource: dict[str, Any] = {
+            "kind": "ConfigMap",
+            "matrix": [["plain", [{"token": "abc", "keep": "ok"}]], 7],
+        }
+        result = redact_sensitive_fields(resource, show_secrets=False)
+        assert result["matrix"] == [
+            ["plain", [{"token": "<REDACTED>", "keep": "ok"}]],
+            7,
+        ]
+
+    def test_cyclic_resource_is_copied_once(self) -> None:
+        """[SEC V-003] A self-referencing mapping is redacted without looping."""
+        resource = yaml.safe_load(
+            "kind: ConfigMap\nspec: &spec\n  token: abc\n  self: *spec\n"
+        )
+        result = redact_sensitive_fields(resource, show_secrets=False)
+        assert result["spec"]["token"] == "<REDACTED>"
+        assert result["spec"]["self"] is result["spec"]
+        assert resource["spec"]["token"] == "abc"
+
     def test_redacts_all_sensitive_key_patterns(self) -> None:
         """[SEC V-003] All patterns in SENSITIVE_KEY_PATTERNS trigger redaction."""
-        for pattern in SENSITIVE_KEY_PATTERNS:
-            resource: dict[str, Any] = {
-                "kind": "ConfigMap",
-                "metadata": {"name": "test"},
-                "data": {
-                    f"my_{pattern}_field": "sensitive_value",
-                },
-            }
-            result = redact_sensitive_fields(resource, show_secrets=False)
-            assert result["data"][f"my_{pattern}_field"] == "<REDACTED>", (
-                f"Pattern {pattern!r} did not trigger redaction"
-            )
+        # One resource carrying a key per pattern: a single redaction pass
+        # covers them all, and the failure message lists every miss.
+        resource: dict[str, Any] = {
+            "kind": "ConfigMap",
+            "metadata": {"name": "test"},
+            "data": {
+                f"my_{pattern}_field": "sensitive_value"
+                for pattern in SENSITIVE_KEY_PATTERNS
+            },
+        }
+        result = redact_sensitive_fields(resource, show_secrets=False)
+        missed = [
+            pattern
+            for pattern in SENSITIVE_KEY_PATTERNS
+            if result["data"][f"my_{pattern}_field"] != "<REDACTED>"
+        ]
+        assert not missed, f"Patterns did not trigger redaction: {missed!r}"
 
     def test_non_secret_resource_data_not_blanket_redacted(self) -> None:
         """[SEC V-003] Non-Secret resources do not have all data values blanket-redacted."""
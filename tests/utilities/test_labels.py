@@ -1,58 +1,77 @@
 # tests/utilities/test_labels.py
 from __future__ import annotations
 
-import pytest
-
-from utilities.labels import matches_selector, parse_selector, validate_selector
+from collections.abc import Mapping
+from types import MappingProxyType
 
+import pytest
 
-class TestParseSelector:
-    """Tests for parse_selector()."""
-
-    def test_parse_single_term(self) -> None:
-        result = parse_selector("key=value")
-        assert result == [("key", "=", "value")]
+from utilities.labels import (
+    build_matcher,
+    matches_selector,
+    parse_selector,
+    validate_selector,
+)
 
-    def test_parse_multiple_terms(self) -> None:
-        result = parse_selector("k1=v1,k2=v2")
-        assert result == [("k1", "=", "v1"), ("k2", "=", "v2")]
+# Selectors at and one past the 20-term limit, shared by the limit tests.
+_MAX_TERMS = ",".join(f"k{idx}=v{idx}" for idx in range(20))
+_OVER_MAX_TERMS = _MAX_TERMS + ",k20=v20"
 
-    def test_parse_not_equal(self) -> None:
-        result = parse_selector("key!=value")
-        assert result == [("key", "!=", "value")]
 
-    def test_parse_double_equals(self) -> None:
-        """== should be treated as equality, same semantics as =."""
-        result = parse_selector("key==value")
-        assert result == [("key", "==", "value")]
+@pytest.fixture(scope="module")
+def web_prod_labels() -> Mapping[str, str]:
+    """Read-only ``app=web,env=prod`` labels shared by the matcher tests."""
+    return MappingProxyType({"app": "web", "env": "prod"})
 
-    def test_empty_selector_returns_empty_list(self) -> None:
-        result = parse_selector("")
-        assert result == []
 
-    def test_parse_kubernetes_domain_key(self) -> None:
-        result = parse_selector("app.kubernetes.io/name=foo")
-        assert result == [("app.kubernetes.io/name", "=", "foo")]
+class TestParseSelector:
+    """Tests for parse_selector()."""
 
-    def test_parse_mixed_operators(self) -> None:
-        result = parse_selector("app=web,env!=prod,tier==frontend")
-        assert result == [
-            ("app", "=", "web"),
-            ("env", "!=", "prod"),
-            ("tier", "==", "frontend"),
-        ]
+    @pytest.mark.parametrize(
+        ("selector", "expected"),
+        [
+            ("key=value", [("key", "=", "value")]),
+            ("k1=v1,k2=v2", [("k1", "=", "v1"), ("k2", "=", "v2")]),
+            ("key!=value", [("key", "!=", "value")]),
+            # == is kept as its own operator; it has the same semantics as =.
+            ("key==value", [("key", "==", "value")]),
+            ("", []),
+            ("app.kubernetes.io/name=foo", [("app.kubernetes.io/name", "=", "foo")]),
+            (
+                "app=web,env!=prod,tier==frontend",
+                [
+                    ("app", "=", "web"),
+                    ("env", "!=", "prod"),
+                    ("tier", "==", "frontend"),
+                ],
+            ),
+        ],
+        ids=["single", "multi", "not_eq", "dbl_eq", "empty", "domain", "mixed"],
+    )
+    def test_parse(self, selector: str, expected: list[tuple[str, str, str]]) -> None:
+        assert parse_selector(selector) == expected
+
+    def test_repeated_parse_returns_independent_lists(self) -> None:
+        """Memoized results must not leak mutations between callers."""
+        first = parse_selector("app=web")
+        first.append(("extra", "=", "term"))
+        assert parse_selector("app=web") == [("app", "=", "web")]
 
 
 class TestMatchesSelector:
     """Tests for matches_selector()."""
 
-    def test_matching_labels_returns_true(self) -> None:
-        labels = {"app": "web", "env": "prod"}
+    def test_matching_labels_returns_true(
+        self, web_prod_labels: Mapping[str, str]
+    ) -> None:
+        labels = web_prod_labels
         selector = [("app", "=", "web")]
         assert matches_selector(labels, selector) is True
 
-    def test_non_matching_labels_returns_false(self) -> None:
-        labels = {"app": "web", "env": "prod"}
+    def test_non_matching_labels_returns_false(
+        self, web_prod_labels: Mapping[str, str]
+    ) -> None:
+        labels = web_prod_labels
         selector = [("app", "=", "api")]
         assert matches_selector(labels, selector) is False
 
@@ -61,8 +80,10 @@ class TestMatchesSelector:
         selector = [("app", "=", "web")]
         assert matches_selector(labels, selector) is False
 
-    def test_empty_selector_matches_everything(self) -> None:
-        labels = {"app": "web", "env": "prod"}
+    def test_empty_selector_matches_everything(
+        self, web_prod_labels: Mapping[str, str]
+    ) -> None:
+        labels = web_prod_labels
         assert matches_selector(labels, []) is True
 
     def test_empty_labels_with_empty_selector_matches(self) -> None:
@@ -92,65 +113,95 @@ class TestMatchesSelector:
         assert matches_selector(labels, [("key", "==", "value")]) is True
         assert matches_selector(labels, [("key", "==", "other")]) is False
 
-    def test_all_terms_must_match(self) -> None:
-        labels = {"app": "web", "env": "prod"}
+    def test_all_terms_must_match(self, web_prod_labels: Mapping[str, str]) -> None:
+        labels = web_prod_labels
         selector = [("app", "=", "web"), ("env", "=", "staging")]
         assert matches_selector(labels, selector) is False
 
-    def test_all_terms_match(self) -> None:
-        labels = {"app": "web", "env": "prod"}
+    def test_all_terms_match(self, web_prod_labels: Mapping[str, str]) -> None:
+        labels = web_prod_labels
         selector = [("app", "=", "web"), ("env", "=", "prod")]
         assert matches_selector(labels, selector) is True
 
 
-class TestValidateSelector:
-    """Tests for validate_selector() -- [SEC V-004]."""
+class TestBuildMatcher:
+    """Tests for build_matcher()."""
 
-    def test_rejects_command_injection(self) -> None:
-        with pytest.raises(ValueError, match="Invalid selector term"):
-            validate_selector("$(whoami)")
+    def test_equality_selector_matches(self) -> None:
+        matcher = build_matcher([("app", "=", "web"), ("env", "==", "prod")])
+        assert matcher({"app": "web", "env": "prod", "tier": "frontend"}) is True
 
-    def test_rejects_semicolon_injection(self) -> None:
-        with pytest.raises(ValueError, match="Invalid selector term"):
-            validate_selector(";rm -rf /")
+    def test_equality_selector_rejects_missing_key(self) -> None:
+        matcher = build_matcher([("app", "=", "web"), ("env", "=", "prod")])
+        assert matcher({"app": "web", "tier": "frontend"}) is False
+
+    def test_equality_selector_rejects_fewer_labels(self) -> None:
+        matcher = build_matcher([("app", "=", "web"), ("env", "=", "prod")])
+        assert matcher({"app": "web"}) is False
+
+    def test_empty_value_requires_key_present(self) -> None:
+        matcher = build_matcher([("app", "=", "")])
+        assert matcher({"app": ""}) is True
+        assert matcher({"other": ""}) is False
+
+    def test_duplicate_keys_fall_back_to_general_matching(self) -> None:
+        matcher = build_matcher([("app", "=", "web"), ("app", "=", "api")])
+        assert matcher({"app": "web"}) is False
 
-    def test_rejects_pipe_character(self) -> None:
+    def test_not_equal_selector_falls_back(self) -> None:
+        matcher = build_matcher([("app", "=", "web"), ("env", "!=", "prod")])
+        assert matcher({"app": "web"}) is True
+        assert matcher({"app": "web", "env": "prod"}) is False
+
+    def test_empty_selector_matches_everything(self) -> None:
+        assert build_matcher([])({}) is True
+
+
+class TestValidateSelector:
+    """Tests for validate_selector() -- [SEC V-004]."""
+
+    @pytest.mark.parametrize(
+        "bad",
+        [
+            "$(whoami)",
+            ";rm -rf /",
+            "key|value",
+            "`whoami`=value",
+            "key=value&other",
+        ],
+        ids=["command", "semicolon", "pipe", "backtick", "ampersand"],
+    )
+    def test_rejects_injection(self, bad: str) -> None:
         with pytest.raises(ValueError, match="Invalid selector term"):
-            validate_selector("key|value")
+            validate_selector(bad)
 
     def test_rejects_empty_terms(self) -> None:
         with pytest.raises(ValueError, match="Empty term"):
             validate_selector("key=val,,key2=val2")
 
     def test_rejects_too_many_terms(self) -> None:
-        terms = ",".join(f"k{idx}=v{idx}" for idx in range(21))
         with pytest.raises(ValueError, match="exceeding the maximum of 20"):
-            validate_selector(terms)
-
-    def test_accepts_kubernetes_domain_keys(self) -> None:
-        """Should not raise for valid Kubernetes domain-prefixed keys."""
-        validate_selector("app.kubernetes.io/name=foo")
+            validate_selector(_OVER_MAX_TERMS)
+
+    @pytest.mark.parametrize(
+        "good",
+        [
+            "app.kubernetes.io/name=foo",
+            "",
+            "my_app.v2=stable_release",
+            "key=",
+        ],
+        ids=[
+            "kubernetes-domain-key",
+            "empty-string",
+            "underscores-and-dots",
+            "empty-value",
+        ],
+    )
+    def test_accepts_valid_selector(self, good: str) -> None:
+        """Valid selectors, including the empty one (matches everything), do not raise."""
+        validate_selector(good)  # Should not raise
 
     def test_accepts_exactly_max_terms(self) -> None:
         """Exactly MAX_SELECTOR_TERMS should be accepted."""
-        terms = ",".join(f"k{idx}=v{idx}" for idx in range(20))
-        validate_selector(terms)  # Should not raise
-
-    def test_accepts_empty_string(self) -> None:
-        """Empty string is valid (matches everything)."""
-        validate_selector("")  # Should not raise
-
-    def test_rejects_backtick_injection(self) -> None:
-        with pytest.raises(ValueError, match="Invalid selector term"):
-            validate_selector("`whoami`=value")
-
-    def test_rejects_ampersand(self) -> None:
-        with pytest.raises(ValueError, match="Invalid selector term"):
-            validate_selector("key=value&other")
-
-    def test_accepts_underscores_and_dots(self) -> None:
-        validate_selector("my_app.v2=stable_release")  # Should not raise
-
-    def test_accepts_empty_value(self) -> None:
-        """A selector like 'key=' with empty value is valid."""
-        validate_selector("key=")  # Should not raise
+        validate_selector(_MAX_TERMS)  # Should not raise
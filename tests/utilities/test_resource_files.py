@@ -0,0 +1,140 @@
+# tests/utilities/test_resource_files.py
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from utilities.paths import discover_roots
+from utilities.resource_files import find_resource_files
+
+# ---------------------------------------------------------------------------
+# find_resource_files
+# ---------------------------------------------------------------------------
+
+
+class TestFindResourceFiles:
+    """Tests for find_resource_files()."""
+
+    @pytest.mark.parametrize(
+        ("namespace", "all_namespaces", "api_group", "plural", "name", "expected"),
+        [
+            # test-pod-1 exists in Pattern A1, A2 and B; Pattern A wins and it
+            # is listed once.  pods.yaml (list file) is found under A3.
+            pytest.param(
+                "test-ns",
+                False,
+                "core",
+                "pods",
+                None,
+                ["pods", "test-pod-1"],
+                id="pattern_a_and_b_dedup",
+            ),
+            pytest.param(
+                "test-ns",
+                False,
+                "core",
+                "pods",
+                "test-pod-1",
+                ["test-pod-1"],
+                id="specific_name",
+            ),
+            pytest.param(
+                "no-such-ns",
+                False,
+                "core",
+                "pods",
+                None,
+                [],
+                id="missing_namespace",
+            ),
+            pytest.param(
+                None,
+                True,
+                "core",
+                "pods",
+                None,
+                ["pods", "test-pod-1", "test-pod-3"],
+                id="all_namespaces",
+            ),
+            pytest.param(
+                None,
+                False,
+                "core",
+                "nodes",
+                None,
+                ["test-node-1"],
+                id="cluster_scoped",
+            ),
+            pytest.param(
+                "test-ns",
+                False,
+                "apps",
+                "deployments",
+                None,
+                ["test-deploy"],
+                id="apps_deployments",
+            ),
+        ],
+    )
+    def test_resource_lookup(
+        self,
+        gather_roots: list[Path],
+        namespace: str | None,
+        all_namespaces: bool,
+        api_group: str,
+        plural: str,
+        name: str | None,
+        expected: list[str],
+    ) -> None:
+        """find_resource_files returns exactly the expected files, each once."""
+        files = find_resource_files(
+            roots=gather_roots,
+            namespace=namespace,
+            all_namespaces=all_namespaces,
+            api_group=api_group,
+            plural=plural,
+            name=name,
+        )
+        assert sorted(fpath.stem for fpath in files) == expected
+
+    def test_skips_files_that_fail_path_validation(self, tmp_path: Path) -> None:
+        """[SEC V-002] find_resource_files skips files that fail path validation.
+
+        Creates a symlink inside the must-gather tree that points to a file
+        outside the root.  That symlink-based file must be skipped silently.
+        """
+        gather_dir = tmp_path / "must-gather-sec.test"
+        hash_dir = gather_dir / "sec-hash-001"
+        pods_dir = hash_dir / "namespaces" / "evil-ns" / "core" / "pods"
+        pods_dir.mkdir(parents=True)
+
+        # Create a real file outside the gather root.
+        outside = tmp_path / "outside-sec.test"
+        outside.mkdir()
+        outside_file = outside / "stolen.yaml"
+        outside_file.write_text(
+            "apiVersion: v1\nkind: Pod\nmetadata:\n  name: stolen\n", encoding="utf-8"
+        )
+
+        # Create a symlink inside the pods dir pointing outside root.
+        (pods_dir / "stolen.yaml").symlink_to(outside_file)
+
+        # Also create a legitimate file.
+        (pods_dir / "legit-pod.yaml").write_text(
+            "apiVersion: v1\nkind: Pod\nmetadata:\n  name: legit-pod\n",
+            encoding="utf-8",
+        )
+
+        roots = discover_roots([gather_dir])
+        files = find_resource_files(
+            roots=roots,
+            namespace="evil-ns",
+            all_namespaces=False,
+            api_group="core",
+            plural="pods",
+            name=None,
+        )
+        stems = {fpath.stem for fpath in files}
+        assert "legit-pod" in stems
+        assert "stolen" not in stems
@@ -4,7 +4,6 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
-import yaml
 
 from utilities.types import (
     get_kind_from_plural,
@@ -55,40 +54,44 @@ def test_pods_are_not_cluster_scoped() -> None:
 # ---------------------------------------------------------------------------
 # 6. All aliases resolve to correct plural form (parametrized)
 # ---------------------------------------------------------------------------
+_ALIAS_CASES: tuple[tuple[str, str, str], ...] = (
+    ("pod", "core", "pods"),
+    ("po", "core", "pods"),
+    ("pods", "core", "pods"),
+    ("svc", "core", "services"),
+    ("service", "core", "services"),
+    ("cm", "core", "configmaps"),
+    ("configmap", "core", "configmaps"),
+    ("secret", "core", "secrets"),
+    ("sa", "core", "serviceaccounts"),
+    ("pvc", "core", "persistentvolumeclaims"),
+    ("ev", "core", "events"),
+    ("no", "core", "nodes"),
+    ("ns", "core", "namespaces"),
+    ("pv", "core", "persistentvolumes"),
+    ("rc", "core", "replicationcontrollers"),
+    ("ep", "core", "endpoints"),
+    ("deploy", "apps", "deployments"),
+    ("deployment", "apps", "deployments"),
+    ("rs", "apps", "replicasets"),
+    ("sts", "apps", "statefulsets"),
+    ("ds", "apps", "daemonsets"),
+    ("job", "batch", "jobs"),
+    ("cj", "batch", "cronjobs"),
+    ("ing", "networking.k8s.io", "ingresses"),
+    ("netpol", "networking.k8s.io", "networkpolicies"),
+    ("role", "rbac.authorization.k8s.io", "roles"),
+    ("clusterrole", "rbac.authorization.k8s.io", "clusterroles"),
+    ("route", "route.openshift.io", "routes"),
+    ("hpa", "autoscaling", "horizontalpodautoscalers"),
+    ("pdb", "policy", "poddisruptionbudgets"),
+)
+
+
 @pytest.mark.parametrize(
     ("alias", "expected_api_group", "expected_plural"),
-    [
-        ("pod", "core", "pods"),
-        ("po", "core", "pods"),
-        ("pods", "core", "pods"),
-        ("svc", "core", "services"),
-        ("service", "core", "services"),
-        ("cm", "core", "configmaps"),
-        ("configmap", "core", "configmaps"),
-        ("secret", "core", "secrets"),
-        ("sa", "core", "serviceaccounts"),
-        ("pvc", "core", "persistentvolumeclaims"),
-        ("ev", "core", "events"),
-        ("no", "core", "nodes"),
-        ("ns", "core", "namespaces"),
-        ("pv", "core", "persistentvolumes"),
-        ("rc", "core", "replicationcontrollers"),
-        ("ep", "core", "endpoints"),
-        ("deploy", "apps", "deployments"),
-        ("deployment", "apps", "deployments"),
-        ("rs", "apps", "replicasets"),
-        ("sts", "apps", "statefulsets"),
-        ("ds", "apps", "daemonsets"),
-        ("job", "batch", "jobs"),
-        ("cj", "batch", "cronjobs"),
-        ("ing", "networking.k8s.io", "ingresses"),
-        ("netpol", "networking.k8s.io", "networkpolicies"),
-        ("role", "rbac.authorization.k8s.io", "roles"),
-        ("clusterrole", "rbac.authorization.k8s.io", "clusterroles"),
-        ("route", "route.openshift.io", "routes"),
-        ("hpa", "autoscaling", "horizontalpodautoscalers"),
-        ("pdb", "policy", "poddisruptionbudgets"),
-    ],
+    _ALIAS_CASES,
+    ids=[alias for alias, _, _ in _ALIAS_CASES],
 )
 def test_alias_resolves_to_correct_plural(
     alias: str, expected_api_group: str, expected_plural: str
@@ -100,39 +103,43 @@ def test_alias_resolves_to_correct_plural(
 
 # ---------------------------------------------------------------------------
 # 7. Config YAML with missing `aliases` key still loads (tmp_path fixture)
-# ---------------------------------------------------------------------------
-def test_missing_aliases_key_still_loads(tmp_path: Path) -> None:
-    resource_map_path = tmp_path / "resource_map.yaml"
-    resource_map_path.write_text(
-        yaml.dump({"widgets": {"api_group": "example.test"}}),
-        encoding="utf-8",
-    )
-
-    # Clear the lru_cache so the custom path is picked up.
-    load_resource_map.cache_clear()
-    try:
-        result = load_resource_map(resource_map_path)
-    finally:
-        load_resource_map.cache_clear()
-
-    assert "widgets" in result
-    assert result["widgets"] == ("example.test", "widgets")
-
-
-# ---------------------------------------------------------------------------
 # 8. Empty resource_map.yaml results in empty map (tmp_path fixture)
+# 9. Mixed-case plural names and aliases are stored lowercased
+# 10. Non-string YAML keys are stored as strings
 # ---------------------------------------------------------------------------
-def test_empty_resource_map_returns_empty(tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        (
+            b"widgets:\n  api_group: example.test\n",
+            {"widgets": ("example.test", "widgets")},
+        ),
+        (b"", {}),
+        (
+            b"Widgets:\n  api_group: example.test\n  aliases: [WD]\n",
+            {
+                "widgets": ("example.test", "Widgets"),
+                "wd": ("example.test", "Widgets"),
+            },
+        ),
+        (
+            b"123:\n  api_group: example.test\n  aliases: [456]\n",
+            {
+                "123": ("example.test", "123"),
+                "456": ("example.test", "123"),
+            },
+        ),
+    ],
+    ids=["missing_aliases_key", "empty_file", "mixed_case_keys", "non_string_keys"],
+)
+def test_load_resource_map_variants(
+    tmp_path: Path, body: bytes, expected: dict[str, tuple[str, str]]
+) -> None:
     resource_map_path = tmp_path / "resource_map.yaml"
-    resource_map_path.write_text("", encoding="utf-8")
-
-    load_resource_map.cache_clear()
-    try:
-        result = load_resource_map(resource_map_path)
-    finally:
-        load_resource_map.cache_clear()
+    resource_map_path.write_bytes(body)
 
-    assert result == {}
+    # Call the uncached function so the cached production map is not evicted.
+    assert load_resource_map.__wrapped__(resource_map_path) == expected
 
 
 # ---------------------------------------------------------------------------
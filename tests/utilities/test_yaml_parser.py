@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+import re
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -11,14 +12,23 @@ import yaml
 
 from utilities.yaml_parser import (
     MAX_YAML_SIZE,
+    SAFE_LOADER,
     check_file_size,
     extract_metadata,
     load_resource,
     load_resource_list,
+    safe_dump,
+    safe_load,
+)
+
+# [SEC V-006] A source line calling yaml.load( without also calling
+# yaml.safe_load( on the same line.  Matches the whole line.
+_UNSAFE_YAML_LOAD = re.compile(
+    rb"^(?!.*yaml\.safe_load\().*yaml\.load\(.*$", re.MULTILINE
 )
 
 
-STANDARD_POD_YAML = """\
+STANDARD_POD_YAML = b"""\
 apiVersion: v1
 kind: Pod
 metadata:
@@ -36,7 +46,7 @@ status:
   phase: Running
 """
 
-POD_LIST_YAML = """\
+POD_LIST_YAML = b"""\
 apiVersion: v1
 kind: PodList
 metadata:
@@ -54,7 +64,7 @@ items:
       namespace: test-ns
 """
 
-INVALID_YAML = """\
+INVALID_YAML = b"""\
 apiVersion: v1
 kind: Pod
 metadata:
@@ -63,14 +73,28 @@ metadata:
 """
 
 
+@pytest.fixture(scope="session")
+def standard_pod_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """STANDARD_POD_YAML written once per session; tests only read it."""
+    yaml_file = tmp_path_factory.mktemp("yaml_parser") / "pod.yaml"
+    yaml_file.write_bytes(STANDARD_POD_YAML)
+    return yaml_file
+
+
+@pytest.fixture(scope="session")
+def small_yaml_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A tiny valid YAML file for the size tests, which patch its stat size."""
+    yaml_file = tmp_path_factory.mktemp("yaml_parser") / "small.yaml"
+    yaml_file.write_bytes(b"key: value")
+    return yaml_file
+
+
 class TestLoadResource:
     """Tests for load_resource function."""
 
-    def test_parses_standard_pod_yaml(self, tmp_path: Path) -> None:
+    def test_parses_standard_pod_yaml(self, standard_pod_file: Path) -> None:
         """load_resource parses a standard pod YAML."""
-        yaml_file = tmp_path / "pod.yaml"
-        yaml_file.write_text(STANDARD_POD_YAML, encoding="utf-8")
-        result = load_resource(yaml_file)
+        result = load_resource(standard_pod_file)
         assert result["apiVersion"] == "v1"
         assert result["kind"] == "Pod"
         assert result["metadata"]["name"] == "test-pod"
@@ -82,9 +106,9 @@ class TestLoadResource:
         self, tmp_path: Path
     ) -> None:
         """load_resource handles YAML starting with ---."""
-        yaml_content = "---\n" + STANDARD_POD_YAML
+        yaml_content = b"---\n" + STANDARD_POD_YAML
         yaml_file = tmp_path / "pod-with-separator.yaml"
-        yaml_file.write_text(yaml_content, encoding="utf-8")
+        yaml_file.write_bytes(yaml_content)
         result = load_resource(yaml_file)
         assert result["kind"] == "Pod"
         assert result["metadata"]["name"] == "test-pod"
@@ -92,19 +116,17 @@ class TestLoadResource:
     def test_invalid_yaml_raises_exception(self, tmp_path: Path) -> None:
         """load_resource with invalid YAML raises an exception."""
         yaml_file = tmp_path / "invalid.yaml"
-        yaml_file.write_text(INVALID_YAML, encoding="utf-8")
+        yaml_file.write_bytes(INVALID_YAML)
         with pytest.raises(yaml.YAMLError):
             load_resource(yaml_file)
 
-    def test_rejects_file_exceeding_max_yaml_size(self, tmp_path: Path) -> None:
+    def test_rejects_file_exceeding_max_yaml_size(self, small_yaml_file: Path) -> None:
         """[SEC V-001] load_resource rejects file exceeding MAX_YAML_SIZE."""
-        yaml_file = tmp_path / "large.yaml"
-        yaml_file.write_text("key: value", encoding="utf-8")
         oversized = MAX_YAML_SIZE + 1
         fake_stat_result = os.stat_result((0o100644, 0, 0, 0, 0, 0, oversized, 0, 0, 0))
-        with patch.object(Path, "stat", return_value=fake_stat_result):
+        with patch("os.fstat", return_value=fake_stat_result):
             with pytest.raises(ValueError, match="exceeding the maximum allowed size"):
-                load_resource(yaml_file)
+                load_resource(small_yaml_file)
 
 
 class TestLoadResourceList:
@@ -113,17 +135,17 @@ class TestLoadResourceList:
     def test_extracts_items_from_pod_list(self, tmp_path: Path) -> None:
         """load_resource_list extracts items from a PodList."""
         yaml_file = tmp_path / "podlist.yaml"
-        yaml_file.write_text(POD_LIST_YAML, encoding="utf-8")
+        yaml_file.write_bytes(POD_LIST_YAML)
         result = load_resource_list(yaml_file)
         assert len(result) == 2
         assert result[0]["metadata"]["name"] == "pod-a"
         assert result[1]["metadata"]["name"] == "pod-b"
 
-    def test_single_resource_returns_list_with_resource(self, tmp_path: Path) -> None:
+    def test_single_resource_returns_list_with_resource(
+        self, standard_pod_file: Path
+    ) -> None:
         """load_resource_list with single resource (non-list) returns [resource]."""
-        yaml_file = tmp_path / "single-pod.yaml"
-        yaml_file.write_text(STANDARD_POD_YAML, encoding="utf-8")
-        result = load_resource_list(yaml_file)
+        result = load_resource_list(standard_pod_file)
         assert len(result) == 1
         assert result[0]["kind"] == "Pod"
         assert result[0]["metadata"]["name"] == "test-pod"
@@ -192,6 +214,20 @@ class TestSecurityV006SafeLoad:
         with pytest.raises(yaml.YAMLError):
             load_resource(yaml_file)
 
+    def test_safe_loader_prefers_libyaml(self) -> None:
+        """[SEC V-006] SAFE_LOADER is a safe loader, using libyaml when present."""
+        if yaml.__with_libyaml__:
+            assert SAFE_LOADER is yaml.CSafeLoader
+        else:
+            assert SAFE_LOADER is yaml.SafeLoader
+
+    def test_safe_dump_round_trips(self) -> None:
+        """safe_dump output parses back to the same data."""
+        data = {"pods": {"api_group": "core", "aliases": ["po"]}, "empty": []}
+        dumped = safe_dump(data, default_flow_style=False, sort_keys=True)
+        assert dumped.startswith("empty: []\n")
+        assert safe_load(dumped) == data
+
     def test_no_unsafe_yaml_load_in_source(self) -> None:
         """[SEC V-006] Grep all source files: yaml.load( without safe_ MUST NOT exist."""
         project_root = Path(__file__).resolve().parent.parent.parent
@@ -201,11 +237,15 @@ class TestSecurityV006SafeLoad:
             if not source_dir.exists():
                 continue
             for python_file in source_dir.rglob("*.py"):
-                content = python_file.read_text(encoding="utf-8")
-                for line_num, line in enumerate(content.splitlines(), start=1):
-                    # Check for yaml.load( but exclude yaml.safe_load(
-                    if "yaml.load(" in line and "yaml.safe_load(" not in line:
-                        violations.append(f"{python_file}:{line_num}: {line.strip()}")
+                content = python_file.read_bytes()
+                # Plain substring prefilter: most files never mention it.
+                if b"yaml.load(" not in content:
+                    continue
+                for match in _UNSAFE_YAML_LOAD.finditer(content):
+                    # Line numbers are only worked out for actual hits.
+                    line_num = content.count(b"\n", 0, match.start()) + 1
+                    line = match.group().decode("utf-8").strip()
+                    violations.append(f"{python_file}:{line_num}: {line}")
         assert violations == [], (
             "[SEC V-006] Found unsafe yaml.load() calls:\n" + "\n".join(violations)
         )
@@ -214,36 +254,43 @@ class TestSecurityV006SafeLoad:
 class TestSecurityV001FileSize:
     """[SEC V-001] Tests for file size checking."""
 
-    def test_check_file_size_raises_on_101mb(self, tmp_path: Path) -> None:
+    def test_check_file_size_raises_on_101mb(self, small_yaml_file: Path) -> None:
         """[SEC V-001] check_file_size raises on 101MB file."""
-        yaml_file = tmp_path / "huge.yaml"
-        yaml_file.write_text("key: value", encoding="utf-8")
         size_101mb = 101 * 1024 * 1024
         fake_stat_result = os.stat_result(
             (0o100644, 0, 0, 0, 0, 0, size_101mb, 0, 0, 0)
         )
-        with patch.object(Path, "stat", return_value=fake_stat_result):
+        with patch("os.stat", return_value=fake_stat_result):
             with pytest.raises(ValueError, match="exceeding the maximum allowed size"):
-                check_file_size(yaml_file)
+                check_file_size(small_yaml_file)
 
-    def test_check_file_size_passes_on_99mb(self, tmp_path: Path) -> None:
+    def test_check_file_size_passes_on_99mb(self, small_yaml_file: Path) -> None:
         """[SEC V-001] check_file_size passes on 99MB file."""
-        yaml_file = tmp_path / "ok.yaml"
-        yaml_file.write_text("key: value", encoding="utf-8")
         size_99mb = 99 * 1024 * 1024
         fake_stat_result = os.stat_result((0o100644, 0, 0, 0, 0, 0, size_99mb, 0, 0, 0))
-        with patch.object(Path, "stat", return_value=fake_stat_result):
+        with patch("os.stat", return_value=fake_stat_result):
             # Should not raise
-            check_file_size(yaml_file)
+            check_file_size(small_yaml_file)
 
-    def test_check_file_size_passes_on_exactly_100mb(self, tmp_path: Path) -> None:
+    def test_check_file_size_passes_on_exactly_100mb(
+        self, small_yaml_file: Path
+    ) -> None:
         """[SEC V-001] check_file_size passes on exactly 100MB (boundary)."""
-        yaml_file = tmp_path / "boundary.yaml"
-        yaml_file.write_text("key: value", encoding="utf-8")
         size_100mb = 100 * 1024 * 1024
         fake_stat_result = os.stat_result(
             (0o100644, 0, 0, 0, 0, 0, size_100mb, 0, 0, 0)
         )
-        with patch.object(Path, "stat", return_value=fake_stat_result):
+        with patch("os.stat", return_value=fake_stat_result):
             # Exactly 100MB should pass (limit is > not >=)
-            check_file_size(yaml_file)
+            check_file_size(small_yaml_file)
+
+    def test_check_file_size_follows_symlinks(self, tmp_path: Path) -> None:
+        """[SEC V-001] A symlink is checked against the size of its target."""
+        target = tmp_path / "huge.yaml"
+        with open(target, "wb") as fhandle:
+            # Sparse file: the size is set without writing 100MB of data.
+            fhandle.truncate(MAX_YAML_SIZE + 1)
+        link = tmp_path / "link.yaml"
+        link.symlink_to(target)
+        with pytest.raises(ValueError, match="exceeding the maximum allowed size"):
+            check_file_size(link)
@@ -2,14 +2,16 @@
 from __future__ import annotations
 
 import base64
+import functools
+import os
+import subprocess
+import sys
 import tempfile
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from tests.constants import (
     CREATION_TIMESTAMP,
     IMAGE_HASH,
@@ -31,6 +33,7 @@ from tests.constants import (
     POD_3_NAME,
     POD_3_NS,
 )
+from utilities.yaml_parser import safe_dump
 
 
 @contextmanager
@@ -50,19 +53,35 @@ def write_file() -> Generator[Path, None, None]:
         yield Path(tmp_dir)
 
 
-def emit_file(path: Path, content: str) -> None:
-    """Create parent directories and write *content* to *path*."""
+def emit_file(path: Path, content: str | bytes) -> None:
+    """Create parent directories and write *content* to *path*.
+
+    A str is written as UTF-8; bytes are written as-is.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    path.write_bytes(content if isinstance(content, bytes) else content.encode())
 
 
-def build_pod_yaml(
+def emit_files(files: Iterable[tuple[Path, str | bytes]]) -> None:
+    """Write every ``(path, content)`` pair, creating each parent directory once.
+
+    Like calling :func:`emit_file` per pair, but files that share a parent
+    do not each repeat the ``mkdir`` chain.
+    """
+    files = list(files)
+    for parent in {path.parent for path, _ in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    for path, content in files:
+        path.write_bytes(content if isinstance(content, bytes) else content.encode())
+
+
+def build_pod_dict(
     name: str,
     namespace: str,
     labels: dict[str, str] | None = None,
     containers: list[dict[str, str]] | None = None,
-) -> str:
-    """Return a minimal but realistic Pod YAML string.
+) -> dict[str, Any]:
+    """Return a minimal but realistic Pod resource dict.
 
     Args:
         name: Pod name.
@@ -109,9 +128,24 @@ def build_pod_yaml(
             "containerStatuses": container_statuses,
         },
     }
-    return yaml.dump(pod_dict, default_flow_style=False, sort_keys=False)
+    return pod_dict
+
+
+def build_pod_yaml(
+    name: str,
+    namespace: str,
+    labels: dict[str, str] | None = None,
+    containers: list[dict[str, str]] | None = None,
+) -> str:
+    """Return a minimal but realistic Pod YAML string.
+
+    Takes the same arguments as :func:`build_pod_dict`.
+    """
+    pod_dict = build_pod_dict(name, namespace, labels=labels, containers=containers)
+    return safe_dump(pod_dict, default_flow_style=False, sort_keys=False)
 
 
+@functools.cache
 def build_deployment_yaml(name: str, namespace: str) -> str:
     """Return a minimal Deployment YAML string."""
     deploy_dict: dict[str, Any] = {
@@ -144,7 +178,11 @@ def build_deployment_yaml(name: str, namespace: str) -> str:
             "availableReplicas": 1,
         },
     }
-    return yaml.dump(deploy_dict, default_flow_style=False, sort_keys=False)
+    return safe_dump(deploy_dict, default_flow_style=False, sort_keys=False)
+
+
+# Encoded form of the default ``{"password": "super-secret"}`` secret data.
+_DEFAULT_SECRET_DATA = {"password": base64.b64encode(b"super-secret").decode("ascii")}
 
 
 def build_secret_yaml(
@@ -164,12 +202,12 @@ def build_secret_yaml(
             automatically.
     """
     if data is None:
-        data = {"password": "super-secret"}
-
-    encoded_data = {
-        key: base64.b64encode(val.encode("utf-8")).decode("ascii")
-        for key, val in data.items()
-    }
+        encoded_data = dict(_DEFAULT_SECRET_DATA)
+    else:
+        encoded_data = {
+            key: base64.b64encode(val.encode("utf-8")).decode("ascii")
+            for key, val in data.items()
+        }
 
     last_applied: dict[str, Any] = {
         "apiVersion": "v1",
@@ -185,7 +223,7 @@ def build_secret_yaml(
             "name": name,
             "namespace": namespace,
             "annotations": {
-                "kubectl.kubernetes.io/last-applied-configuration": yaml.dump(
+                "kubectl.kubernetes.io/last-applied-configuration": safe_dump(
                     last_applied,
                     default_flow_style=False,
                     sort_keys=False,
@@ -196,9 +234,10 @@ def build_secret_yaml(
         "type": "Opaque",
         "data": encoded_data,
     }
-    return yaml.dump(secret_dict, default_flow_style=False, sort_keys=False)
+    return safe_dump(secret_dict, default_flow_style=False, sort_keys=False)
 
 
+@functools.cache
 def build_namespace_yaml(name: str) -> str:
     """Return a minimal Namespace YAML string."""
     namespace_dict: dict[str, Any] = {
@@ -213,9 +252,10 @@ def build_namespace_yaml(name: str) -> str:
             "phase": "Active",
         },
     }
-    return yaml.dump(namespace_dict, default_flow_style=False, sort_keys=False)
+    return safe_dump(namespace_dict, default_flow_style=False, sort_keys=False)
 
 
+@functools.cache
 def build_configmap_yaml(name: str, namespace: str) -> str:
     """Return a minimal ConfigMap YAML string."""
     configmap_dict: dict[str, Any] = {
@@ -230,9 +270,10 @@ def build_configmap_yaml(name: str, namespace: str) -> str:
             "config.yaml": "key: value\n",
         },
     }
-    return yaml.dump(configmap_dict, default_flow_style=False, sort_keys=False)
+    return safe_dump(configmap_dict, default_flow_style=False, sort_keys=False)
 
 
+@functools.cache
 def build_node_yaml(name: str) -> str:
     """Return a minimal Node YAML string."""
     node_dict: dict[str, Any] = {
@@ -256,7 +297,7 @@ def build_node_yaml(name: str) -> str:
             ],
         },
     }
-    return yaml.dump(node_dict, default_flow_style=False, sort_keys=False)
+    return safe_dump(node_dict, default_flow_style=False, sort_keys=False)
 
 
 def build_pod_list_yaml(pods: list[dict[str, Any]]) -> str:
@@ -269,7 +310,7 @@ def build_pod_list_yaml(pods: list[dict[str, Any]]) -> str:
         },
         "items": pods,
     }
-    return yaml.dump(pod_list_dict, default_flow_style=False, sort_keys=False)
+    return safe_dump(pod_list_dict, default_flow_style=False, sort_keys=False)
 
 
 def populate_must_gather(base_path: Path) -> Path:
@@ -282,69 +323,84 @@ def populate_must_gather(base_path: Path) -> Path:
     """
     root = base_path / MUST_GATHER_DIR_NAME
     image_dir = root / IMAGE_HASH
+    files: list[tuple[Path, str | bytes]] = []
 
-    emit_file(image_dir / "version", OCP_VERSION)
+    files.append((image_dir / "version", OCP_VERSION))
 
     ns_dir = image_dir / "namespaces" / "test-ns"
-    emit_file(ns_dir / "test-ns.yaml", build_namespace_yaml("test-ns"))
+    files.append((ns_dir / "test-ns.yaml", build_namespace_yaml("test-ns")))
 
-    pod1_yaml = build_pod_yaml(
+    pod1_dict = build_pod_dict(
         POD_1_NAME,
         POD_1_NS,
         labels=POD_1_LABELS,
         containers=POD_1_CONTAINERS,
     )
-    emit_file(ns_dir / "core" / "pods" / POD_1_NAME / f"{POD_1_NAME}.yaml", pod1_yaml)
-    emit_file(ns_dir / "pods" / POD_1_NAME / f"{POD_1_NAME}.yaml", pod1_yaml)
+    # Written three times (Pattern A1, A2 and B), so encode it once.
+    pod1_yaml = safe_dump(pod1_dict, default_flow_style=False, sort_keys=False).encode()
+    files.append(
+        (ns_dir / "core" / "pods" / POD_1_NAME / f"{POD_1_NAME}.yaml", pod1_yaml)
+    )
+    files.append((ns_dir / "pods" / POD_1_NAME / f"{POD_1_NAME}.yaml", pod1_yaml))
     log_base_1 = (
         ns_dir / "core" / "pods" / POD_1_NAME / "container-a" / "container-a" / "logs"
     )
-    emit_file(log_base_1 / "current.log", "log line 1\nlog line 2\n")
-    emit_file(log_base_1 / "previous.log", "previous log\n")
+    files.append((log_base_1 / "current.log", "log line 1\nlog line 2\n"))
+    files.append((log_base_1 / "previous.log", "previous log\n"))
 
-    pod2_yaml = build_pod_yaml(POD_2_NAME, POD_2_NS, containers=POD_2_CONTAINERS)
-    emit_file(ns_dir / "core" / "pods" / POD_2_NAME / f"{POD_2_NAME}.yaml", pod2_yaml)
-    emit_file(ns_dir / "pods" / POD_2_NAME / f"{POD_2_NAME}.yaml", pod2_yaml)
+    pod2_dict = build_pod_dict(POD_2_NAME, POD_2_NS, containers=POD_2_CONTAINERS)
+    pod2_yaml = safe_dump(pod2_dict, default_flow_style=False, sort_keys=False).encode()
+    files.append(
+        (ns_dir / "core" / "pods" / POD_2_NAME / f"{POD_2_NAME}.yaml", pod2_yaml)
+    )
+    files.append((ns_dir / "pods" / POD_2_NAME / f"{POD_2_NAME}.yaml", pod2_yaml))
     log_base_2x = (
         ns_dir / "core" / "pods" / POD_2_NAME / "container-x" / "container-x" / "logs"
     )
-    emit_file(log_base_2x / "current.log", "container-x log line 1\n")
+    files.append((log_base_2x / "current.log", "container-x log line 1\n"))
     log_base_2y = (
         ns_dir / "core" / "pods" / POD_2_NAME / "container-y" / "container-y" / "logs"
     )
-    emit_file(log_base_2y / "current.log", "container-y log line 1\n")
+    files.append((log_base_2y / "current.log", "container-y log line 1\n"))
 
-    pod1_dict = yaml.safe_load(pod1_yaml)
-    pod2_dict = yaml.safe_load(pod2_yaml)
-    emit_file(
-        ns_dir / "core" / "pods.yaml", build_pod_list_yaml([pod1_dict, pod2_dict])
+    files.append(
+        (ns_dir / "core" / "pods.yaml", build_pod_list_yaml([pod1_dict, pod2_dict]))
     )
 
-    emit_file(
-        ns_dir / "core" / "secrets" / "test-secret.yaml",
-        build_secret_yaml("test-secret", "test-ns"),
+    files.append(
+        (
+            ns_dir / "core" / "secrets" / "test-secret.yaml",
+            build_secret_yaml("test-secret", "test-ns"),
+        )
     )
-    emit_file(
-        ns_dir / "core" / "configmaps" / "test-cm.yaml",
-        build_configmap_yaml("test-cm", "test-ns"),
+    files.append(
+        (
+            ns_dir / "core" / "configmaps" / "test-cm.yaml",
+            build_configmap_yaml("test-cm", "test-ns"),
+        )
     )
-    emit_file(
-        ns_dir / "apps" / "deployments" / "test-deploy.yaml",
-        build_deployment_yaml("test-deploy", "test-ns"),
+    files.append(
+        (
+            ns_dir / "apps" / "deployments" / "test-deploy.yaml",
+            build_deployment_yaml("test-deploy", "test-ns"),
+        )
     )
 
     ns2_dir = image_dir / "namespaces" / "test-ns-2"
     pod3_yaml = build_pod_yaml(POD_3_NAME, POD_3_NS, containers=POD_3_CONTAINERS)
-    emit_file(ns2_dir / "core" / "pods" / POD_3_NAME / f"{POD_3_NAME}.yaml", pod3_yaml)
+    files.append(
+        (ns2_dir / "core" / "pods" / POD_3_NAME / f"{POD_3_NAME}.yaml", pod3_yaml)
+    )
 
     pattern_b_dir = (
         image_dir / "namespaces" / "all" / "namespaces" / "test-ns" / "core" / "pods"
     )
-    emit_file(pattern_b_dir / f"{POD_1_NAME}.yaml", pod1_yaml)
+    files.append((pattern_b_dir / f"{POD_1_NAME}.yaml", pod1_yaml))
 
     cluster_dir = image_dir / "cluster-scoped-resources" / "core" / "nodes"
-    emit_file(cluster_dir / "test-node-1.yaml", build_node_yaml("test-node-1"))
+    files.append((cluster_dir / "test-node-1.yaml", build_node_yaml("test-node-1")))
 
+    emit_files(files)
     return root
 
 
@@ -357,7 +413,8 @@ def populate_must_gather_multi(base_path: Path) -> tuple[Path, Path]:
 
     odf_root = base_path / "gather-odf" / MUST_GATHER_ODF_DIR_NAME
     odf_image = odf_root / IMAGE_HASH_ODF
-    emit_file(odf_image / "version", OCP_VERSION)
+    files: list[tuple[Path, str | bytes]] = []
+    files.append((odf_image / "version", OCP_VERSION))
 
     odf_ns = odf_image / "namespaces" / "openshift-storage"
     odf_pod_yaml = build_pod_yaml(
@@ -366,13 +423,34 @@ def populate_must_gather_multi(base_path: Path) -> tuple[Path, Path]:
         labels={"app": "odf-operator"},
         containers=[{"name": "odf-main"}],
     )
-    emit_file(
-        odf_ns / "core" / "pods" / "odf-pod-1" / "odf-pod-1.yaml",
-        odf_pod_yaml,
+    files.append(
+        (
+            odf_ns / "core" / "pods" / "odf-pod-1" / "odf-pod-1.yaml",
+            odf_pod_yaml,
+        )
     )
     odf_log_dir = (
         odf_ns / "core" / "pods" / "odf-pod-1" / "odf-main" / "odf-main" / "logs"
     )
-    emit_file(odf_log_dir / "current.log", "odf log line 1\n")
+    files.append((odf_log_dir / "current.log", "odf log line 1\n"))
 
+    emit_files(files)
     return ocp_root, odf_root
+
+
+def run_hook(hook_name: str, payload: str) -> subprocess.CompletedProcess[str]:
+    """Run the ``.claude/hooks/<hook_name>`` script with *payload* on stdin.
+
+    *payload* is the raw hook JSON, so tests can also feed malformed or
+    partial input.  Returns the completed process with text output.
+    """
+    hook_path = os.path.join(
+        Path(__file__).parent.parent, ".claude", "hooks", hook_name
+    )
+    return subprocess.run(
+        [sys.executable, hook_path],
+        input=payload,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
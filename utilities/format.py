@@ -1,56 +1,130 @@
 # utilities/format.py
 from __future__ import annotations
 
-import copy
+import functools
+import re
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, TextIO
 
 
 # [SEC V-003] Resource kinds whose data field is redacted by default.
-SENSITIVE_RESOURCE_KINDS: set[str] = {"Secret"}
-
-# [SEC V-003] Key patterns that indicate sensitive values.
-SENSITIVE_KEY_PATTERNS: set[str] = {
-    "password",
-    "token",
-    "secret",
-    "api_key",
-    "apikey",
-    "private_key",
-    "ssh_key",
-    "certificate",
-    "credentials",
-}
+SENSITIVE_RESOURCE_KINDS: frozenset[str] = frozenset({"Secret"})
+
+# [SEC V-003] Key patterns that indicate sensitive values.  Frozen because
+# _SENSITIVE_KEY_RE is compiled from it once at import.
+SENSITIVE_KEY_PATTERNS: frozenset[str] = frozenset(
+    {
+        "password",
+        "token",
+        "secret",
+        "api_key",
+        "apikey",
+        "private_key",
+        "ssh_key",
+        "certificate",
+        "credentials",
+    }
+)
+
+# All of SENSITIVE_KEY_PATTERNS as one alternation, so a key is scanned once
+# rather than once per pattern.
+_SENSITIVE_KEY_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in sorted(SENSITIVE_KEY_PATTERNS))
+)
 
 # Annotation key that may contain inline secrets.
 _LAST_APPLIED_CONFIG_KEY = "kubectl.kubernetes.io/last-applied-configuration"
 
 
+@functools.lru_cache(maxsize=1024)
 def _key_is_sensitive(key: str) -> bool:
-    """Return True if the lowercased key contains any sensitive pattern."""
-    lowered = key.lower()
-    return any(pattern in lowered for pattern in SENSITIVE_KEY_PATTERNS)
-
-
-def _redact_dict(obj: dict[str, Any]) -> None:
-    """Recursively walk a dict, redacting values for sensitive keys in place."""
-    for key in list(obj.keys()):
-        value = obj[key]
-        if _key_is_sensitive(key):
-            obj[key] = "<REDACTED>"
-        elif isinstance(value, dict):
-            _redact_dict(value)
-        elif isinstance(value, list):
-            _redact_list(value)
+    """Return True if the lowercased key contains any sensitive pattern.
+
+    The same few field names repeat across every resource, so results are
+    cached and most keys skip both the ``lower()`` copy and the search.
+    """
+    return _SENSITIVE_KEY_RE.search(key.lower()) is not None
+
+
+def _redact_copying_children(root: dict[str, Any] | list[Any]) -> None:
+    """Redact sensitive keys under *root*, which must be a fresh copy.
 
+    *root* is modified in place.  Every nested dict and list below it is
+    replaced by a shallow ``dict()`` or ``list()`` copy as it is reached, so
+    the original tree is never touched; scalar leaves are shared, and
+    subtrees under a sensitive key are dropped rather than copied.  The walk
+    uses an explicit stack rather than recursion, so deeply nested resources
+    cost no Python call per level.
+
+    Like ``copy.deepcopy``, containers already copied are remembered by
+    ``id()`` and their copy is reused, so YAML aliases keep sharing one copy
+    and a self-referencing document terminates instead of looping forever.
+    """
+    copies: dict[int, dict[str, Any] | list[Any]] = {}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            # Replacing the value of an existing key does not disturb the
+            # iteration over items().
+            for key, value in node.items():
+                if _key_is_sensitive(key):
+                    node[key] = "<REDACTED>"
+                elif isinstance(value, (dict, list)):
+                    node[key] = _copy_container(value, copies=copies, stack=stack)
+        else:
+            for idx, item in enumerate(node):
+                if isinstance(item, (dict, list)):
+                    node[idx] = _copy_container(item, copies=copies, stack=stack)
 
-def _redact_list(items: list[Any]) -> None:
-    """Recursively walk a list, redacting sensitive keys in any nested dicts."""
-    for item in items:
-        if isinstance(item, dict):
-            _redact_dict(obj=item)
-        elif isinstance(item, list):
-            _redact_list(item)
+
+def _copy_container(
+    value: dict[str, Any] | list[Any],
+    copies: dict[int, dict[str, Any] | list[Any]],
+    stack: list[dict[str, Any] | list[Any]],
+) -> dict[str, Any] | list[Any]:
+    """Return the shallow copy of *value* for :func:`_redact_copying_children`.
+
+    The first time *value* is seen its copy is recorded in *copies* and
+    queued on *stack* to have its own children copied; later visits reuse it.
+    """
+    child = copies.get(id(value))
+    if child is None:
+        child = dict(value) if isinstance(value, dict) else list(value)
+        copies[id(value)] = child
+        stack.append(child)
+    return child
+
+
+def _redact_top_level(resource: dict[str, Any]) -> dict[str, Any]:
+    """Return a shallow copy of *resource* with the top-level redaction rules applied.
+
+    Only the containers on the path to a redacted value are copied; everything
+    else is shared with *resource*.  Rule 2 (sensitive key names) is not
+    applied here.
+    """
+    result = dict(resource)
+
+    # Rule 1: Redact Secret data/stringData values.
+    kind = result.get("kind", "")
+    if kind in SENSITIVE_RESOURCE_KINDS:
+        for field_name in ("data", "stringData"):
+            field = result.get(field_name)
+            if isinstance(field, dict):
+                result[field_name] = dict.fromkeys(field, "<REDACTED>")
+
+    # Rule 3: Redact last-applied-configuration annotation.
+    metadata = result.get("metadata")
+    if isinstance(metadata, dict):
+        annotations = metadata.get("annotations")
+        if isinstance(annotations, dict) and _LAST_APPLIED_CONFIG_KEY in annotations:
+            result["metadata"] = {
+                **metadata,
+                "annotations": {**annotations, _LAST_APPLIED_CONFIG_KEY: "<REDACTED>"},
+            }
+
+    return result
 
 
 def redact_sensitive_fields(
@@ -72,26 +146,11 @@ def redact_sensitive_fields(
     if show_secrets:
         return resource
 
-    result = copy.deepcopy(resource)
-
-    # Rule 1: Redact Secret data/stringData values.
-    kind = result.get("kind", "")
-    if kind in SENSITIVE_RESOURCE_KINDS:
-        for field_name in ("data", "stringData"):
-            field = result.get(field_name)
-            if isinstance(field, dict):
-                for key in field:
-                    field[key] = "<REDACTED>"
-
-    # Rule 3: Redact last-applied-configuration annotation.
-    metadata = result.get("metadata")
-    if isinstance(metadata, dict):
-        annotations = metadata.get("annotations")
-        if isinstance(annotations, dict) and _LAST_APPLIED_CONFIG_KEY in annotations:
-            annotations[_LAST_APPLIED_CONFIG_KEY] = "<REDACTED>"
+    # _redact_top_level returns a new dict; copy the rest while redacting.
+    result = _redact_top_level(resource=resource)
 
     # Rule 2: Walk all nested dicts for sensitive key patterns.
-    _redact_dict(obj=result)
+    _redact_copying_children(root=result)
 
     return result
 
@@ -108,36 +167,21 @@ def format_table(headers: list[str], rows: list[list[str]]) -> str:
         return ""
 
     col_count = len(upper_headers)
-    col_widths = [len(hdr) for hdr in upper_headers]
 
+    # Stringify every cell once, padding short rows and dropping extra cells.
+    table: list[list[str]] = [upper_headers]
     for row in rows:
-        for idx in range(min(len(row), col_count)):
-            col_widths[idx] = max(col_widths[idx], len(str(row[idx])))
-
-    separator = "  "
-    lines: list[str] = []
+        cells = [str(cell) for cell in row[:col_count]]
+        if len(cells) < col_count:
+            cells.extend([""] * (col_count - len(cells)))
+        table.append(cells)
 
-    # Header line.
-    header_parts: list[str] = []
-    for idx, hdr in enumerate(upper_headers):
-        if idx < col_count - 1:
-            header_parts.append(hdr.ljust(col_widths[idx]))
-        else:
-            header_parts.append(hdr)
-    lines.append(separator.join(header_parts))
+    col_widths = [max(map(len, column)) for column in zip(*table)]
 
-    # Data rows.
-    for row in rows:
-        row_parts: list[str] = []
-        for idx in range(col_count):
-            cell = str(row[idx]) if idx < len(row) else ""
-            if idx < col_count - 1:
-                row_parts.append(cell.ljust(col_widths[idx]))
-            else:
-                row_parts.append(cell)
-        lines.append(separator.join(row_parts))
-
-    return "\n".join(lines)
+    # One format template renders a whole row in a single call: every column
+    # but the last is left-aligned to its width, separated by two spaces.
+    row_template = "  ".join([f"{{:<{width}}}" for width in col_widths[:-1]] + ["{}"])
+    return "\n".join([row_template.format(*cells) for cells in table])
 
 
 def _format_value(value: Any, indent: int, key_width: int) -> str:
@@ -151,72 +195,70 @@ def _format_value(value: Any, indent: int, key_width: int) -> str:
     if isinstance(value, str):
         return value
     if isinstance(value, dict):
-        return _format_nested_dict(obj=value, indent=indent)
+        return "\n".join(_iter_nested_dict(obj=value, indent=indent, redact=False))
     if isinstance(value, list):
         return _format_list(items=value, indent=indent, key_width=key_width)
     return str(value)
 
 
-def _format_nested_dict(obj: dict[str, Any], indent: int) -> str:
-    """Format a nested dict with indentation for describe output."""
-    if not obj:
-        return ""
+def _iter_nested_dict(obj: dict[str, Any], indent: int, redact: bool) -> Iterator[str]:
+    """Yield describe output for a dict with indentation.
 
-    lines: list[str] = []
+    When *redact* is True, values of sensitive keys are replaced by
+    "<REDACTED>" as they are visited, so no redacted copy of the tree is
+    needed.  Yielded fragments may span several lines.
+    """
     prefix = " " * indent
 
     for key, value in obj.items():
+        if redact and _key_is_sensitive(key):
+            value = "<REDACTED>"
         if isinstance(value, dict):
-            lines.append(f"{prefix}{key}:")
-            nested = _format_nested_dict(obj=value, indent=indent + 2)
-            if nested:
-                lines.append(nested)
+            yield f"{prefix}{key}:"
+            yield from _iter_nested_dict(obj=value, indent=indent + 2, redact=redact)
         elif isinstance(value, list):
-            formatted_list = _format_list_items(value, indent, key)
-            lines.append(formatted_list)
+            yield from _iter_list_items(
+                items=value, indent=indent, key=key, redact=redact
+            )
         else:
             display_val = _format_value(value, indent, len(key))
-            lines.append(f"{prefix}{key}:\t{display_val}")
+            yield f"{prefix}{key}:\t{display_val}"
 
-    return "\n".join(lines)
 
-
-def _format_list_items(items: list[Any], indent: int, key: str) -> str:
-    """Format a list of items for describe output, with the key as a prefix."""
+def _iter_list_items(
+    items: list[Any], indent: int, key: str, redact: bool
+) -> Iterator[str]:
+    """Yield describe output for a list of items, with the key as a prefix."""
     prefix = " " * indent
     # Alignment: subsequent lines align with first value character.
     key_prefix = f"{prefix}{key}:"
-    align_indent = len(key_prefix) + 1
+    align_prefix = " " * (len(key_prefix) + 1)
 
     if not items:
-        return f"{key_prefix}\t<none>"
+        yield f"{key_prefix}\t<none>"
+        return
 
-    lines: list[str] = []
     for idx, item in enumerate(items):
         if isinstance(item, str):
             if idx == 0:
-                lines.append(f"{key_prefix}\t{item}")
+                yield f"{key_prefix}\t{item}"
             else:
-                lines.append(f"{' ' * align_indent}{item}")
+                yield f"{align_prefix}{item}"
         elif isinstance(item, dict):
+            # Dict items start on the line after the key.
             if idx == 0:
-                # First dict item on same line as key (if simple), or next line.
-                nested = _format_nested_dict(item, indent + 2)
-                lines.append(f"{key_prefix}")
-                if nested:
-                    lines.append(nested)
-            else:
-                nested = _format_nested_dict(item, indent + 2)
-                if nested:
-                    lines.append(nested)
+                yield key_prefix
+            yield from _iter_nested_dict(obj=item, indent=indent + 2, redact=redact)
         else:
+            if redact and isinstance(item, list):
+                # Nested lists are rendered with str(); redact a copy first.
+                item = list(item)
+                _redact_copying_children(root=item)
             display = str(item) if item is not None else "<none>"
             if idx == 0:
-                lines.append(f"{key_prefix}\t{display}")
+                yield f"{key_prefix}\t{display}"
             else:
-                lines.append(f"{' ' * align_indent}{display}")
-
-    return "\n".join(lines)
+                yield f"{align_prefix}{display}"
 
 
 def _format_list(items: list[Any], indent: int, key_width: int) -> str:
@@ -237,92 +279,93 @@ def _format_list(items: list[Any], indent: int, key_width: int) -> str:
     return ""
 
 
-def format_describe(resource: dict[str, Any], show_secrets: bool) -> str:
-    """Key-value output matching ``oc describe`` style.
+def _iter_describe_lines(resource: dict[str, Any], show_secrets: bool) -> Iterator[str]:
+    """Yield the aligned lines of ``oc describe`` style output.
 
-    Calls redact_sensitive_fields() first. Top-level keys are formatted as
-    "Key:  value" (with spacing). Nested dicts are indented with 2 spaces.
-    Lists render items on separate lines. Multi-line values are indented
-    to align with the first value character.
+    [SEC V-003] Redaction is applied during the formatting walk: the
+    top-level rules on a shallow copy, sensitive key names per node.
     """
-    redacted = redact_sensitive_fields(resource=resource, show_secrets=show_secrets)
-    lines: list[str] = []
+    if not show_secrets:
+        resource = _redact_top_level(resource=resource)
 
-    for key, value in redacted.items():
-        if isinstance(value, dict):
-            lines.append(f"{key}:")
-            nested = _format_nested_dict(obj=value, indent=2)
-            if nested:
-                lines.append(nested)
-        elif isinstance(value, list):
-            formatted = _format_list_items(value, 0, key)
-            lines.append(formatted)
-        else:
-            display_val = _format_value(value, 0, len(key))
-            # Use tab-based alignment for consistent key-value spacing.
-            lines.append(f"{key}:\t{display_val}")
-
-    # Post-process: convert tabs to spaces for alignment.
-    # Find the longest key (before the tab) and align all values.
-    processed: list[str] = []
+    # Each line is kept with the position of its first tab (-1 for none),
+    # found once while the longest key is tracked.
+    lines: list[tuple[str, int]] = []
     max_key_len = 0
-    for line in "\n".join(lines).split("\n"):
-        if "\t" in line:
-            key_part = line.split("\t", 1)[0]
-            max_key_len = max(max_key_len, len(key_part))
-
-    # Align with at least 2 spaces after the longest key.
+    for fragment in _iter_nested_dict(obj=resource, indent=0, redact=not show_secrets):
+        for line in fragment.split("\n"):
+            tab = line.find("\t")
+            max_key_len = max(max_key_len, tab)
+            lines.append((line, tab))
+
+    # Convert tabs to spaces for alignment: align all values with at least
+    # 2 spaces after the longest key (the text before the tab).
     align_col = max_key_len + 2
-    for line in "\n".join(lines).split("\n"):
-        if "\t" in line:
-            key_part, val_part = line.split("\t", 1)
-            padding = align_col - len(key_part)
-            if padding < 2:
-                padding = 2
-            processed.append(f"{key_part}{' ' * padding}{val_part}")
+    for line, tab in lines:
+        if tab < 0:
+            yield line
         else:
-            processed.append(line)
+            padding = max(align_col - tab, 2)
+            value_start = tab + 1
+            yield f"{line[:tab]}{' ' * padding}{line[value_start:]}"
+
+
+def format_describe(resource: dict[str, Any], show_secrets: bool) -> str:
+    """Key-value output matching ``oc describe`` style.
+
+    Redacts sensitive fields unless show_secrets is True. Top-level keys are
+    formatted as "Key:  value" (with spacing). Nested dicts are indented with
+    2 spaces. Lists render items on separate lines. Multi-line values are
+    indented to align with the first value character.
+    """
+    return "\n".join(_iter_describe_lines(resource=resource, show_secrets=show_secrets))
+
 
-    return "\n".join(processed)
+def write_describe(resource: dict[str, Any], show_secrets: bool, out: TextIO) -> None:
+    """Write format_describe() output to *out* line by line.
 
+    Avoids building the whole description as a single string.
+    """
+    for line in _iter_describe_lines(resource=resource, show_secrets=show_secrets):
+        out.write(line)
+        out.write("\n")
 
-def format_age(timestamp_str: str | None) -> str:
+
+def format_age(timestamp_str: str | None, now: datetime | None = None) -> str:
     """Convert an ISO timestamp string to a relative age string.
 
     Format: "5d", "3h", "2m", "10s". Uses the largest applicable unit.
     Returns "<unknown>" for None or empty string.
+
+    Ages are measured against *now*, a timezone-aware datetime, defaulting
+    to the current UTC time.  Callers formatting many rows pass one value so
+    the clock is read once and every row is aged from the same instant.
     """
     if not timestamp_str:
         return "<unknown>"
 
     try:
-        # Parse ISO 8601 timestamp. Handle both with and without trailing Z.
-        timestamp_clean = timestamp_str.replace("Z", "+00:00")
-        parsed_time = datetime.fromisoformat(timestamp_clean)
+        # Parse ISO 8601 timestamp.  fromisoformat() accepts a trailing Z
+        # for UTC directly, so no rewriting is needed.
+        parsed_time = datetime.fromisoformat(timestamp_str)
 
         # Ensure timezone-aware. If naive, assume UTC.
         if parsed_time.tzinfo is None:
             parsed_time = parsed_time.replace(tzinfo=timezone.utc)
 
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         delta = now - parsed_time
 
         total_seconds = int(delta.total_seconds())
         if total_seconds < 0:
             return "0s"
-
-        days = total_seconds // 86400
-        if days > 0:
-            return f"{days}d"
-
-        hours = total_seconds // 3600
-        if hours > 0:
-            return f"{hours}h"
-
-        minutes = total_seconds // 60
-        if minutes > 0:
-            return f"{minutes}m"
-
+        if total_seconds >= 86400:
+            return f"{total_seconds // 86400}d"
+        if total_seconds >= 3600:
+            return f"{total_seconds // 3600}h"
+        if total_seconds >= 60:
+            return f"{total_seconds // 60}m"
         return f"{total_seconds}s"
 
     except (ValueError, TypeError):
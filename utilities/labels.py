@@ -1,7 +1,9 @@
 # utilities/labels.py
 from __future__ import annotations
 
+import functools
 import re
+from collections.abc import Callable, Mapping
 
 
 # [SEC V-004] Maximum number of terms in a label selector.
@@ -10,7 +12,10 @@ MAX_SELECTOR_TERMS = 20
 # [SEC V-004] Strict regex for validating individual selector terms.
 # Only allows alphanumeric characters, dots, hyphens, underscores,
 # and forward slashes (for Kubernetes label key domains like app.kubernetes.io/name).
-SELECTOR_TERM_PATTERN = re.compile(r"^[a-zA-Z0-9_./-]+(=|==|!=)[a-zA-Z0-9_./-]*$")
+SELECTOR_TERM_PATTERN = re.compile(r"^[a-zA-Z0-9_./-]+(==?|!=)[a-zA-Z0-9_./-]*$")
+
+# Marks a label key that is absent from the labels being matched.
+_MISSING = object()
 
 
 def validate_selector(selector_str: str) -> None:
@@ -44,9 +49,16 @@ def parse_selector(selector_str: str) -> list[tuple[str, str, str]]:
 
     Calls validate_selector() first per [SEC V-004]. Supports =, ==, and != operators.
     An empty selector string returns an empty list (matches everything).
+    Parsed results are memoized per selector string; each call returns a new list.
     """
+    return list(_parse_selector_cached(selector_str=selector_str))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_selector_cached(selector_str: str) -> tuple[tuple[str, str, str], ...]:
+    """Validate and parse *selector_str* into an immutable tuple of terms."""
     if not selector_str:
-        return []
+        return ()
 
     validate_selector(selector_str=selector_str)
 
@@ -54,21 +66,20 @@ def parse_selector(selector_str: str) -> list[tuple[str, str, str]]:
     terms = selector_str.split(",")
 
     for term in terms:
-        if "!=" in term:
-            key, value = term.split("!=", 1)
-            result.append((key, "!=", value))
-        elif "==" in term:
-            key, value = term.split("==", 1)
-            result.append((key, "==", value))
-        elif "=" in term:
-            key, value = term.split("=", 1)
-            result.append((key, "=", value))
+        # Every term passed validation, so it matches and group 1 is the
+        # operator; the key and value are the text on either side of it.
+        match = SELECTOR_TERM_PATTERN.match(term)
+        if match is None:
+            continue
+        key_end = match.start(1)
+        value_start = match.end(1)
+        result.append((term[:key_end], match.group(1), term[value_start:]))
 
-    return result
+    return tuple(result)
 
 
 def matches_selector(
-    labels: dict[str, str], selector: list[tuple[str, str, str]]
+    labels: Mapping[str, str], selector: list[tuple[str, str, str]]
 ) -> bool:
     """Return True if ALL selector terms match the given labels.
 
@@ -77,11 +88,37 @@ def matches_selector(
     An empty selector list matches everything (returns True).
     """
     for key, operator, value in selector:
+        # One lookup per term; _MISSING never equals a selector value.
+        actual = labels.get(key, _MISSING)
         if operator in ("=", "=="):
-            if key not in labels or labels[key] != value:
+            if actual != value:
                 return False
         elif operator == "!=":
-            if key in labels and labels[key] == value:
+            if actual == value:
                 return False
 
     return True
+
+
+def build_matcher(
+    selector: list[tuple[str, str, str]],
+) -> Callable[[dict[str, str]], bool]:
+    """Return a predicate that tests a labels dict against a parsed selector.
+
+    Selectors made only of = / == terms on distinct keys (the common
+    ``-l app=foo`` case) get a specialised predicate: a cardinality
+    pre-check followed by direct dict lookups.  Any other selector falls
+    back to :func:`matches_selector`.
+    """
+    wanted = {
+        key: value for key, operator, value in selector if operator in ("=", "==")
+    }
+    if len(wanted) != len(selector):
+        return lambda labels: matches_selector(labels, selector)
+
+    def _matches_equality(labels: dict[str, str]) -> bool:
+        if len(wanted) > len(labels):
+            return False
+        return all(labels.get(key) == value for key, value in wanted.items())
+
+    return _matches_equality
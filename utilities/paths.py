@@ -2,10 +2,16 @@
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to scan multiple must-gather directories.
+MAX_SCAN_WORKERS: int = 8
+
 
 def validate_path(path: Path, root: Path) -> Path:
     """[SEC V-002] Resolve symlinks and verify the path stays within root.
@@ -16,13 +22,54 @@ def validate_path(path: Path, root: Path) -> Path:
 
     Returns the fully resolved path on success.
     """
+    return validate_in_resolved_root(path=path, root_resolved=root.resolve())
+
+
+def validate_in_resolved_root(path: Path, root_resolved: Path) -> Path:
+    """[SEC V-002] Same as :func:`validate_path` for an already-resolved root.
+
+    Lets callers that check many paths against one root resolve the root
+    once instead of once per path.
+    """
     resolved = path.resolve()
-    root_resolved = root.resolve()
-    if not resolved.is_relative_to(root_resolved):
+    if not _is_under(path=resolved, root=root_resolved):
         raise ValueError(f"Path escapes must-gather root: {path}")
     return resolved
 
 
+def is_within_roots(path: Path, roots: list[Path]) -> bool:
+    """[SEC V-002] Return True if *path* resolves inside any of *roots*.
+
+    Equivalent to trying :func:`validate_path` against each root in turn,
+    but resolves *path* only once and compares it against *roots* in memory.
+    *roots* must already be resolved, as returned by :func:`discover_roots`;
+    an unresolved root can only cause a false rejection, never an escape.
+    """
+    resolved = path.resolve()
+    return any(_is_under(path=resolved, root=root) for root in roots)
+
+
+def _is_under(path: Path, root: Path) -> bool:
+    """Return True if *path* is *root* or lies below it.
+
+    Both must be absolute and resolved.  Equivalent to
+    ``path.is_relative_to(root)`` but compares the strings directly instead
+    of splitting both paths into parts, which costs about as much as the
+    ``resolve()`` itself.  The separator suffix keeps ``/a/bc`` from
+    matching ``/a/b``.
+    """
+    path_str = str(path)
+    root_str = str(root)
+    if path_str == root_str:
+        return True
+    prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    return path_str.startswith(prefix)
+
+
+# Subdirectories whose presence marks a directory as a must-gather root.
+_GATHER_ROOT_MARKERS = frozenset({"namespaces", "cluster-scoped-resources"})
+
+
 def _is_gather_root(directory: Path) -> bool:
     """Return True if *directory* looks like a must-gather root.
 
@@ -34,7 +81,7 @@ def _is_gather_root(directory: Path) -> bool:
     ).is_dir()
 
 
-def discover_roots(directories: list[Path]) -> list[Path]:
+def discover_roots(directories: Sequence[str | Path]) -> list[Path]:
     """Find all must-gather root directories inside *directories*.
 
     For each user-supplied directory:
@@ -45,292 +92,79 @@ def discover_roots(directories: list[Path]) -> list[Path]:
       4. Within each discovered root, check for nested sub-roots
          (e.g. ODF's ``ceph/`` directory that itself has ``namespaces/``).
 
-    All discovered paths are validated via :func:`validate_path`.
+    All discovered paths are validated via :func:`validate_path`.  When
+    several directories are given they are scanned concurrently, since the
+    walks are independent and dominated by filesystem latency.
 
-    Returns a sorted list of root paths (sorted by directory name for
-    deterministic ordering across runs).
+    Returns a sorted, duplicate-free list of resolved root paths (sorted by
+    directory name for deterministic ordering across runs).
     """
-    roots: list[Path] = []
-
-    for base_dir in directories:
+    base_dirs = [Path(directory) for directory in directories]
+    for base_dir in base_dirs:
         if not base_dir.exists():
             raise FileNotFoundError(f"Must-gather directory does not exist: {base_dir}")
 
-        # Check immediate subdirectories (the image-hash level).
-        for child in sorted(base_dir.iterdir()):
-            if not child.is_dir():
-                continue
-            if _is_gather_root(child):
-                validated = validate_path(path=child, root=base_dir)
-                roots.append(validated)
-
-                # Check for nested sub-roots (e.g. ceph/ inside the hash dir).
-                for nested in sorted(child.iterdir()):
-                    if not nested.is_dir():
-                        continue
-                    if _is_gather_root(nested):
-                        validated_nested = validate_path(path=nested, root=base_dir)
-                        roots.append(validated_nested)
-
-    return sorted(roots)
-
-
-def _namespace_dirs_for_root(
-    root: Path,
-    namespace: str | None,
-    all_namespaces: bool,
-) -> list[str]:
-    """Return a list of namespace names to scan under *root*.
-
-    When *namespace* is given, returns ``[namespace]`` (no filesystem check).
-    When *all_namespaces* is True, enumerates the ``namespaces/`` directory
-    and returns all namespace subdirectory names (excluding ``all``).
-    """
-    if namespace is not None:
-        return [namespace]
-
-    if all_namespaces:
-        ns_base = root / "namespaces"
-        if not ns_base.is_dir():
-            return []
-        return sorted(
-            entry.name
-            for entry in ns_base.iterdir()
-            if entry.is_dir() and entry.name != "all"
-        )
-
-    return []
-
-
-def find_resource_files(
-    roots: list[Path],
-    namespace: str | None,
-    all_namespaces: bool,
-    api_group: str,
-    plural: str,
-    name: str | None,
-) -> list[Path]:
-    """Return paths to YAML files matching the query.
-
-    Searches the following patterns in order within each root:
-
-    **Namespaced patterns (when namespace is given or all_namespaces):**
-
-    - Pattern A1 (bare, no api_group prefix -- F-002):
-      ``namespaces/<NS>/<plural>/<name>/<name>.yaml``
-
-    - Pattern A2 (with api_group):
-      ``namespaces/<NS>/<api_group>/<plural>/<name>.yaml``
-
-    - Pattern A3 (list file):
-      ``namespaces/<NS>/<api_group>/<plural>.yaml``
+    # The same directory given twice (or via different spellings) is scanned
+    # once.  Roots are resolved by validate_path(), so scanning the resolved
+    # base directory yields the same roots.
+    base_dirs = list(dict.fromkeys(base_dir.resolve() for base_dir in base_dirs))
 
-    - Pattern B (all-namespaces aggregated):
-      ``namespaces/all/namespaces/<NS>/<api_group>/<plural>/<name>.yaml``
+    if len(base_dirs) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_SCAN_WORKERS, len(base_dirs))
+        ) as executor:
+            per_dir_roots = list(executor.map(_scan_base_dir, base_dirs))
+    else:
+        per_dir_roots = [_scan_base_dir(base_dir=base_dir) for base_dir in base_dirs]
 
-    **Cluster-scoped pattern (when namespace is None and not all_namespaces,
-    or always as a supplemental scan):**
+    # Distinct base directories can still share roots (e.g. one -d pointing
+    # inside another), so deduplicate the resolved roots as well.
+    return sorted({root for dir_roots in per_dir_roots for root in dir_roots})
 
-    - ``cluster-scoped-resources/<api_group>/<plural>/<name>.yaml``
 
-    **Deduplication rules:**
-    - Dedup key: resource name (YAML filename stem).
-    - Within a single root, Pattern A takes precedence over Pattern B.
-    - Across roots, first root wins (roots are sorted).
-    - For single-resource queries (explicit *name*), short-circuit on first match.
+def _scan_base_dir(base_dir: Path) -> list[Path]:
+    """Return the validated must-gather roots (and nested sub-roots) in *base_dir*.
 
-    All returned paths are validated via :func:`validate_path`.
+    *base_dir* must already be resolved, as done by :func:`discover_roots`.
     """
-    seen_names: set[str] = set()
-    results: list[Path] = []
-
-    is_namespaced_query = namespace is not None or all_namespaces
+    roots: list[Path] = []
 
-    for root in roots:
-        if is_namespaced_query:
-            ns_names = _namespace_dirs_for_root(
-                root=root, namespace=namespace, all_namespaces=all_namespaces
-            )
-            pattern_a_files = _collect_pattern_a(
-                root=root,
-                ns_names=ns_names,
-                api_group=api_group,
-                plural=plural,
-                name=name,
-            )
-            for file_path in pattern_a_files:
-                stem = file_path.stem
-                if stem in seen_names:
-                    continue
-                try:
-                    validated = validate_path(path=file_path, root=root)
-                except ValueError:
-                    logger.debug("Skipping path that failed validation: %s", file_path)
-                    continue
-                seen_names.add(stem)
-                results.append(validated)
-                if name is not None:
-                    return results
-
-            # Pattern B: namespaces/all/namespaces/<NS>/...
-            pattern_b_files = _collect_pattern_b(
-                root=root,
-                ns_names=ns_names,
-                api_group=api_group,
-                plural=plural,
-                name=name,
-            )
-            for file_path in pattern_b_files:
-                stem = file_path.stem
-                if stem in seen_names:
-                    continue
-                try:
-                    validated = validate_path(path=file_path, root=root)
-                except ValueError:
-                    logger.debug("Skipping path that failed validation: %s", file_path)
-                    continue
-                seen_names.add(stem)
-                results.append(validated)
-                if name is not None:
-                    return results
-
-        # Cluster-scoped resources
-        cluster_files = _collect_cluster_scoped(
-            root=root, api_group=api_group, plural=plural, name=name
-        )
-        for file_path in cluster_files:
-            stem = file_path.stem
-            if stem in seen_names:
-                continue
-            try:
-                validated = validate_path(path=file_path, root=root)
-            except ValueError:
-                logger.debug("Skipping path that failed validation: %s", file_path)
-                continue
-            seen_names.add(stem)
-            results.append(validated)
-            if name is not None:
-                return results
-
-    return results
-
-
-def _collect_pattern_a(
-    root: Path,
-    ns_names: list[str],
-    api_group: str,
-    plural: str,
-    name: str | None,
-) -> list[Path]:
-    """Collect files matching Pattern A1 (bare) and Pattern A2 (api_group prefix).
+    # Check immediate subdirectories (the image-hash level).  Each child is
+    # small, so one listing both identifies a root and supplies the
+    # candidates for nested sub-roots.
+    for child in _sorted_subdirs(directory=base_dir):
+        try:
+            nested_dirs = _sorted_subdirs(directory=child)
+        except OSError:
+            # Unreadable: it cannot be a usable root either.
+            continue
+        if not _GATHER_ROOT_MARKERS.intersection(nested.name for nested in nested_dirs):
+            continue
+        validated = validate_in_resolved_root(path=child, root_resolved=base_dir)
+        roots.append(validated)
 
-    Pattern A1: namespaces/<NS>/<plural>/<name>/<name>.yaml
-    Pattern A2: namespaces/<NS>/<api_group>/<plural>/<name>.yaml
-             or namespaces/<NS>/<api_group>/<plural>/<name>/<name>.yaml
-    Pattern A3: namespaces/<NS>/<api_group>/<plural>.yaml  (list file, only when name is None)
-    """
-    found: list[Path] = []
-    for ns_name in ns_names:
-        # --- Pattern A1: bare (no api_group prefix) ---
-        bare_dir = root / "namespaces" / ns_name / plural
-        if bare_dir.is_dir():
-            if name is not None:
-                candidate = bare_dir / name / f"{name}.yaml"
-                if candidate.is_file():
-                    found.append(candidate)
-            else:
-                for sub in sorted(bare_dir.iterdir()):
-                    if sub.is_dir():
-                        yaml_file = sub / f"{sub.name}.yaml"
-                        if yaml_file.is_file():
-                            found.append(yaml_file)
-
-        # --- Pattern A2: with api_group prefix ---
-        api_dir = root / "namespaces" / ns_name / api_group / plural
-        if api_dir.is_dir():
-            if name is not None:
-                # Flat file: <api_group>/<plural>/<name>.yaml
-                candidate = api_dir / f"{name}.yaml"
-                if candidate.is_file():
-                    found.append(candidate)
-                else:
-                    # Subdirectory: <api_group>/<plural>/<name>/<name>.yaml
-                    candidate = api_dir / name / f"{name}.yaml"
-                    if candidate.is_file():
-                        found.append(candidate)
-            else:
-                # Flat files directly in the plural directory.
-                for yaml_file in sorted(api_dir.glob("*.yaml")):
-                    if yaml_file.is_file():
-                        found.append(yaml_file)
-                # Subdirectory pattern: <plural>/<name>/<name>.yaml
-                for sub in sorted(api_dir.iterdir()):
-                    if sub.is_dir():
-                        yaml_file = sub / f"{sub.name}.yaml"
-                        if yaml_file.is_file():
-                            found.append(yaml_file)
-
-        # --- Pattern A3: list file (only when listing, not by name) ---
-        if name is None:
-            list_file = root / "namespaces" / ns_name / api_group / f"{plural}.yaml"
-            if list_file.is_file():
-                found.append(list_file)
-
-    return found
-
-
-def _collect_pattern_b(
-    root: Path,
-    ns_names: list[str],
-    api_group: str,
-    plural: str,
-    name: str | None,
-) -> list[Path]:
-    """Collect files matching Pattern B.
+        # Check for nested sub-roots (e.g. ceph/ inside the hash dir).  These
+        # include namespaces/ itself, which can be huge, so they are probed
+        # with stat rather than listed.
+        for nested in nested_dirs:
+            if _is_gather_root(nested):
+                validated_nested = validate_in_resolved_root(
+                    path=nested, root_resolved=base_dir
+                )
+                roots.append(validated_nested)
 
-    Pattern B: namespaces/all/namespaces/<NS>/<api_group>/<plural>/<name>.yaml
-    """
-    found: list[Path] = []
-    for ns_name in ns_names:
-        pattern_b_dir = (
-            root / "namespaces" / "all" / "namespaces" / ns_name / api_group / plural
-        )
-        if not pattern_b_dir.is_dir():
-            continue
-        if name is not None:
-            candidate = pattern_b_dir / f"{name}.yaml"
-            if candidate.is_file():
-                found.append(candidate)
-        else:
-            for yaml_file in sorted(pattern_b_dir.glob("*.yaml")):
-                if yaml_file.is_file():
-                    found.append(yaml_file)
-    return found
+    return roots
 
 
-def _collect_cluster_scoped(
-    root: Path,
-    api_group: str,
-    plural: str,
-    name: str | None,
-) -> list[Path]:
-    """Collect files under cluster-scoped-resources/<api_group>/<plural>/.
+def _sorted_subdirs(directory: Path) -> list[Path]:
+    """Return the immediate subdirectories of *directory*, sorted by name.
 
-    Returns individual YAML files matching the query.
+    Uses ``os.scandir`` so the directory test comes from the ``d_type``
+    returned with the listing instead of a ``stat`` per entry.
     """
-    found: list[Path] = []
-    csr_dir = root / "cluster-scoped-resources" / api_group / plural
-    if not csr_dir.is_dir():
-        return found
-    if name is not None:
-        candidate = csr_dir / f"{name}.yaml"
-        if candidate.is_file():
-            found.append(candidate)
-    else:
-        for yaml_file in sorted(csr_dir.glob("*.yaml")):
-            if yaml_file.is_file():
-                found.append(yaml_file)
-    return found
+    with os.scandir(directory) as entries:
+        names = sorted(entry.name for entry in entries if entry.is_dir())
+    return [directory / name for name in names]
 
 
 def find_log_files(
@@ -349,36 +183,60 @@ def find_log_files(
     When *container* is ``None``, all containers for the pod are returned.
     All returned paths are validated via :func:`validate_path`.
     """
+    log_files, _pod_dirs = find_pod_log_files(
+        roots=roots, namespace=namespace, pod_name=pod_name, container=container
+    )
+    return log_files
+
+
+def find_pod_log_files(
+    roots: list[Path],
+    namespace: str,
+    pod_name: str,
+    container: str | None,
+) -> tuple[list[Path], list[Path]]:
+    """Return ``(log_files, pod_dirs)`` for the given pod and optional container.
+
+    *log_files* is exactly what :func:`find_log_files` returns.  *pod_dirs*
+    lists every ``namespaces/<NS>/pods/<POD>`` directory seen during the same
+    walk, even those without logs, so callers can tell a missing pod from a
+    missing container without probing the roots again.
+    """
     results: list[Path] = []
+    pod_dirs: list[Path] = []
     for root in roots:
         pod_dir = root / "namespaces" / namespace / "pods" / pod_name
         if not pod_dir.is_dir():
             continue
+        pod_dirs.append(pod_dir)
+        root_resolved = root.resolve()
 
         if container is not None:
             log_path = pod_dir / container / container / "logs" / "current.log"
             if log_path.is_file():
                 try:
-                    validated = validate_path(path=log_path, root=root)
+                    validated = validate_in_resolved_root(
+                        path=log_path, root_resolved=root_resolved
+                    )
                     results.append(validated)
                 except ValueError:
                     logger.debug(
                         "Skipping log path that failed validation: %s", log_path
                     )
         else:
-            # Discover all container directories inside the pod directory.
-            for container_dir in sorted(pod_dir.iterdir()):
-                if not container_dir.is_dir():
-                    continue
-                # Skip non-container entries (e.g. the pod YAML itself).
+            # Discover all container directories inside the pod directory;
+            # non-container entries (e.g. the pod YAML itself) are skipped.
+            for container_dir in _sorted_subdirs(directory=pod_dir):
                 log_path = container_dir / container_dir.name / "logs" / "current.log"
                 if log_path.is_file():
                     try:
-                        validated = validate_path(path=log_path, root=root)
+                        validated = validate_in_resolved_root(
+                            path=log_path, root_resolved=root_resolved
+                        )
                         results.append(validated)
                     except ValueError:
                         logger.debug(
                             "Skipping log path that failed validation: %s", log_path
                         )
 
-    return results
+    return results, pod_dirs
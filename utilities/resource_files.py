@@ -0,0 +1,329 @@
+# utilities/resource_files.py
+from __future__ import annotations
+
+import functools
+import logging
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from utilities.paths import MAX_SCAN_WORKERS, validate_in_resolved_root
+
+logger = logging.getLogger(__name__)
+
+
+def _scan_listing(directory: Path) -> tuple[list[str], list[str]]:
+    """Return ``(yaml_file_names, subdir_names)`` in *directory*, each sorted.
+
+    A missing directory (or a path that is not a directory) yields two empty
+    lists.  Entry types come from the ``d_type`` returned with the listing,
+    so one ``scandir`` replaces a glob, an ``iterdir`` and a ``stat`` per
+    entry.
+    """
+    yaml_names: list[str] = []
+    subdir_names: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    subdir_names.append(entry.name)
+                elif entry.name.endswith(".yaml") and entry.is_file():
+                    yaml_names.append(entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    yaml_names.sort()
+    subdir_names.sort()
+    return yaml_names, subdir_names
+
+
+def _namespace_dirs_for_root(
+    root: Path,
+    namespace: str | None,
+    all_namespaces: bool,
+) -> list[str]:
+    """Return a list of namespace names to scan under *root*.
+
+    When *namespace* is given, returns ``[namespace]`` (no filesystem check).
+    When *all_namespaces* is True, enumerates the ``namespaces/`` directory
+    and returns all namespace subdirectory names (excluding ``all``).
+    """
+    if namespace is not None:
+        return [namespace]
+
+    if all_namespaces:
+        _yaml_names, ns_names = _scan_listing(directory=root / "namespaces")
+        return [ns_name for ns_name in ns_names if ns_name != "all"]
+
+    return []
+
+
+def find_resource_files(
+    roots: list[Path],
+    namespace: str | None,
+    all_namespaces: bool,
+    api_group: str,
+    plural: str,
+    name: str | None,
+) -> list[Path]:
+    """Return paths to YAML files matching the query.
+
+    Searches the following patterns in order within each root:
+
+    **Namespaced patterns (when namespace is given or all_namespaces):**
+
+    - Pattern A1 (bare, no api_group prefix -- F-002):
+      ``namespaces/<NS>/<plural>/<name>/<name>.yaml``
+
+    - Pattern A2 (with api_group):
+      ``namespaces/<NS>/<api_group>/<plural>/<name>.yaml``
+
+    - Pattern A3 (list file):
+      ``namespaces/<NS>/<api_group>/<plural>.yaml``
+
+    - Pattern B (all-namespaces aggregated):
+      ``namespaces/all/namespaces/<NS>/<api_group>/<plural>/<name>.yaml``
+
+    **Cluster-scoped pattern (when namespace is None and not all_namespaces,
+    or always as a supplemental scan):**
+
+    - ``cluster-scoped-resources/<api_group>/<plural>/<name>.yaml``
+
+    **Deduplication rules:**
+    - Dedup key: resource name (YAML filename stem).
+    - Within a single root, Pattern A takes precedence over Pattern B.
+    - Across roots, first root wins (roots are sorted).
+    - For single-resource queries (explicit *name*), short-circuit on first match.
+
+    All returned paths are validated via :func:`utilities.paths.validate_path`.
+
+    Candidates from several roots are collected concurrently, like
+    :func:`utilities.paths.discover_roots`; they are still deduplicated and
+    validated in root order.  Single-resource queries scan the roots one at
+    a time so that they can stop at the first match.
+    """
+    per_root_candidates: Iterable[Iterable[Path]]
+    if name is None and len(roots) > 1:
+        collect = functools.partial(
+            _collect_root_candidates,
+            namespace=namespace,
+            all_namespaces=all_namespaces,
+            api_group=api_group,
+            plural=plural,
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_SCAN_WORKERS, len(roots))
+        ) as executor:
+            per_root_candidates = list(executor.map(collect, roots))
+    else:
+        per_root_candidates = (
+            _iter_root_candidates(
+                root=root,
+                namespace=namespace,
+                all_namespaces=all_namespaces,
+                api_group=api_group,
+                plural=plural,
+                name=name,
+            )
+            for root in roots
+        )
+
+    seen_names: set[str] = set()
+    results: list[Path] = []
+
+    for root, candidates in zip(roots, per_root_candidates, strict=True):
+        # Every candidate below is validated against this root.
+        root_resolved = root.resolve()
+        for file_path in candidates:
+            stem = file_path.stem
+            if stem in seen_names:
+                continue
+            try:
+                validated = validate_in_resolved_root(
+                    path=file_path, root_resolved=root_resolved
+                )
+            except ValueError:
+                logger.debug("Skipping path that failed validation: %s", file_path)
+                continue
+            seen_names.add(stem)
+            results.append(validated)
+            if name is not None:
+                return results
+
+    return results
+
+
+def _collect_root_candidates(
+    root: Path,
+    namespace: str | None,
+    all_namespaces: bool,
+    api_group: str,
+    plural: str,
+) -> list[Path]:
+    """Return every candidate file under *root* for a listing query.
+
+    Eager form of :func:`_iter_root_candidates`, so that the whole scan of a
+    root runs on the worker thread that collects it.
+    """
+    return list(
+        _iter_root_candidates(
+            root=root,
+            namespace=namespace,
+            all_namespaces=all_namespaces,
+            api_group=api_group,
+            plural=plural,
+            name=None,
+        )
+    )
+
+
+def _iter_root_candidates(
+    root: Path,
+    namespace: str | None,
+    all_namespaces: bool,
+    api_group: str,
+    plural: str,
+    name: str | None,
+) -> Iterator[Path]:
+    """Yield the candidate files under *root* in precedence order.
+
+    Pattern A comes first, then Pattern B (both only for namespaced
+    queries), then cluster-scoped resources.  Each group is collected only
+    once the previous one is exhausted, so a caller that stops early skips
+    the later probes.
+    """
+    if namespace is not None or all_namespaces:
+        ns_names = _namespace_dirs_for_root(
+            root=root, namespace=namespace, all_namespaces=all_namespaces
+        )
+        yield from _collect_pattern_a(
+            root=root,
+            ns_names=ns_names,
+            api_group=api_group,
+            plural=plural,
+            name=name,
+        )
+
+        # Pattern B: namespaces/all/namespaces/<NS>/...
+        yield from _collect_pattern_b(
+            root=root,
+            ns_names=ns_names,
+            api_group=api_group,
+            plural=plural,
+            name=name,
+        )
+
+    # Cluster-scoped resources
+    yield from _collect_cluster_scoped(
+        root=root, api_group=api_group, plural=plural, name=name
+    )
+
+
+def _collect_pattern_a(
+    root: Path,
+    ns_names: list[str],
+    api_group: str,
+    plural: str,
+    name: str | None,
+) -> list[Path]:
+    """Collect files matching Pattern A1 (bare) and Pattern A2 (api_group prefix).
+
+    Pattern A1: namespaces/<NS>/<plural>/<name>/<name>.yaml
+    Pattern A2: namespaces/<NS>/<api_group>/<plural>/<name>.yaml
+             or namespaces/<NS>/<api_group>/<plural>/<name>/<name>.yaml
+    Pattern A3: namespaces/<NS>/<api_group>/<plural>.yaml  (list file, only when name is None)
+    """
+    found: list[Path] = []
+    for ns_name in ns_names:
+        # --- Pattern A1: bare (no api_group prefix) ---
+        # A missing directory simply makes the is_file() checks and the
+        # listing come up empty, so it is not tested separately.
+        bare_dir = root / "namespaces" / ns_name / plural
+        if name is not None:
+            candidate = bare_dir / name / f"{name}.yaml"
+            if candidate.is_file():
+                found.append(candidate)
+        else:
+            _yaml_names, sub_names = _scan_listing(directory=bare_dir)
+            for sub_name in sub_names:
+                yaml_file = bare_dir / sub_name / f"{sub_name}.yaml"
+                if yaml_file.is_file():
+                    found.append(yaml_file)
+
+        # --- Pattern A2: with api_group prefix ---
+        api_dir = root / "namespaces" / ns_name / api_group / plural
+        if name is not None:
+            # Flat file: <api_group>/<plural>/<name>.yaml
+            candidate = api_dir / f"{name}.yaml"
+            if candidate.is_file():
+                found.append(candidate)
+            else:
+                # Subdirectory: <api_group>/<plural>/<name>/<name>.yaml
+                candidate = api_dir / name / f"{name}.yaml"
+                if candidate.is_file():
+                    found.append(candidate)
+        else:
+            yaml_names, sub_names = _scan_listing(directory=api_dir)
+            # Flat files directly in the plural directory.
+            found.extend(api_dir / yaml_name for yaml_name in yaml_names)
+            # Subdirectory pattern: <plural>/<name>/<name>.yaml
+            for sub_name in sub_names:
+                yaml_file = api_dir / sub_name / f"{sub_name}.yaml"
+                if yaml_file.is_file():
+                    found.append(yaml_file)
+
+        # --- Pattern A3: list file (only when listing, not by name) ---
+        if name is None:
+            list_file = root / "namespaces" / ns_name / api_group / f"{plural}.yaml"
+            if list_file.is_file():
+                found.append(list_file)
+
+    return found
+
+
+def _collect_pattern_b(
+    root: Path,
+    ns_names: list[str],
+    api_group: str,
+    plural: str,
+    name: str | None,
+) -> list[Path]:
+    """Collect files matching Pattern B.
+
+    Pattern B: namespaces/all/namespaces/<NS>/<api_group>/<plural>/<name>.yaml
+    """
+    found: list[Path] = []
+    for ns_name in ns_names:
+        pattern_b_dir = (
+            root / "namespaces" / "all" / "namespaces" / ns_name / api_group / plural
+        )
+        if name is not None:
+            candidate = pattern_b_dir / f"{name}.yaml"
+            if candidate.is_file():
+                found.append(candidate)
+        else:
+            yaml_names, _sub_names = _scan_listing(directory=pattern_b_dir)
+            found.extend(pattern_b_dir / yaml_name for yaml_name in yaml_names)
+    return found
+
+
+def _collect_cluster_scoped(
+    root: Path,
+    api_group: str,
+    plural: str,
+    name: str | None,
+) -> list[Path]:
+    """Collect files under cluster-scoped-resources/<api_group>/<plural>/.
+
+    Returns individual YAML files matching the query.
+    """
+    found: list[Path] = []
+    csr_dir = root / "cluster-scoped-resources" / api_group / plural
+    if name is not None:
+        candidate = csr_dir / f"{name}.yaml"
+        if candidate.is_file():
+            found.append(candidate)
+    else:
+        yaml_names, _sub_names = _scan_listing(directory=csr_dir)
+        found.extend(csr_dir / yaml_name for yaml_name in yaml_names)
+    return found
@@ -4,9 +4,10 @@ from __future__ import annotations
 import functools
 from pathlib import Path
 
-import yaml
+from utilities.yaml_parser import safe_load
 
 
+@functools.lru_cache(maxsize=1)
 def config_dir() -> Path:
     """Return the path to the config/ directory at the project root."""
     return Path(__file__).parent.parent / "config"
@@ -18,8 +19,9 @@ def _load_irregular_plurals(config_path: Path | None = None) -> dict[str, str]:
     if config_path is None:
         config_path = config_dir() / "irregular_plurals.yaml"
 
-    with open(config_path, encoding="utf-8") as fhandle:
-        raw = yaml.safe_load(fhandle)
+    # Binary mode: the loader decodes UTF-8 itself, skipping the text layer.
+    with open(config_path, "rb") as fhandle:
+        raw = safe_load(fhandle)
 
     if raw is None:
         return {}
@@ -32,12 +34,14 @@ def load_resource_map(config_path: Path | None = None) -> dict[str, tuple[str, s
     """Load config/resource_map.yaml and build an alias -> (api_group, plural) lookup.
 
     Both the plural name itself AND each alias map to (api_group, plural).
+    Keys are lowercased, matching the lowercased lookups in
+    :func:`resolve_resource_type`; the plural in each entry keeps its case.
     """
     if config_path is None:
         config_path = config_dir() / "resource_map.yaml"
 
-    with open(config_path, encoding="utf-8") as fhandle:
-        raw = yaml.safe_load(fhandle)
+    with open(config_path, "rb") as fhandle:
+        raw = safe_load(fhandle)
 
     if raw is None:
         return {}
@@ -48,17 +52,16 @@ def load_resource_map(config_path: Path | None = None) -> dict[str, tuple[str, s
         if not isinstance(details, dict):
             continue
         api_group = details.get("api_group", "")
-        entry = (api_group, plural_name)
+        # YAML may load a key such as "123" or "on" as a non-string.
+        plural = str(plural_name)
+        entry = (api_group, plural)
 
         # The plural name itself is a valid lookup key.
-        resource_map[plural_name] = entry
+        resource_map[plural.lower()] = entry
 
         # Each alias also maps to the same (api_group, plural) tuple.
-        aliases = details.get("aliases", [])
-        if aliases is None:
-            aliases = []
-        for alias in aliases:
-            resource_map[str(alias)] = entry
+        for alias in details.get("aliases") or ():
+            resource_map[str(alias).lower()] = entry
 
     return resource_map
 
@@ -69,8 +72,8 @@ def load_cluster_scoped(config_path: Path | None = None) -> set[str]:
     if config_path is None:
         config_path = config_dir() / "cluster_scoped.yaml"
 
-    with open(config_path, encoding="utf-8") as fhandle:
-        raw = yaml.safe_load(fhandle)
+    with open(config_path, "rb") as fhandle:
+        raw = safe_load(fhandle)
 
     if raw is None:
         return set()
@@ -78,19 +81,19 @@ def load_cluster_scoped(config_path: Path | None = None) -> set[str]:
     return set(raw)
 
 
+@functools.lru_cache(maxsize=128)
 def resolve_resource_type(
     user_input: str, config_path: Path | None = None
 ) -> tuple[str, str]:
     """Look up user input in the loaded resource map.
 
-    Returns (api_group, plural_name).
+    Returns (api_group, plural_name).  Results are memoized per input.
     Raises ValueError if the input does not match any known resource type or alias.
     """
     resource_map = load_resource_map(config_path=config_path)
-    lowered = user_input.lower()
-
-    if lowered in resource_map:
-        return resource_map[lowered]
+    entry = resource_map.get(user_input.lower())
+    if entry is not None:
+        return entry
 
     raise ValueError(
         f"Unknown resource type: {user_input!r}. "
@@ -121,8 +124,9 @@ def get_kind_from_plural(plural_name: str, config_path: Path | None = None) -> s
     """
     irregular = _load_irregular_plurals(config_path=config_path)
 
-    if plural_name in irregular:
-        return irregular[plural_name]
+    kind = irregular.get(plural_name)
+    if kind is not None:
+        return kind
 
     # Fallback: strip trailing 's', capitalize first letter.
     if plural_name.endswith("s"):
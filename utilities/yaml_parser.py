@@ -1,67 +1,132 @@
 # utilities/yaml_parser.py
 from __future__ import annotations
 
+import os
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import IO, Any
 
 import yaml
 
 # [SEC V-001] Maximum file size for YAML parsing: 100MB
 MAX_YAML_SIZE: int = 100 * 1024 * 1024
 
+# [SEC V-006] Safe loader class: libyaml's C implementation when PyYAML was
+# built with it, otherwise the pure-Python SafeLoader.  Both only construct
+# standard YAML tags.
+SAFE_LOADER: type[yaml.SafeLoader | yaml.CSafeLoader] = getattr(
+    yaml, "CSafeLoader", yaml.SafeLoader
+)
+
+# Safe dumper class, chosen the same way as SAFE_LOADER.
+SAFE_DUMPER: type[yaml.SafeDumper | yaml.CSafeDumper] = getattr(
+    yaml, "CSafeDumper", yaml.SafeDumper
+)
+
+# Stands in for a missing or empty ``metadata`` block in extract_metadata().
+_NO_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def safe_load(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """[SEC V-006] Parse a single YAML document with :data:`SAFE_LOADER`.
+
+    Drop-in replacement for ``yaml.safe_load()`` that uses the C-accelerated
+    loader when available.
+    """
+    loader = SAFE_LOADER(stream)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
+def safe_dump(data: Any, **kwargs: Any) -> str:
+    """Serialize *data* to a YAML string with :data:`SAFE_DUMPER`.
+
+    Keyword arguments are passed through to ``yaml.dump()``.
+    """
+    dumped: str = yaml.dump(data, Dumper=SAFE_DUMPER, **kwargs)
+    return dumped
+
+
+def safe_dump_to(data: Any, stream: IO[str], **kwargs: Any) -> None:
+    """Serialize *data* as YAML straight into *stream* with :data:`SAFE_DUMPER`.
+
+    Like :func:`safe_dump`, but without building the whole document as a
+    string first.
+    """
+    yaml.dump(data, stream, Dumper=SAFE_DUMPER, **kwargs)
+
 
 def check_file_size(path: Path) -> None:
     """[SEC V-001] Raise ValueError if file exceeds MAX_YAML_SIZE.
 
-    Called before every YAML load to prevent memory exhaustion from
-    excessively large files.
+    Guards against memory exhaustion from excessively large files.  The
+    loaders apply the same limit via ``fstat`` on the file they open.
+    Symlinks are followed, so the size checked is that of the target file.
     """
-    file_size = path.stat().st_size
+    _check_size(path=path, file_size=os.stat(path).st_size)
+
+
+def _check_size(path: Path, file_size: int) -> None:
+    """[SEC V-001] Raise ValueError if *file_size* exceeds MAX_YAML_SIZE."""
     if file_size > MAX_YAML_SIZE:
         raise ValueError(
             f"File {path} is {file_size} bytes, exceeding the maximum allowed size of {MAX_YAML_SIZE} bytes (100MB)"
         )
 
 
-def load_resource(path: Path) -> dict[str, Any]:
-    """Load a single YAML resource from a file.
+def _load_yaml_file(path: Path) -> Any:
+    """Open *path* once, check its size, and parse it with :func:`safe_load`.
 
-    [SEC V-001] Checks file size before reading.
-    [SEC V-006] Uses yaml.safe_load() exclusively -- never yaml.load().
+    [SEC V-001] The size comes from ``fstat`` on the open descriptor, so it
+    is the size of the file actually parsed.  The loader reads the file in
+    chunks; the whole content is never held as a separate string.
+    """
+    with open(path, "rb") as fhandle:
+        _check_size(path=path, file_size=os.fstat(fhandle.fileno()).st_size)
+        return safe_load(fhandle)
 
-    Handles files that begin with the YAML document separator '---'.
+
+def _load_mapping(path: Path) -> dict[str, Any] | None:
+    """Parse *path* and return its top-level mapping, or None if it is empty.
+
+    Raises ValueError if the document is anything other than a mapping.
     """
-    check_file_size(path=path)
-    content = path.read_text(encoding="utf-8")
-    resource = yaml.safe_load(content)
-    if resource is None:
-        return {}
-    if not isinstance(resource, dict):
+    resource = _load_yaml_file(path=path)
+    if resource is not None and not isinstance(resource, dict):
         raise ValueError(
             f"Expected a YAML mapping in {path}, got {type(resource).__name__}"
         )
     return resource
 
 
+def load_resource(path: Path) -> dict[str, Any]:
+    """Load a single YAML resource from a file.
+
+    [SEC V-001] Checks file size before reading.
+    [SEC V-006] Uses safe_load() exclusively -- never the unsafe full loader.
+
+    Handles files that begin with the YAML document separator '---'.
+    """
+    resource = _load_mapping(path=path)
+    return {} if resource is None else resource
+
+
 def load_resource_list(path: Path) -> list[dict[str, Any]]:
     """Load a YAML file and return a list of resources.
 
     [SEC V-001] Checks file size before reading.
-    [SEC V-006] Uses yaml.safe_load() exclusively.
+    [SEC V-006] Uses safe_load() exclusively.
 
     If the file contains a *List kind (e.g. PodList, DeploymentList),
     return the items from that list. Otherwise return the single resource
     wrapped in a list.
     """
-    check_file_size(path=path)
-    content = path.read_text(encoding="utf-8")
-    resource = yaml.safe_load(content)
+    resource = _load_mapping(path=path)
     if resource is None:
         return []
-    if not isinstance(resource, dict):
-        raise ValueError(
-            f"Expected a YAML mapping in {path}, got {type(resource).__name__}"
-        )
     kind = resource.get("kind", "")
     if isinstance(kind, str) and kind.endswith("List"):
         items = resource.get("items")
@@ -82,7 +147,7 @@ def extract_metadata(resource: dict[str, Any]) -> dict[str, Any]:
     kind, apiVersion. Missing fields default to empty string or empty dict
     (for labels).
     """
-    metadata = resource.get("metadata", {}) or {}
+    metadata = resource.get("metadata") or _NO_METADATA
     return {
         "name": metadata.get("name", ""),
         "namespace": metadata.get("namespace", ""),